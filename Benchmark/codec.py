@@ -0,0 +1,139 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+#
+# 용도 : 벤치마크 모듈
+# 설명 : 분석 결과 직렬화 방식별 크기/직렬화/복원 시간 측정
+#
+#   * json  : to_dict() + JSON + zlib, type() 임시 클래스 복원 (기존 encode_result() 방식)
+#   * codec : codec.encode() / codec.decode() (ScanObject 인스턴스 복원)
+#
+#   사용법 : python Benchmark/codec.py [--entries 1000] [--children 50] [--repeat 5]
+#            python Benchmark/codec.py --file <OLE 파일> [--repeat 5]
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입
+#
+
+__version__ = "0.0.1"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 서드파티 라이브러리
+
+# 고유 라이브러리
+from Engines import Log
+from Engines import codec
+from Engines import skeleton
+
+import config
+
+
+class DirectoryEntry:
+    """[summary]
+        OleDirectoryObject 와 같은 형식의 구조 정보
+    """
+    def __init__(self, index):
+        self.name = "Stream{}".format(index)
+        self.namelength = len(self.name) * 2 + 2
+        self.createTime = 0
+        self.modifyTime = 0
+        self.color = 1
+        self.entry_type = 2
+        self.sid = index
+        self.sid_left = 4294967295
+        self.sid_right = index + 1
+        self.sid_child = 4294967295
+        self.size = index * 512
+
+    def get(self):
+        return dict(self.__dict__)
+
+
+def json_encode(scanObject):
+    return zlib.compress(json.dumps(scanObject.to_dict()).encode("utf-8"))
+
+def json_decode(data):
+    return type("ScanObject", (object,), json.loads(zlib.decompress(data).decode("utf-8")))
+
+def make_scan_object(entries, children):
+    """[summary]
+        구조 정보 (entries 개) 와 임베딩 파일 정보 (children 개) 를 갖는 ScanObject 를 생성한다.
+    """
+    scanObject = skeleton.ScanObject(fileName="benchmark", data=os.urandom(4096))
+    scanObject.updatefformat(skeleton.FormatObject({"scan_module" : "ole", "file_type" : "ole", "name" : "OLE"}))
+    for index in range(entries):
+        entry = DirectoryEntry(index)
+        scanObject.updateStructure(entry.name, entry)
+
+    for index in range(children):
+        scanObject.updateChildren("benchmark_Stream{}.dmp".format(index), ["Stream{}".format(index)], data=os.urandom(256))
+
+    scanObject.updateScanModule("Engines.ole")
+    scanObject.updateResult(False, "")
+    scanObject.release_file_data()
+    return scanObject
+
+def load_scan_object(fileName):
+    """[summary]
+        OLE 분석 엔진으로 분석한 ScanObject 를 반환한다.
+    """
+    from Engines import ole
+
+    scanObject = skeleton.ScanObject(fileName=fileName)
+    scanObject.updatefformat(skeleton.FormatObject({"scan_module" : "ole", "file_type" : "ole", "name" : "OLE"}))
+
+    # 메모리 전달 크기를 초과한 임베딩 파일은 임시 폴더에 저장한다.
+    with tempfile.TemporaryDirectory() as work_path:
+        return skeleton.decode_result(ole.KeiEngine().__analyze__(skeleton.ScanResult(work_path=work_path), scanObject))
+
+def measure(func, arg, repeat):
+    elapsed = []
+    for i in range(repeat):
+        start_time = time.perf_counter()
+        result = func(arg)
+        elapsed.append(time.perf_counter() - start_time)
+    return min(elapsed), result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", dest="file", required=False, type=str, default="")
+    parser.add_argument("--entries", dest="entries", required=False, type=int, default=1000)
+    parser.add_argument("--children", dest="children", required=False, type=int, default=50)
+    parser.add_argument("--repeat", dest="repeat", required=False, type=int, default=5)
+    args = parser.parse_args()
+
+    # 분석 엔진의 로그 출력을 제외한다.
+    config.log_level = "error"
+    config.log_cmd = True
+    Log.init(log_level=config.log_level, log_cmd=config.log_cmd)
+
+    if args.file:
+        scanObject = load_scan_object(args.file)
+        print("file: {}".format(args.file))
+    else:
+        scanObject = make_scan_object(args.entries, args.children)
+        print("entries: {}, children: {}".format(args.entries, args.children))
+
+    print("repeat: {}".format(args.repeat))
+    print("{:<12} {:>10} {:>12} {:>12}".format("", "size", "encode", "decode"))
+    for name, encode, decode in [("json+zlib", json_encode, json_decode),
+                                 ("codec", lambda obj: codec.encode(obj, compress=False), codec.decode),
+                                 ("codec+zlib", lambda obj: codec.encode(obj, compress=True), codec.decode)]:
+        encode_time, data = measure(encode, scanObject, args.repeat)
+        decode_time, _ = measure(decode, data, args.repeat)
+        print("{:<12} {:>10} {:>10.1f}us {:>10.1f}us".format(name, len(data), encode_time * 1000000, decode_time * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+# 
+# 용도 : 벤치마크 모듈
+# 설명 : 분석 엔진 프로세스 <-> Dispatch 간 작업/결과 전달 방식별 객체당 오버헤드 측정
+#
+#   * spawn   : 객체마다 Process + Manager Queue 생성 (기존 EngineProcess 방식)
+#   * manager : 상주 프로세스 + Manager Queue 결과 전달
+#   * pipe    : 상주 프로세스 + Pipe 작업/결과 전달 (pool.EnginePool)
+#
+#   사용법 : python Benchmark/transport.py --folder <소형 OLE 파일 폴더> [--repeat 3]
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입
+#
+
+__version__ = "0.0.1"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리 
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 서드파티 라이브러리 
+
+# 고유 라이브러리 
+from Engines import Log
+from Engines import pool
+from Engines import skeleton
+from Engines import utils
+
+import config
+
+
+class KeiEngine(skeleton.EngineProcess):
+    """[summary]
+        전달 비용만 측정하기 위한 분석 엔진 (큐 모니터링, 분석 생략)
+    """
+    def __init__(self):
+        skeleton.EngineProcess.__init__(self, __version__, __author__, "Benchmark.transport")
+
+    def __analyze__(self, scanResult, scanObject):
+        scanObject.updateScanModule(self.__engine__)
+        scanObject.updateResult(False, "")
+        return skeleton.encode_result(scanObject)
+
+
+def _manager_worker(engine, task_queue, result_queue):
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        result_queue.put(engine.__analyze__(*task))
+
+def bench_spawn(scanObjects):
+    for scanObject in scanObjects:
+        task_queue = multiprocessing.JoinableQueue()
+        manager = multiprocessing.Manager()
+        result_queue = manager.Queue()
+        process = multiprocessing.Process(target=_manager_worker, args=(KeiEngine(), task_queue, result_queue))
+        process.start()
+        task_queue.put((skeleton.ScanResult(), scanObject))
+        task_queue.put(None)
+        skeleton.decode_result(result_queue.get())
+        process.join()
+        manager.shutdown()
+
+def bench_manager(scanObjects):
+    task_queue = multiprocessing.Queue()
+    manager = multiprocessing.Manager()
+    result_queue = manager.Queue()
+    process = multiprocessing.Process(target=_manager_worker, args=(KeiEngine(), task_queue, result_queue))
+    process.start()
+    for scanObject in scanObjects:
+        task_queue.put((skeleton.ScanResult(), scanObject))
+        skeleton.decode_result(result_queue.get())
+    task_queue.put(None)
+    process.join()
+    manager.shutdown()
+
+def bench_pipe(scanObjects):
+    engine_pool = pool.EnginePool(KeiEngine, pool_size=1, max_tasks=0)
+    for scanObject in scanObjects:
+        engine_pool.run(skeleton.ScanResult(), scanObject)
+    engine_pool.close()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--folder", dest="folder", required=True, type=str)
+    parser.add_argument("--limit", dest="limit", required=False, type=int, default=500)
+    parser.add_argument("--repeat", dest="repeat", required=False, type=int, default=3)
+    args = parser.parse_args()
+
+    # 분석 엔진 프로세스의 로그 출력을 제외한다. 
+    config.log_level = "error"
+    config.log_cmd = True
+    Log.init(log_level=config.log_level, log_cmd=config.log_cmd)
+
+    # 측정 대상 ScanObject 를 생성한다.
+    fileList = utils.get_file_path_in_folder(args.folder)[:args.limit]
+    scanObjects = []
+    for fileName in fileList:
+        scanObject = skeleton.ScanObject(fileName=fileName)
+        scanObject.release_file_data()
+        scanObject.updatefformat(skeleton.FormatObject({"scan_module" : "ole", "file_type" : "ole", "name" : "OLE"}))
+        scanObjects.append(scanObject)
+
+    if not scanObjects:
+        print("no files in {}".format(args.folder))
+        return
+
+    print("objects: {}, repeat: {}".format(len(scanObjects), args.repeat))
+    for name, func in [("spawn", bench_spawn), ("manager", bench_manager), ("pipe", bench_pipe)]:
+        elapsed = []
+        for i in range(args.repeat):
+            start_time = time.perf_counter()
+            func(scanObjects)
+            elapsed.append(time.perf_counter() - start_time)
+
+        best = min(elapsed)
+        print("{:<8} total {:>8.3f}s  per object {:>10.1f}us".format(name, best, best / len(scanObjects) * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,9 @@
 #
 # 개발 Log
 # 2018.08.15    버전 0.0.1      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.2      [수정] 전체 파일 대신 FileHeader 구조 크기만 읽음
 #
-__version__ = "0.0.1"
+__version__ = "0.0.2"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -139,7 +140,9 @@ class KeiEngine(skeleton.EngineObject):
         data = None
         try:
             # 분석 대상 파일의 데이터(바이너리)를 가져온다. 
-            data = scanObject.get_file_data()
+            # FileHeader 구조 크기 (256 Byte) 만 읽는다. 
+            size = max([dict_value.get("offset", 0) + dict_value.get("size", 0) for dict_value in self.__structure__.values()])
+            data = scanObject.read_file_data(0, size)
 
             # 포멧 구조에 맞춰 파일을 분석한다. 
             for key, dict_value in self.__structure__.items():
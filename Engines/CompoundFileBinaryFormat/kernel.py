@@ -7,8 +7,11 @@
 #
 # 개발 Log
 # 2018.08.14    버전 0.0.1      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.2      [수정] extract() : 저장 폴더 지정 (Job 단위 작업 폴더)
+# 2026.10.18    버전 0.0.3      [수정] extract() : 작은 Stream 은 파일 대신 메모리 데이터로 반환, 파일 객체 지원
+# 2026.10.18    버전 0.0.4      [개발] OleSession : OLE 파일 1회 열기 (Directory 조회, Stream 추출 공유), is_ole_header()
 #
-__version__ = "0.0.1"
+__version__ = "0.0.4"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -45,8 +48,23 @@ def get_ole_object(fileName):
     finally:
         pass
 
+def is_ole_header(data):
+    """[summary]
+        파일 시작 데이터 (8 Byte 이상) 로 OLE 파일인지 확인한다. (파일을 열지 않음)
+
+    Arguments:
+        data {bytes} -- [description] 파일 시작 데이터
+    """
+    return data[:len(olefile.MAGIC)] == olefile.MAGIC
+
 @gateway
 def is_ole(fileName):
+    """[summary]
+        OLE 파일인지 확인한다. 
+
+    Arguments:
+        fileName {str} -- [description] 파일 경로 또는 파일 객체
+    """
     try:
         return olefile.isOleFile(fileName)
 
@@ -81,48 +99,129 @@ def convert_entryname(entryName):
     finally:
         pass
 
-@gateway
-def extract(fileName):
-    try:
-        # OLE 파일 인스턴스를 생성한다. 
-        ole = get_ole_object(fileName)
-        if not ole:
+#########################################################################################################
+# OLE 세션
+# - 분석 1건 동안 OLE 파일을 1회 열어 (Header, FAT, MiniFAT, Directory 1회 파싱) Directory 조회, Stream 추출에 공유한다. 
+# - with 문 또는 close() 로 종료하며 전달받은 파일 객체도 함께 닫는다. 
+#########################################################################################################
+class OleSession:
+    def __init__(self, fileName, fp=None):
+        """[summary]
+            OLE 파일을 연다. 
+
+        Arguments:
+            fileName {str} -- [description] OLE 파일 경로 (fp 가 있는 경우 추출 파일명 생성에만 사용)
+
+        Keyword Arguments:
+            fp {instance} -- [description] OLE 파일 객체 (ScanObject.open_file()) (default: {None})
+        """
+        self.fileName = fileName
+        self.fp = fp
+        self.ole = get_ole_object(fp if fp else fileName)
+        if not self.ole:
+            self.close()
             raise OLEKernelError("Failed Get OLE Object.")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.ole:
+            self.ole.close()
+            self.ole = None
+
+        if self.fp:
+            self.fp.close()
+            self.fp = None
+
+    def get_directories(self):
+        """[summary]
+            Directory 목록을 반환한다. 
+        """
+        return self.ole.direntries
+
+    def extract(self, embedded_path=""):
+        """[summary]
+            OLE 파일의 Stream 을 추출한다. 
+
+            * config.embedded_in_memory 인 경우 config.embedded_spill_size 이하의 Stream 은 파일로 저장하지 않고 
+              메모리 데이터 ("data") 로 반환한다. 
+
+        Keyword Arguments:
+            embedded_path {str} -- [description] 저장 폴더, Job 단위 작업 폴더 (default: {""}, <temp_path>\\<embedding>)
+
+        Returns:
+            {list} -- [description] 추출된 Stream 목록, [{"fileName", "internal_path", "data"}, ...]
+        """
+        # 저장 폴더를 생성한다. 
+        if not embedded_path:
+            embedded_path = os.path.join(config.temp_path, config.dir_q_monitor.get("embedding"))
+        if not utils.makedirectory(embedded_path):
+            raise OLEKernelError("Failed make directory for embedding. ({})".format(embedded_path))
+
         units = []
-        for ori_stream in ole.listdir():
+        for ori_stream in self.ole.listdir():
             # ori_stream[0] : Storage
             # ori_stream[1:]: Stream
             new_stream = convert_entryname(ori_stream)
             
             # 저장할 파일 경로를 생성한다. 
-            # <temp_path>//<embedding>//<fileName>
-            embedded_path = os.path.join(config.temp_path, config.dir_q_monitor.get("embedding"))
-            basename = "{}_{}.{}".format(os.path.basename(fileName),
+            # <embedded_path>//<fileName>
+            basename = "{}_{}.{}".format(os.path.basename(self.fileName),
                                          config.extend_seperate.join(new_stream), 
                                          config.extend)
             embedded_name = os.path.join(embedded_path, basename)
             
-            # 파일을 저장한다. 
-            stream = ole.openstream(ori_stream)
+            stream = self.ole.openstream(ori_stream)
             bytes_data = stream.read()
 
+            unit = {
+                        "fileName"    : embedded_name,
+                        "internal_path" : new_stream
+                    }
+
+            # 크기가 작은 Stream 은 메모리 데이터로 전달한다. 
+            # (embedded_name 은 식별용 경로로만 사용됨)
+            if config.embedded_in_memory and len(bytes_data) <= config.embedded_spill_size:
+                unit["data"] = bytes_data
+                units.append(unit)
+                continue
+
+            # 파일을 저장한다. 
             # 파일 저장이 실패한 경우
-            if not utils.writefile_ex(embedded_name, bytes_data):
+            if not utils.writefile(embedded_name, bytes_data):
                 Log.error("Failed write file for embedding. ({})".format(basename))
                 continue
 
             Log.debug(embedded_name)
 
             # 파일이 저장된 경우
-            unit = {
-                        "fileName"    : embedded_name,
-                        "internal_path" : new_stream
-                    }
             units.append(unit)
 
         return units
 
+@gateway
+def extract(fileName, embedded_path="", fp=None):
+    """[summary]
+        OLE 파일의 Stream 을 추출한다. (OleSession.extract())
+
+    Arguments:
+        fileName {str} -- [description] OLE 파일 경로 (fp 가 있는 경우 추출 파일명 생성에만 사용)
+
+    Keyword Arguments:
+        embedded_path {str} -- [description] 저장 폴더, Job 단위 작업 폴더 (default: {""}, <temp_path>\\<embedding>)
+        fp {instance} -- [description] OLE 파일 객체 (default: {None})
+
+    Returns:
+        {list} -- [description] 추출된 Stream 목록, [{"fileName", "internal_path", "data"}, ...]
+    """
+    try:
+        with OleSession(fileName, fp) as session:
+            return session.extract(embedded_path)
+
     except OLEKernelError as e:
         Log.error(e.msg)
         return []
@@ -138,15 +237,17 @@ def extract(fileName):
 
 @gateway
 def get_directories(fileName):
-    ole = None
+    """[summary]
+        OLE 파일의 Directory 목록을 반환한다. (OleSession.get_directories())
+
+    Arguments:
+        fileName {str} -- [description] OLE 파일 경로 또는 파일 객체
+    """
     try:
-        ole = get_ole_object(fileName)
-        if ole:
-            return ole.direntries
-        else:
-            raise KeiEngineError("Failed get ole object.")
+        with OleSession(fileName) as session:
+            return session.get_directories()
 
-    except KeiEngineError as e:
+    except OLEKernelError as e:
         Log.error(e.msg)
         return []
 
@@ -157,8 +258,7 @@ def get_directories(fileName):
         return []
 
     finally:
-        if ole:
-            ole.close()
+        pass
 
 @gateway
 def unzip(data):
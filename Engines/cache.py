@@ -0,0 +1,369 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+#
+# 용도 : 분석 결과 캐시 모듈
+# 설명 : 파일 SHA256 기반으로 분석 결과를 저장하고 동일 파일 분석시 재사용하는 모듈 (SQLite)
+#
+#   * 캐시 키 : SHA256(파일 SHA256 + 분석 정책)
+#       - 분석 정책 : 캐시 버전, 포멧 Yara 룰셋 해시, Root 파일 포멧 (임베딩 파일의 포멧 상속), 필터 설정
+#   * 저장된 분석 엔진 버전과 현재 분석 엔진 버전이 다른 경우 사용하지 않는다.
+#   * 임베딩 파일이 없고 에러가 없는 분석 결과만 저장한다.
+#       (임베딩 파일은 분석 후 삭제되므로 Recursive 분석을 재현할 수 없음)
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입
+# 2026.10.18    버전 0.0.2      [수정] 임베딩 파일 병렬 Dispatch 를 위해 SQLite 연결/통계 접근 동기화
+# 2026.10.18    버전 0.0.3      [수정] 저장 형식 : JSON + zlib -> skeleton.encode_result() (codec, 압축)
+#
+
+__version__ = "0.0.3"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+# 서드파티 라이브러리
+
+# 고유 라이브러리
+from Engines import Log, gateway
+from Engines import skeleton
+from Engines import utils
+
+import config
+
+
+#########################################################################################################
+# 전역 변수
+# - CACHE_VERSION 은 저장 형식 (skeleton.encode_result()) 이 변경되면 증가시킨다.
+# - __rebind_keys__ 는 캐시된 분석 결과에 현재 분석 대상의 값으로 교체할 항목 (식별/경로 정보)
+#########################################################################################################
+CACHE_VERSION = 2
+
+__rebind_keys__ = ["uniqID", "depth", "parentID", "parentName", "internal_path", "__name__", "__ori_name__"]
+
+__cache__ = None
+__cache_lock__ = threading.Lock()
+
+
+class ResultCacheError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+
+#########################################################################################################
+# 분석 결과 캐시
+# - 프로세스 단위로 SQLite 연결을 유지한다. (WAL 모드, 여러 Consumer 프로세스가 공유)
+# - 프로세스 내 Dispatch 스레드 (config.dispatch_threads) 는 연결을 공유하고 lock 으로 순차 접근한다.
+#########################################################################################################
+class ResultCache:
+    def __init__(self, cache_path=config.result_cache_path,
+                       ttl=config.result_cache_ttl,
+                       max_entries=config.result_cache_max_entries):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.pid = os.getpid()
+        self.stats = {"hit" : 0, "miss" : 0, "stale" : 0, "store" : 0, "evict" : 0}
+        self.stores = 0
+        self.lock = threading.RLock()
+
+        # 캐시 폴더가 없는 경우 생성한다.
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        self.conn = sqlite3.connect(cache_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS results (
+                                key         TEXT PRIMARY KEY,
+                                sha256      TEXT NOT NULL,
+                                engines     TEXT NOT NULL,
+                                data        BLOB NOT NULL,
+                                created     REAL NOT NULL,
+                                accessed    REAL NOT NULL
+                             )""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed)")
+        self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+    def count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def __expired__(self, created, now):
+        return self.ttl and created + self.ttl < now
+
+    def get(self, key):
+        """[summary]
+            캐시된 분석 결과를 반환한다.
+
+        Arguments:
+            key {str} -- [description] 캐시 키
+
+        Returns:
+            {tuple} -- [description] (분석 엔진 버전 목록, 직렬화된 분석 결과), 없는 경우 None
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT engines, data, created FROM results WHERE key = ?", (key,)).fetchone()
+            if not row:
+                return None
+
+            now = time.time()
+            if self.__expired__(row[2], now):
+                # 만료된 경우 삭제한다.
+                self.delete(key)
+                return None
+
+            self.conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            return json.loads(row[0]), row[1]
+
+    def put(self, key, sha256, engines, data):
+        """[summary]
+            분석 결과를 저장한다.
+
+        Arguments:
+            key {str} -- [description] 캐시 키
+            sha256 {str} -- [description] 파일 SHA256
+            engines {dict} -- [description] 분석 엔진 버전 목록, {모듈명 : 버전}
+            data {bytes} -- [description] 직렬화된 분석 결과
+        """
+        with self.lock:
+            now = time.time()
+            self.conn.execute("INSERT OR REPLACE INTO results (key, sha256, engines, data, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                              (key, sha256, json.dumps(engines), sqlite3.Binary(data), now, now))
+            self.conn.commit()
+
+            # 저장 횟수가 일정 수준이 되면 만료/초과 항목을 정리한다.
+            self.stores += 1
+            if self.stores % config.result_cache_evict_interval == 0:
+                self.evict()
+
+    def delete(self, key):
+        with self.lock:
+            self.conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.conn.commit()
+
+    def evict(self):
+        """[summary]
+            만료된 항목과 최대 항목 수를 초과한 항목 (최근 사용 시간 순) 을 삭제한다.
+
+        Returns:
+            {int} -- [description] 삭제된 항목 수
+        """
+        with self.lock:
+            count = 0
+            if self.ttl:
+                count += self.conn.execute("DELETE FROM results WHERE created < ?", (time.time() - self.ttl,)).rowcount
+
+            if self.max_entries:
+                total = self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                if total > self.max_entries:
+                    count += self.conn.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)",
+                                               (total - self.max_entries,)).rowcount
+
+            self.conn.commit()
+            self.stats["evict"] += count
+            return count
+
+
+def _get_cache():
+    """[summary]
+        프로세스 단위 ResultCache 인스턴스를 반환한다.
+
+        fork 로 상속된 연결은 사용하지 않고 프로세스별로 새로 연결한다.
+    """
+    global __cache__
+    with __cache_lock__:
+        if __cache__ is None or __cache__.pid != os.getpid():
+            __cache__ = ResultCache()
+        return __cache__
+
+def _engine_versions(scan_module):
+    """[summary]
+        분석 엔진 모듈의 현재 버전 목록을 반환한다.
+
+    Arguments:
+        scan_module {list} -- [description] 분석 엔진 모듈명 목록 (ScanObject.scan_module)
+
+    Returns:
+        {dict} -- [description] {모듈명 : 버전}
+    """
+    versions = {}
+    for mod_name in scan_module:
+        mod = sys.modules.get(mod_name) or importlib.import_module(mod_name)
+        versions[mod_name] = getattr(mod, "__version__", "")
+    return versions
+
+def _get_key(scanResult, sha256):
+    """[summary]
+        캐시 키를 생성한다.
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        sha256 {str} -- [description] 파일 SHA256
+
+    Returns:
+        {str} -- [description] 캐시 키 (SHA256)
+    """
+    # Root 파일 포멧을 상속받는 임베딩 파일은 Root 파일 포멧에 따라 결과가 달라진다.
+    root_name = getattr(scanResult.get_root_type(), "name", "") if scanResult.get_rootUID() else ""
+
+    policy = [
+        CACHE_VERSION,
+        utils.yara_rules_digest(config.format_rules),
+        root_name,
+        config.inherit_root,
+        config.filter_size_min,
+        config.filter_size_max,
+        sorted(config.filter_format)
+    ]
+    data = "{}:{}".format(sha256, json.dumps(policy))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest().upper()
+
+@gateway
+def lookup(scanResult, scanObject):
+    """[summary]
+        캐시된 분석 결과를 반환한다.
+
+        반환된 분석 결과의 식별/경로 정보 (__rebind_keys__) 는 scanObject 의 값으로 교체된다.
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        scanObject {instance} -- [description] ScanObject 인스턴스
+
+    Returns:
+        {instance} -- [description] 분석 결과 (skeleton.decode_result()), 없는 경우 None
+    """
+    if not config.result_cache:
+        return None
+
+    try:
+        result_cache = _get_cache()
+        key = _get_key(scanResult, scanObject.get_file_sha256())
+
+        cached = result_cache.get(key)
+        if cached is None:
+            result_cache.count("miss")
+            return None
+
+        # 분석 엔진이 변경된 경우 사용하지 않는다.
+        engines, data = cached
+        if engines != _engine_versions(list(engines.keys())):
+            result_cache.delete(key)
+            result_cache.count("stale")
+            result_cache.count("miss")
+            return None
+
+        result = skeleton.decode_result(bytes(data))
+        for name in __rebind_keys__:
+            setattr(result, name, getattr(scanObject, name))
+
+        result_cache.count("hit")
+        Log.debug("result cache hit. ({})".format(scanObject.get_file_sha256()))
+        return result
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return None
+
+    finally:
+        pass
+
+@gateway
+def store(scanResult, scanObject):
+    """[summary]
+        분석 결과를 저장한다.
+
+        임베딩 파일이 있거나 에러가 발생한 분석 결과는 저장하지 않는다.
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        scanObject {instance} -- [description] 분석 결과 (ScanObject 인스턴스)
+
+    Returns:
+        {bool} -- [description] 저장 여부
+    """
+    if not config.result_cache:
+        return False
+
+    try:
+        if not isinstance(scanObject, skeleton.ScanObject):
+            raise ResultCacheError("result is not ScanObject. (type: {})".format(str(type(scanObject))))
+
+        if scanObject.get_children() or scanObject.get_result().error:
+            return False
+
+        # 해시를 계산하지 않은 경우 계산한다. 
+        sha256 = scanObject.get_file_sha256()
+        if not sha256:
+            raise ResultCacheError("sha256 is not exists in result.")
+
+        result_cache = _get_cache()
+        key = _get_key(scanResult, sha256)
+        engines = _engine_versions(scanObject.get_scan_module())
+        data = skeleton.encode_result(scanObject, compress=True)
+        result_cache.put(key, sha256, engines, data)
+        result_cache.count("store")
+        return True
+
+    except ResultCacheError as e:
+        Log.error(e.msg)
+        return False
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return False
+
+    finally:
+        pass
+
+def get_cache_stats():
+    """[summary]
+        프로세스 단위 분석 결과 캐시 통계를 반환한다.
+
+        * hit_rate : hit / (hit + miss)
+
+    Returns:
+        {dict} -- [description] {"hit", "miss", "stale", "store", "evict", "hit_rate"}
+    """
+    if __cache__ is None:
+        return {}
+
+    stats = dict(__cache__.stats)
+    total = stats["hit"] + stats["miss"]
+    stats["hit_rate"] = float(stats["hit"]) / total if total else 0.0
+    return stats
+
+@gateway
+def close():
+    """[summary]
+        분석 결과 캐시 통계를 기록하고 연결을 종료한다.
+    """
+    global __cache__
+    if __cache__ is None:
+        return
+
+    stats = get_cache_stats()
+    Log.info("result cache stats. (hit: {hit}, miss: {miss}, stale: {stale}, store: {store}, evict: {evict}, hit_rate: {hit_rate:.2%})".format(**stats))
+
+    __cache__.close()
+    __cache__ = None
@@ -0,0 +1,269 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+#
+# 용도 : 분석 결과 직렬화 모듈
+# 설명 : 분석 엔진 프로세스 -> Dispatch 간 분석 결과 (ScanObject) 를 바이너리로 직렬화/복원하는 모듈
+#
+#   * 형식 : 헤더 (6 Byte) + marshal 데이터 (압축 Flag 가 설정된 경우 zlib 압축)
+#       - 헤더 : "KEI" + CODEC_VERSION + marshal.version + Flag
+#   * ScanObject / FormatObject / ResultObject 는 속성명 없이 정해진 순서 (__*_fields__) 의 tuple 로 저장한다.
+#       - 정의되지 않은 속성은 {속성명 : 값} 으로 함께 저장한다.
+#   * FormatObject.struct 내 같은 키 목록을 갖는 dict 목록 (OLE Directory 등) 은 키 목록을 1회만 저장한다. (TABLE)
+#   * 복원시 type() 으로 생성한 임시 클래스가 아닌 ScanObject / FormatObject / ResultObject 인스턴스를 생성한다.
+#
+#   ※ tuple 은 TABLE 표시에만 사용되며 분석 결과 내 tuple 은 list 로 저장된다. (JSON 과 동일)
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입 (JSON + zlib 대체)
+# 2026.10.18    버전 0.0.2      [수정] _plain() : Mapping (pyelftools Container 등) 은 get() 대신 dict 로 변환
+#
+
+__version__ = "0.0.2"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리
+import marshal
+import zlib
+from collections.abc import Mapping
+
+# 서드파티 라이브러리
+
+# 고유 라이브러리
+from Engines import skeleton
+
+import config
+
+
+#########################################################################################################
+# 전역 변수
+# - CODEC_VERSION 은 저장 형식이 변경되면 증가시킨다. (cache.CACHE_VERSION 도 함께 증가)
+# - TABLE_MIN_ROWS 는 TABLE 로 저장할 최소 항목 수
+#########################################################################################################
+CODEC_VERSION = 1
+TABLE_MIN_ROWS = 4
+
+__magic__ = b"KEI"
+__flag_compress__ = 0x01
+__table__ = "T"
+
+__file_fields__ = ["__ori_name__", "__name__", "__size__", "__digests__", "__sha256__"]
+__scan_fields__ = ["uniqID", "depth", "parentID", "parentName", "internal_path", "scan_module", "children"]
+__format_fields__ = ["author", "last_updated", "description", "product", "scan_module", "file_type", "name"]
+__result_fields__ = ["error", "err_msg"]
+
+# 직렬화하지 않는 속성 (메모리 데이터, 파일 핸들, 메모리 매핑, 우선순위 인덱스)
+__transient_fields__ = {"__data__", "__fp__", "__view__", "__children_index__"}
+__scan_known__ = set(__file_fields__ + __scan_fields__ + ["fformat", "result"]) | __transient_fields__
+__format_known__ = set(__format_fields__ + ["struct"])
+__result_known__ = set(__result_fields__)
+
+
+class CodecError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+
+#########################################################################################################
+# 값 변환
+#########################################################################################################
+def _plain(value):
+    """[summary]
+        marshal 로 저장할 수 있는 값으로 변환한다.
+
+        * Mapping (pyelftools Container 등) 은 dict 로 변환한다. (get() 이 dict.get() 인 경우)
+        * get() / to_dict() 가 있는 인스턴스 (OleDirectoryObject 등) 는 반환값으로 변환한다.
+        * 함수/메소드 (구조 정의 내 파싱 함수 등) 는 이름으로 변환한다.
+        * tuple 은 list 로 변환한다.
+        * 같은 키 목록을 갖는 dict 목록은 TABLE 로 변환한다.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+
+    if isinstance(value, dict):
+        result = {key : _plain(item) for key, item in value.items()}
+        return _to_table(result)
+
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+
+    if isinstance(value, Mapping):
+        return _plain(dict(value))
+
+    if hasattr(value, "get"):
+        return _plain(value.get())
+
+    if hasattr(value, "to_dict"):
+        return _plain(value.to_dict())
+
+    if callable(value):
+        return getattr(value, "__qualname__", str(value))
+
+    raise CodecError("unsupported type. (type: {})".format(str(type(value))))
+
+def _to_table(dict_data):
+    """[summary]
+        값이 모두 같은 키 목록을 갖는 dict 인 경우 TABLE 로 변환한다.
+
+        * TABLE : ("T", [키], (항목 키, ...), [(값, ...), ...], 하위 dict/list 포함 여부)
+    """
+    if len(dict_data) < TABLE_MIN_ROWS:
+        return dict_data
+
+    columns = None
+    for item in dict_data.values():
+        if not isinstance(item, dict):
+            return dict_data
+
+        if columns is None:
+            columns = tuple(item)
+        elif len(item) != len(columns) or tuple(item) != columns:
+            return dict_data
+
+    rows = [tuple(item.values()) for item in dict_data.values()]
+    nested = any(isinstance(value, (dict, list, tuple)) for row in rows for value in row)
+    return (__table__, list(dict_data), columns, rows, nested)
+
+def _restore(value):
+    """[summary]
+        _plain() 으로 변환된 값을 복원한다. (TABLE -> dict)
+    """
+    if isinstance(value, tuple):
+        _, keys, columns, rows, nested = value
+        if not nested:
+            return {key : dict(zip(columns, row)) for key, row in zip(keys, rows)}
+        return {key : _restore(dict(zip(columns, row))) for key, row in zip(keys, rows)}
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list, tuple)):
+                value[key] = _restore(item)
+        return value
+
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list, tuple)):
+                value[index] = _restore(item)
+        return value
+
+    return value
+
+
+#########################################################################################################
+# 객체 변환
+#########################################################################################################
+def _extra(instance, known):
+    return {key : _plain(value) for key, value in vars(instance).items() if key not in known}
+
+def _pack_result(resultObject):
+    if resultObject is None:
+        return None
+    return (tuple(getattr(resultObject, name, None) for name in __result_fields__), _extra(resultObject, __result_known__))
+
+def _unpack_result(packed):
+    if packed is None:
+        return None
+
+    fields, extra = packed
+    resultObject = skeleton.ResultObject.__new__(skeleton.ResultObject)
+    resultObject.__dict__.update(zip(__result_fields__, fields))
+    resultObject.__dict__.update(extra)
+    return resultObject
+
+def _pack_format(formatObject):
+    if formatObject is None:
+        return None
+    return (tuple(getattr(formatObject, name, "") for name in __format_fields__),
+            _plain(getattr(formatObject, "struct", {})),
+            _extra(formatObject, __format_known__))
+
+def _unpack_format(packed):
+    if packed is None:
+        return None
+
+    fields, struct, extra = packed
+    formatObject = skeleton.FormatObject.__new__(skeleton.FormatObject)
+    formatObject.__dict__.update(zip(__format_fields__, fields))
+    formatObject.struct = _restore(struct)
+    formatObject.__dict__.update(extra)
+    return formatObject
+
+def _pack_scan(scanObject):
+    return (tuple(getattr(scanObject, name, None) for name in __file_fields__),
+            tuple(_plain(getattr(scanObject, name, None)) for name in __scan_fields__),
+            _pack_format(scanObject.fformat),
+            _pack_result(scanObject.result),
+            _extra(scanObject, __scan_known__))
+
+def _unpack_scan(packed):
+    file_fields, scan_fields, fformat, result, extra = packed
+
+    # FileObject.__init__() 은 파일을 확인하므로 호출하지 않는다.
+    scanObject = skeleton.ScanObject.__new__(skeleton.ScanObject)
+    scanObject.__dict__.update(zip(__file_fields__, file_fields))
+    scanObject.__dict__.update(zip(__scan_fields__, [_restore(value) for value in scan_fields]))
+    scanObject.__data__ = None
+    scanObject.__fp__ = None
+    scanObject.__view__ = None
+    scanObject.fformat = _unpack_format(fformat)
+    scanObject.result = _unpack_result(result)
+    scanObject.__dict__.update(extra)
+    return scanObject
+
+
+#########################################################################################################
+# 직렬화/복원
+#########################################################################################################
+def encode(scanObject, compress=None):
+    """[summary]
+        ScanObject 를 직렬화한다.
+
+        해시를 계산하지 않은 경우 계산한 후 저장한다.
+
+    Arguments:
+        scanObject {instance} -- [description] ScanObject 인스턴스
+
+    Keyword Arguments:
+        compress {bool} -- [description] zlib 압축 여부, None 인 경우 config.result_compress_size 이상이면 압축 (default: {None})
+
+    Returns:
+        {bytes} -- [description] 직렬화된 분석 결과
+    """
+    scanObject.get_file_digests()
+
+    data = marshal.dumps(_pack_scan(scanObject))
+    if compress is None:
+        compress = bool(config.result_compress_size) and len(data) >= config.result_compress_size
+
+    flag = 0
+    if compress:
+        data = zlib.compress(data, 1)
+        flag |= __flag_compress__
+
+    return __magic__ + bytes([CODEC_VERSION, marshal.version, flag]) + data
+
+def decode(data):
+    """[summary]
+        encode() 로 직렬화된 분석 결과를 ScanObject 로 복원한다.
+
+    Arguments:
+        data {bytes} -- [description] 직렬화된 분석 결과
+
+    Returns:
+        {instance} -- [description] ScanObject 인스턴스
+    """
+    if bytes(data[:3]) != __magic__:
+        raise CodecError("invalid result header.")
+
+    version, marshal_version, flag = data[3], data[4], data[5]
+    if version != CODEC_VERSION or marshal_version != marshal.version:
+        raise CodecError("unsupported result version. (codec: {}, marshal: {})".format(version, marshal_version))
+
+    body = data[6:]
+    if flag & __flag_compress__:
+        body = zlib.decompress(body)
+
+    return _unpack_scan(marshal.loads(body))
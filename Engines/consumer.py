@@ -8,20 +8,31 @@
 # 개발 Log
 # 2018.08.06    버전 0.0.5      [개발] 프로토타입 변경
 # 2018.08.10    버전 0.0.6      [추가] 분석 완료된 파일 삭제
+# 2026.10.18    버전 0.0.7      [추가] 종료시 분석 엔진 상주 프로세스 (EnginePool) 정리
+# 2026.10.18    버전 0.0.8      [추가] 종료시 분석 결과 캐시 통계 기록
+# 2026.10.18    버전 0.0.9      [수정] run() : Polling (get_nowait() + sleep) -> Blocking get() + 종료 요청 (None)
+# 2026.10.18    버전 0.0.10     [수정] run() : Job 단위 작업 폴더 생성/정리
+# 2026.10.18    버전 0.0.11     [추가] 종료시 처리 시간 지표 기록
+# 2026.10.18    버전 0.0.12     [추가] run() : Job 분석 결과 출력 (sink.write())
 #
-__version__ = "0.0.6"
+__version__ = "0.0.12"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
 from datetime import datetime
+from queue import Empty
 
 import sys
 
 # 서드파티 라이브러리 
 
 # 고유 라이브러리 
+from Engines import cache
 from Engines import dispatch
 from Engines import Log, gateway
+from Engines import metrics
+from Engines import pool
+from Engines import sink
 from Engines import skeleton
 from Engines import utils
 
@@ -35,6 +46,8 @@ class ConsumerError(Exception):
 
 class Consumer(skeleton.Work):
     def __init__(self, proc_num=config.proc_num):
+        # 프로세스 생성 전에 결과 큐를 설정한다. 
+        self.result_queue = sink.get_queue()
         skeleton.Work.__init__(self, proc_num=proc_num)
     
     @gateway
@@ -42,22 +55,34 @@ class Consumer(skeleton.Work):
         """[summary]
             Job 단위 분석을 수행하고 완료된 Job은 삭제된다. 
 
+            Job 이 전달될 때까지 대기하고 종료 요청 (None) 을 받으면 종료한다. 
+
         Arguments:
             queue {instance} -- [description] 분석 Queue 인스턴스
             stop_flag {int} -- [description] 분석 종료 여부 (0 : 분석, 1 : 종료)
-            queue_wait {int} -- [description] 분석 Queue가 비었을 때 재탐색까지 대기 시간
+            queue_wait {int} -- [description] Job 대기 시간, 대기 중 종료 요청 없이 stop_flag 가 설정된 경우 종료
         """
-        while stop_flag.value is 0 or not queue.empty():
+        # 분석 결과를 전달할 결과 큐를 설정한다. 
+        sink.init(self.result_queue)
+
+        while True:
+            scanResult = None
             try:
                 # job을 가져온다. 
                 try:
-                    job = queue.get_nowait()
-                except multiprocessing.Queue.Empty:
-                    time.sleep(queue_wait)
+                    job = queue.get(timeout=queue_wait)
+                except Empty:
+                    if stop_flag.value and queue.empty():
+                        break
                     continue
 
+                # 종료 요청인 경우 
+                if job is None:
+                    break
+
                 # 결과 구조체를 생성한다. 
-                scanResult = skeleton.ScanResult()
+                # Job 단위 작업 폴더를 함께 생성한다. 
+                scanResult = skeleton.ScanResult(work_path=self.__make_work_path__())
                 # 분석 함수 호출 전 시작 시간을 설정한다. 
                 scanResult.updateStartTime(datetime.now())
 
@@ -67,6 +92,9 @@ class Consumer(skeleton.Work):
                 # 분석 결과 반환 전 완료 시간을 설정한다. 
                 scanResult.updateEndTime(datetime.now())
 
+                # 분석 결과를 출력한다. (결과 저장 프로세스)
+                sink.write(scanResult, job[0])
+
                 # View 테스트 
                 # resultView(scanResult.__dict__)
 
@@ -79,8 +107,17 @@ class Consumer(skeleton.Work):
                 Log.error(msg)
 
             finally:
-                # 임시 폴더를 정리한다. 
-                self.__clear__()
+                # Job 단위 작업 폴더를 정리한다. 
+                self.__clear__(scanResult)
+
+        # 분석 엔진 상주 프로세스를 종료한다. 
+        pool.close_all()
+
+        # 분석 결과 캐시를 종료한다. 
+        cache.close()
+
+        # 처리 시간 지표를 기록한다. (jobs.start() 에서 병합)
+        metrics.dump()
 
 
 
@@ -9,20 +9,34 @@
 # 2018.08.06    버전 0.0.5      [개발] 프로토타입 변경
 # 2018.08.14    버전 0.0.6      [개발] 분석 큐 모니터링 로직 추가 
 # 2018.08.15    버전 0.0.7      [수정] _get_fformat() : Root 파일 내 임베딩 파일의 fformat 결과 반환값 변경
+# 2026.10.18    버전 0.0.8      [수정] _get_fformat() : 파일 경로 대신 ScanObject 에 캐시된 데이터를 검사
+# 2026.10.18    버전 0.0.9      [수정] _run_module() : 분석 엔진 프로세스 생성 대신 EnginePool 재사용
+# 2026.10.18    버전 0.0.10     [추가] Dispatch() : SHA256 기반 분석 결과 캐시 (cache.lookup(), cache.store())
+# 2026.10.18    버전 0.0.11     [추가] 메모리 데이터 임베딩 파일 분석 (파일 저장/읽기 생략)
+# 2026.10.18    버전 0.0.12     [추가] _recursive() : 동일 우선순위 임베딩 파일 병렬 Dispatch
+# 2026.10.18    버전 0.0.13     [수정] _recursive() : 우선순위 레벨별 전체 순회 -> 우선순위 인덱스 순회
+# 2026.10.18    버전 0.0.14     [추가] Dispatch() : Recursive 처리 완료된 임베딩 파일 분석 결과 점진 출력 (_release_children())
+# 2026.10.18    버전 0.0.15     [수정] _rule_mismatch() : Root 파일 포멧 상속 deepcopy -> FormatObject.inherit()
+# 2026.10.18    버전 0.0.16     [수정] _recursive() : 임베딩 파일 메모리 데이터를 ScanObject.children 에서 분리 (분석 엔진 전달 제외)
 #
 
-__version__ = "0.0.7"
+__version__ = "0.0.16"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 서드파티 라이브러리 
 
 # 고유 라이브러리 
 from Engines import Log, gateway
+from Engines import cache
 from Engines import monitoring
+from Engines import pool
+from Engines import sink
 from Engines import skeleton
 from Engines import utils
 from Engines.filter import __is_filtered__
@@ -49,8 +63,30 @@ class DispatchModuleError(Exception):
         self.msg = msg
 
 
+#########################################################################################################
+# 임베딩 파일 병렬 Dispatch
+# - 프로세스 단위로 config.dispatch_threads 개의 스레드를 유지한다. 
+# - 병렬 Dispatch 스레드 내 Recursive 처리 (하위 임베딩 파일) 는 순차 처리한다. (스레드 고갈 방지)
+#########################################################################################################
+__executor__ = None
+__executor_pid__ = None
+__executor_lock__ = threading.Lock()
+__local__ = threading.local()
+
+def _get_executor():
+    """[summary]
+        프로세스 단위 ThreadPoolExecutor 인스턴스를 반환한다. 
+    """
+    global __executor__, __executor_pid__
+    with __executor_lock__:
+        if __executor__ is None or __executor_pid__ != os.getpid():
+            __executor__ = ThreadPoolExecutor(max_workers=config.dispatch_threads, thread_name_prefix="dispatch")
+            __executor_pid__ = os.getpid()
+        return __executor__
+
+
 @gateway
-def _get_metadata(job, uniqID="", depth=0, parentID="", parentName="", internal_path=[]):
+def _get_metadata(job, uniqID="", depth=0, parentID="", parentName="", internal_path=[], data=None):
     """[summary]
         ScanObject 인스턴스를 생성한다. 
         
@@ -63,6 +99,7 @@ def _get_metadata(job, uniqID="", depth=0, parentID="", parentName="", internal_
         parentID {str} -- [description] 분석 대상 파일의 Parent 고유값 (default: {""})
         parentName {str} -- [description] 분석 대상 파일명 (default: {""})
         internal_path {list} -- [description] 내부 경로 (default: {[]})
+        data {bytes} -- [description] 메모리 데이터 (임베딩 파일), 있는 경우 파일을 읽지 않음 (default: {None})
     
     Returns:
         {instance} -- [description] ScanObject 인스턴스 
@@ -73,7 +110,8 @@ def _get_metadata(job, uniqID="", depth=0, parentID="", parentName="", internal_
                                    depth=depth, 
                                    parentID=parentID, 
                                    parentName=parentName,
-                                   internal_path=internal_path)
+                                   internal_path=internal_path,
+                                   data=data)
 
     except:
         _, msg, obj = sys.exc_info()
@@ -126,11 +164,9 @@ def _rule_mismatch(scanResult, job, matchRules):
                 # return root_type
                 
                 # 상속시 Root의 struct는 상속받지 않는 경우 
-                # deepcopy를 통해 새로운 인스턴스를 생성하고 그중 struct 데이터를 초기화함
+                # struct 를 제외한 포멧 정보만 공유하는 새로운 인스턴스를 생성함 (Root의 struct 는 복사하지 않음)
                 # Embedded 경우 다른 Embedded 분석 정보를 참조하기 위해 ScanResult 에 접근해서 얻을 수 있음
-                copy_root_type = utils.deepcopy(root_type)
-                copy_root_type.update("struct", {})
-                return copy_root_type
+                return root_type.inherit()
                 
             else:
                 # Root 파일 타입이 없는 최초 데이터의 경우 
@@ -177,7 +213,7 @@ def _rule_overmatch(scanResult, job, matchRules):
         pass
 
 @gateway
-def _get_fformat(scanResult, job):
+def _get_fformat(scanResult, job, data=None):
     """[summary]
         Yara 룰을 바탕으로 파일 포멧 정보를 반환한다. 
 
@@ -186,13 +222,14 @@ def _get_fformat(scanResult, job):
     Arguments:
         scanResult {instance} -- [description] ScanResult 인스턴스
         job {str} -- [description] 분석 대상 
+        data {bytes} -- [description] 분석 대상 데이터, 있는 경우 파일을 다시 읽지 않음 (default: {None})
 
     Returns:
         {instance} -- [description] FormatObject 클래스 인스턴스
     """
     try:
         # Yara Rule 기반 파일 포멧을 탐지한다. 
-        matchRules = utils.yara_on_demand(config.format_rules, job)
+        matchRules = utils.yara_on_demand(config.format_rules, job, data)
 
         # 탐지된 파일 포멧이 없는 경우
         if len(matchRules) == 0:
@@ -273,7 +310,6 @@ def _run_module(scanResult, scanObject):
                                     (ScanObject 대상을 분석할 때 사전 분석 대상의 정보를 참조해야 하는 경우를 위함)
         scanObject {instance} -- [description] ScanObject 클래스 인스턴스 
     """
-    process = None
     try:
         # 엔진을 로드한 후 분석 클래스명을 가져온다. 
         fformat = scanObject.get_fformat()
@@ -281,19 +317,13 @@ def _run_module(scanResult, scanObject):
         if not clsName:
             raise DispatchError("this file is not target or failed to load module.")
 
-        # 분석 프로세스를 생성한다. 
-        process = clsName()
-        # 분석 프로세스를 실행한다. 
-        process.start()
-        # 분석 대상을 분석 큐에 넣는다. 
-        process.put_task((scanResult, scanObject))
-        # 분석이 완료될 때까지 기다린다. 
-        process.join()
-        # 분석이 완료되면 분석 결과를 반환한다. 
+        # 분석 엔진의 상주 프로세스 (EnginePool) 를 가져온다. 
+        engine_pool = pool.get_pool(clsName)
 
-        return True, process.get_result()
+        # 분석이 완료되면 분석 결과를 반환한다. 
+        return True, engine_pool.run(scanResult, scanObject)
          
-    except DispatchError as e:
+    except (DispatchError, pool.EnginePoolError) as e:
         # 모듈 에러
         # 에러로그를 남긴다. 
         Log.error(e.msg)
@@ -308,46 +338,129 @@ def _run_module(scanResult, scanObject):
         return False, scanObject
 
     finally:
-        if process:
-            process.close()
+        pass
+
+@gateway
+def _take_children_data(scanObject):
+    """[summary]
+        임베딩 파일 정보 (ScanObject.children) 에서 메모리 데이터를 분리한다. 
+
+        * ScanResult 는 분석 엔진을 호출할 때마다 프로세스로 전달되므로 
+          부모 파일에 메모리 데이터가 남아 있으면 임베딩 파일 수만큼 반복 전달된다. 
+
+    Arguments:
+        scanObject {instance} -- [description] 부모 ScanObject 인스턴스
+
+    Returns:
+        {dict} -- [description] {임베딩 파일 고유값 : 메모리 데이터}
+    """
+    children_data = {}
+    for uniqID, child in scanObject.get_children().items():
+        data = skeleton.get_child_data(child)
+        if data is not None:
+            children_data[uniqID] = data
+        child.pop("child_data", None)
+
+    return children_data
+
+def _dispatch_child(scanResult, scanObject, uniqID, child, depth, data=None):
+    """[summary]
+        임베딩 파일을 Dispatch 한다. 
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        scanObject {instance} -- [description] 부모 ScanObject 인스턴스
+        uniqID {str} -- [description] 임베딩 파일 고유값
+        child {dict} -- [description] 임베딩 파일 정보 (ScanObject.children)
+        depth {int} -- [description] 부모 파일의 분석 Depth
+
+    Keyword Arguments:
+        data {bytes} -- [description] 메모리 데이터 (_take_children_data()) (default: {None})
+    """
+    Dispatch(scanResult, 
+                child.get("child_name", ""),
+                uniqID=uniqID,
+                depth = depth + 1,
+                parentID=scanObject.get_uid(),
+                parentName=scanObject.get_ori_file_name(),
+                internal_path=child.get("internal_path", []),
+                data=data)
+
+def _dispatch_child_in_thread(scanResult, scanObject, uniqID, child, depth, data=None):
+    # 병렬 Dispatch 스레드임을 표시한다. 
+    __local__.in_fanout = True
+    try:
+        _dispatch_child(scanResult, scanObject, uniqID, child, depth, data)
+    finally:
+        __local__.in_fanout = False
+
+@gateway
+def _dispatch_parallel(scanResult, scanObject, children, depth, children_data):
+    """[summary]
+        동일 우선순위의 임베딩 파일을 병렬로 Dispatch 한다. 
+
+        * 임베딩 파일별로 ScanResult.fork() 에 분석한 후 
+          임베딩 파일 순서대로 ScanResult 에 병합한다. (완료 순서와 무관하게 결과 순서 유지)
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        scanObject {instance} -- [description] 부모 ScanObject 인스턴스
+        children {dict} -- [description] 동일 우선순위 임베딩 파일 목록 {uniqID : child}
+        depth {int} -- [description] 부모 파일의 분석 Depth
+        children_data {dict} -- [description] 임베딩 파일 메모리 데이터 (_take_children_data())
+    """
+    executor = _get_executor()
+
+    tasks = []
+    for uniqID, child in children.items():
+        forkResult = scanResult.fork()
+        future = executor.submit(_dispatch_child_in_thread, forkResult, scanObject, uniqID, child, depth, 
+                                 children_data.pop(uniqID, None))
+        tasks.append((forkResult, future))
+
+    for forkResult, future in tasks:
+        try:
+            future.result()
+
+        except:
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+
+        finally:
+            scanResult.merge(forkResult)
 
 @gateway
 def _recursive(scanResult, scanObject, depth):
     """[summary]
         Dispatch 함수를 재귀호출한다. 
 
+        * 우선순위가 높은 임베딩 파일 (참조 대상 스트림) 의 분석이 완료된 후 다음 우선순위를 처리한다. 
+        * 동일 우선순위의 임베딩 파일이 2개 이상인 경우 병렬로 Dispatch 한다. (config.dispatch_threads)
+
     Arguments:
         scanResult {instance} -- [description] ScanResult 인스턴스
         scanObject {instance} -- [description] ScanObject 인스턴스
         depth {int} -- [description] 재귀호출을 조절하기 위한 Depth
     """
     try:
-        # 임베딩 파일이 있는 경우 
-        # 임베딩 파일 목록을 가져온다. 
-        children = scanObject.get_children()
-        # 우선순위 레벨을 가져온다. 
-        # priority_level = [10000, 1000, 100, 0]
-        priority_level = sorted(config.PRIORITY_LEVEL.values())[::-1]
+        # 병렬 Dispatch 여부를 확인한다. 
+        # - 병렬 Dispatch 스레드 내에서는 순차 처리한다. 
+        parallel = config.dispatch_threads > 1 and not getattr(__local__, "in_fanout", False)
+
+        # 메모리 데이터는 Dispatch 할 때만 전달하고 ScanResult 에는 남기지 않는다. 
+        children_data = _take_children_data(scanObject)
 
-        # 우선순위별로 처리한다. 
-        for level in priority_level:
-            # 우선순위에 따라 Children 목록을 가져온다. 
-            new_children = scanObject.get_children_by_priority(children, level)
+        # 임베딩 파일이 있는 경우 
+        # 우선순위가 높은 순서대로 처리한다. (ScanObject 우선순위 인덱스)
+        for level, new_children in scanObject.iter_children_by_priority():
+            if parallel and len(new_children) > 1:
+                _dispatch_parallel(scanResult, scanObject, new_children, depth, children_data)
+                continue
 
             # 순서대로 Dispatch를 호출한다. 
             for uniqID, child in new_children.items():
-                child_name = child.get("child_name", "")
-                parentID = scanObject.get_uid()
-                parentName = scanObject.get_ori_file_name()
-                internal_path = child.get("internal_path", [])
-
-                Dispatch(scanResult, 
-                            child_name,
-                            uniqID=uniqID,
-                            depth = depth + 1,
-                            parentID=parentID,
-                            parentName=parentName,
-                            internal_path=internal_path)
+                _dispatch_child(scanResult, scanObject, uniqID, child, depth, children_data.pop(uniqID, None))
 
     except:
         # 에러로그를 남긴다. 
@@ -359,7 +472,33 @@ def _recursive(scanResult, scanObject, depth):
         pass
 
 @gateway
-def Dispatch(scanResult, job, uniqID="", depth=0, parentID="", parentName="", internal_path=[]):
+def _release_children(scanResult, scanObject):
+    """[summary]
+        Recursive 처리가 완료된 임베딩 파일의 분석 결과를 출력하고 ScanResult 에는 요약 정보만 남긴다. 
+
+        * 같은 부모의 임베딩 파일은 서로 참조할 수 있으므로 (우선순위) 부모 파일의 Recursive 처리 완료 후 출력한다. 
+        * 하위 임베딩 파일은 각 임베딩 파일의 Recursive 처리 완료시 이미 출력되어 있다. 
+        * Root 파일은 Job 완료시 출력한다. (sink.write())
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        scanObject {instance} -- [description] 부모 ScanObject 인스턴스
+    """
+    if not sink.is_incremental():
+        return
+
+    rootUID = scanResult.get_rootUID()
+    for uniqID in scanObject.get_children():
+        childObject = scanResult.get_files().get(uniqID, None)
+        if not isinstance(childObject, skeleton.ScanObject):
+            continue
+
+        # 출력된 경우에만 요약 정보로 교체한다. 
+        if sink.write_object(rootUID, childObject):
+            scanResult.release(uniqID)
+
+@gateway
+def Dispatch(scanResult, job, uniqID="", depth=0, parentID="", parentName="", internal_path=[], data=None):
     """[summary]
         job을 처리한다. 
 
@@ -373,6 +512,7 @@ def Dispatch(scanResult, job, uniqID="", depth=0, parentID="", parentName="", in
         parentID {str} -- [description] 분석 대상 파일의 부모 파일 고유값 (default: {""})
         parentName {str} -- [description] 분석 대상 파일의 부모 파일명 (default: {""})
         internal_path {list} -- [description] 분석 대상 파일의 내부 경로 (default: {[]})
+        data {bytes} -- [description] 분석 대상 메모리 데이터 (임베딩 파일) (default: {None})
     """
     scanObject = None
     try:
@@ -392,7 +532,7 @@ def Dispatch(scanResult, job, uniqID="", depth=0, parentID="", parentName="", in
 
             # 전처리를 수행한다. 
             # - ScanObject를 생성한다. 
-            scanObject = _get_metadata(job, uniqID, depth, parentID, parentName, internal_path)
+            scanObject = _get_metadata(job, uniqID, depth, parentID, parentName, internal_path, data)
             if not scanObject:
                 raise DispatchError("Failed in the allocation of ScanObject.")
 
@@ -400,29 +540,43 @@ def Dispatch(scanResult, job, uniqID="", depth=0, parentID="", parentName="", in
             # 상태 : [ORI] -> [WAIT]
             monitoring.__waiting__(scanObject)
 
-            # - 포멧을 확인한다. 
-            fformat = _get_fformat(scanResult, scanObject.get_file_name())
-            if not fformat:
-                # 분석 대상이 아님.
-                raise DispatchPassThru
+            # - 캐시된 분석 결과를 확인한다. 
+            #   동일 파일 (SHA256) 의 분석 결과가 있으면 포멧 확인, 분석을 생략한다. 
+            cachedObject = cache.lookup(scanResult, scanObject)
+            if cachedObject:
+                scanObject.release_file_data()
+                scanObject = cachedObject
+            else:
+                # - 포멧을 확인한다. 
+                # 메모리 매핑된 데이터를 그대로 검사한다. 
+                fformat = _get_fformat(scanResult, scanObject.get_file_name(), scanObject.get_file_view())
 
-            if not (fformat.scan_module or fformat.file_type or fformat.name):
-                raise DispatchError("engine is not set. check yara rules.")
+                # 분석 엔진은 별도 프로세스에서 필요한 데이터만 읽으므로 메모리 매핑을 해제한다. 
+                scanObject.release_file_data()
+                if not fformat:
+                    # 분석 대상이 아님.
+                    raise DispatchPassThru
 
-            scanObject.updatefformat(fformat)
+                if not (fformat.scan_module or fformat.file_type or fformat.name):
+                    raise DispatchError("engine is not set. check yara rules.")
 
-            # 필터링 한다. 
-            # - True : 필터링 대상
-            # - False : 분석 대상 
-            if __is_filtered__(scanObject):
-                raise DispatchPassThru
+                scanObject.updatefformat(fformat)
 
+                # 필터링 한다. 
+                # - True : 필터링 대상
+                # - False : 분석 대상 
+                if __is_filtered__(scanObject):
+                    raise DispatchPassThru
 
-            # 분석을 수행한다. 
-            # 상태 : [WAIT] -> [ANLZ]]
-            bRet, scanObject = _run_module(scanResult, scanObject)
-            if not bRet:
-                raise DispatchError("Failed _run_module().")
+
+                # 분석을 수행한다. 
+                # 상태 : [WAIT] -> [ANLZ]]
+                bRet, scanObject = _run_module(scanResult, scanObject)
+                if not bRet:
+                    raise DispatchError("Failed _run_module().")
+
+                # 분석 결과를 캐시에 저장한다. 
+                cache.store(scanResult, scanObject)
 
             # TEST
             print(scanObject)                
@@ -449,6 +603,9 @@ def Dispatch(scanResult, job, uniqID="", depth=0, parentID="", parentName="", in
             if config.recursive:
                 # Recursive 처리시
                 _recursive(scanResult, scanObject, depth)
+
+                # 분석이 완료된 임베딩 파일의 분석 결과를 출력한다. 
+                _release_children(scanResult, scanObject)
             
     except DispatchErrorPassThru:
         # 이전 Recursived Dispatch에서 예외처리된 경우
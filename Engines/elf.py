@@ -7,8 +7,9 @@
 #
 # 개발 Log
 # 2018.09.12    버전 0.0.1      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.2      [수정] 메모리 데이터 임베딩 파일 지원 (ScanObject.open_file())
 
-__version__ = "0.0.1"
+__version__ = "0.0.2"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -47,9 +48,8 @@ class KeiEngine(skeleton.EngineProcess):
 
         fp = None
         try:
-            fileName = scanObject.get_file_name()
-            
-            fp = open(fileName, "rb")
+            # 메모리 데이터로 전달된 임베딩 파일도 처리할 수 있도록 파일 객체를 사용한다. 
+            fp = scanObject.open_file()
             elffile = ELFFile(fp)
             for sect in elffile.iter_sections():
                 scanObject.updateStructure(sect.name, sect.header)  
@@ -8,9 +8,13 @@
 # 개발 Log
 # 2018.08.06    버전 0.0.5      [개발] 프로토타입 변경
 # 2018.08.07    버전 0.0.6      [개발] 멀티 프로세스 생성
+# 2026.10.18    버전 0.0.7      [수정] get_jobs() : 전체 목록 생성 -> Generator (찾는 대로 분석 Queue 전달)
+# 2026.10.18    버전 0.0.8      [추가] 전체 Job 완료 후 프로세스별 처리 시간 지표 병합/저장
+# 2026.10.18    버전 0.0.9      [추가] 분석 결과 저장 프로세스 (sink) 생성/종료
+# 2026.10.18    버전 0.0.10     [추가] 실행 시작시 이전 실행의 상태 저널 삭제 (monitoring.reset_journal())
 #
 
-__version__ = "0.0.6"
+__version__ = "0.0.10"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -20,7 +24,10 @@ import sys
 
 # 고유 라이브러리 
 from Engines import Log, gateway
+from Engines import metrics
+from Engines import monitoring
 from Engines import mws
+from Engines import sink
 from Engines import utils
 from Engines import consumer
 
@@ -33,28 +40,40 @@ import config
 #########################################################################################################
 @gateway
 def get_jobs(args):
-    try:
-        jobs = []
+    """[summary]
+        Job 을 찾는 대로 반환한다. (Generator)
+
+        전체 목록을 만들지 않고 찾은 순서대로 분석 Queue 에 전달해 첫 분석 시작까지의 시간을 줄인다. 
 
+    Arguments:
+        args {instance} -- [description] argparse.NameSpace 인스턴스
+
+    Returns:
+        {generator} -- [description] 분석 대상 파일 경로
+    """
+    try:
         # Job을 가져온다. 
 
         # - 폴더/파일에 대한 Job
         if args.file or args.folder:
-            jobs += utils.get_file_list(args.file, args.folder)
+            for job in utils.iter_file_list(args.file, args.folder):
+                yield job
 
         # - MWS에 대한 Job
         if config.mws_flag:
             json_list = mws.get_tag_search(args.mws_tag, args.mws_start_time, args.mws_end_time, args.mws_limit)
             if not json_list == []:
-                jobs += mws.get_file_list_download(json_list)
+                for job in mws.iter_file_list_download(json_list):
+                    yield job
 
-        return jobs
+    except GeneratorExit:
+        # 반환 중 소비가 중단된 경우 
+        raise
 
     except:
         _, msg, obj = sys.exc_info()
         msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
         Log.error(msg)
-        return []
 
     finally:
         pass
@@ -63,31 +82,31 @@ def get_jobs(args):
 def start(args):
     job_manager = None
     try:
-        # # Job을 가져온다. 
-        # # - 폴더/파일에 대한 Job
-        # jobs = utils.get_file_list(args.file, args.folder)
+        # 이전 실행의 처리 시간 지표 기록을 삭제한다. 
+        if config.metrics:
+            metrics.reset()
 
-        # # - MWS에 대한 Job
-        # if config.mws_flag:
-        #     mws_jobs_json = mws.get_tag_search(args.mws_tag, args.mws_start_time, args.mws_end_time, args.mws_limit)
-        #     if not mws_jobs_json == []:
-        #         jobs += mws.get_file_list_download(mws_jobs_json)
+        # 이전 실행의 상태 저널을 삭제한다. (저널 누적 방지)
+        if config.queue_monitor and config.queue_monitor_mode == "journal":
+            monitoring.reset_journal()
 
-        # Job을 가져온다.
-        jobs = get_jobs(args)
-        total_jobs = len(jobs)
-        # Log.info("Jobs: {}".format(total_jobs))
+        # 분석 결과 저장 프로세스를 생성한다. 
+        # Consumer 프로세스에 결과 큐가 전달되도록 먼저 생성한다. 
+        sink.start()
 
         # 멀티 프로세스를 생성/실행한다. 
-        proc_num = config.proc_num
-        if total_jobs < proc_num:
-            proc_num = total_jobs
-        
-        job_manager = consumer.Consumer(proc_num=proc_num)
-        for i, job in enumerate(jobs):
-            # Job을 분배한다. 
+        # 전체 Job 수를 미리 알 수 없으므로 config.proc_num 만큼 생성한다. 
+        job_manager = consumer.Consumer(proc_num=config.proc_num)
+
+        # Job을 분배한다. 
+        # 분석 Queue (config.queue_size) 가 가득 찬 경우 put() 에서 대기한다. 
+        total_jobs = 0
+        for job in get_jobs(args):
             Log.info("Job: {}".format(job))
             job_manager.put(job)
+            total_jobs += 1
+
+        Log.info("Jobs: {}".format(total_jobs))
         
     except:
         _, msg, obj = sys.exc_info()
@@ -95,5 +114,30 @@ def start(args):
         Log.error(msg)
 
     finally:
-        # 멀티 프로세스를 종료한다. 
-        job_manager.stop_all_worker()
\ No newline at end of file
+        # 멀티 프로세스 종료가 실패해도 결과 저장 프로세스는 종료한다. (비정상 종료시 대기 방지)
+        try:
+            # 멀티 프로세스를 종료한다. 
+            if job_manager:
+                job_manager.stop_all_worker()
+
+        except:
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+
+        finally:
+            # 남은 분석 결과를 기록하고 결과 저장 프로세스를 종료한다. 
+            try:
+                sink.stop()
+
+            finally:
+                # 프로세스별 처리 시간 지표를 병합해 저장한다. 
+                try:
+                    reportFile = metrics.report()
+                    if reportFile:
+                        Log.info("metrics: {}".format(reportFile))
+
+                except:
+                    _, msg, obj = sys.exc_info()
+                    msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+                    Log.error(msg)
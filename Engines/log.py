@@ -7,22 +7,36 @@
 #
 # 개발 Log
 # 2018.08.06    버전 0.0.5      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.6      [수정] gateway : 함수 입출력 로그 비활성화시 데코레이터 미적용, perf_counter_ns, 샘플링
+# 2026.10.18    버전 0.0.7      [추가] gateway : 함수별 처리 시간 지표 기록 (metrics.observe())
+# 2026.10.18    버전 0.0.8      [수정] Log.init() : 프로세스별 1회 초기화, 로그 큐 + 단일 기록 스레드 (LogListener)
+# 2026.10.18    버전 0.0.9      [수정] gateway : Generator 함수는 생성 시점이 아닌 전체 순회의 처리 시간 기록
 #
-__version__ = "0.0.5"
+__version__ = "0.0.9"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
 from datetime import datetime, timedelta
 from logging import getLogger, handlers, Formatter
+from queue import Empty
 
+import atexit
+import functools
 import inspect
+import itertools
 import logging
+import multiprocessing
 import os
 import sys
+import threading
+import time
 
 # 서드파티 라이브러리 
 
 # 고유 라이브러리 
+from Engines import metrics
+
+import config
 
 
 #########################################################################################################
@@ -31,8 +45,82 @@ import sys
 LOG_FORMATTER = "%(asctime)s [%(levelname)-8s] %(message)s"
 TIME_FORMATTER = "%Y%m%dT%H%M%S"
 
+#########################################################################################################
+# 일괄 기록 핸들러
+# - LogListener 가 로그를 묶어서 기록하는 동안 (batching) 로그마다 flush 하지 않는다. 
+#########################################################################################################
+class BatchFlush:
+    batching = False
+
+    def flush(self):
+        if not self.batching:
+            super().flush()
+
+class BatchStreamHandler(BatchFlush, logging.StreamHandler):
+    pass
+
+class BatchFileHandler(BatchFlush, handlers.TimedRotatingFileHandler):
+    pass
+
+
+#########################################################################################################
+# 로그 기록 스레드
+# - 최초 Log.init() 을 호출한 프로세스 (kei.py) 에서 실행된다. 
+# - 전체 프로세스의 로그를 로그 큐에서 가져와 config.log_batch_size 개씩 묶어 기록한다. 
+# - 종료 요청 (None) 을 받으면 남은 로그를 기록하고 종료한다. 
+#########################################################################################################
+class LogListener(threading.Thread):
+    def __init__(self, queue, handlers, batch_size=config.log_batch_size):
+        threading.Thread.__init__(self, name="LogListener", daemon=True)
+        self.queue = queue
+        self.handlers = handlers
+        self.batch_size = max(batch_size, 1)
+        self.pid = os.getpid()
+
+    def run(self):
+        stop = False
+        while not stop:
+            try:
+                record = self.queue.get()
+            except (EOFError, OSError):
+                break
+
+            # 대기 중인 로그를 함께 가져온다. 
+            batch = []
+            while True:
+                if record is None:
+                    stop = True
+                    break
+
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+
+                try:
+                    record = self.queue.get_nowait()
+                except Empty:
+                    break
+
+            self.__emit__(batch)
+
+    def __emit__(self, batch):
+        for handler in self.handlers:
+            handler.batching = True
+            try:
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                handler.batching = False
+                handler.flush()
+
+
 #########################################################################################################
 # 로그용 클래스
+# - Log.init() 은 프로세스별로 1회만 초기화한다. (이후 호출은 무시)
+# - config.log_queue 인 경우 
+#       * 최초 프로세스 (kei.py) : 화면/파일 핸들러는 LogListener 만 사용하고 로그는 로그 큐로 전달한다. 
+#       * 하위 프로세스 (Work, EngineProcess) : 전달받은 로그 큐로 로그를 전달한다. 
 #########################################################################################################
 class Log:
     __log_level_map__ = {
@@ -44,22 +132,90 @@ class Log:
     }
 
     __logger__ = None
+    __pid__ = None
+    __queue__ = None
+    __listener__ = None
 
     @staticmethod
-    def init(log_name="", log_level="info", log_path="", log_cmd=False):
+    def init(log_name="", log_level="info", log_path="", log_cmd=False, log_queue=None):
+        """[summary]
+            로그를 초기화한다. 프로세스별로 1회만 초기화된다. 
+
+        Keyword Arguments:
+            log_name {str} -- [description] 로그명, 로그 파일명에 사용 (default: {""})
+            log_level {str} -- [description] 로그 레벨 (default: {"info"})
+            log_path {str} -- [description] 로그 폴더 (default: {""})
+            log_cmd {bool} -- [description] 화면 출력 여부 (default: {False})
+            log_queue {instance} -- [description] 로그 큐 (Log.get_queue()), 없는 경우 상속받은 로그 큐 (default: {None})
+        """
+        # 현재 프로세스에서 초기화된 경우 
+        if Log.__pid__ == os.getpid():
+            return
+
         Log.__logger__ = getLogger(log_name)
         Log.__logger__.setLevel(Log.__log_level_map__.get(log_level, "warn"))
+        Log.__logger__.propagate = False
+
+        # 상속받은 (fork) 핸들러는 사용하지 않는다. 
+        for handler in list(Log.__logger__.handlers):
+            Log.__logger__.removeHandler(handler)
+
+        queue = log_queue or Log.__queue__
+        if queue is None and config.log_queue:
+            # 최초 프로세스인 경우 
+            # 로그 큐를 생성하고 로그 기록 스레드를 시작한다. 
+            queue = multiprocessing.Queue()
+            Log.__listener__ = LogListener(queue, Log.__handlers__(log_name, log_path, log_cmd))
+            Log.__listener__.start()
+
+            # 종료시 남은 로그를 기록한다. 
+            atexit.register(Log.close)
+
+        if queue is not None:
+            Log.__queue__ = queue
+            Log.__logger__.addHandler(handlers.QueueHandler(queue))
+        else:
+            for handler in Log.__handlers__(log_name, log_path, log_cmd):
+                Log.__logger__.addHandler(handler)
+
+        Log.__pid__ = os.getpid()
+
+    @staticmethod
+    def get_queue():
+        """[summary]
+            하위 프로세스에 전달할 로그 큐를 반환한다. (없는 경우 None)
+        """
+        return Log.__queue__
+
+    @staticmethod
+    def close():
+        """[summary]
+            로그 기록 스레드에 종료 요청 (None) 을 전달하고 남은 로그가 기록될 때까지 기다린다. 
+        """
+        # 상속받은 (fork) 로그 기록 스레드는 종료하지 않는다. 
+        listener = Log.__listener__
+        if listener is None or listener.pid != os.getpid():
+            return
+
+        Log.__listener__ = None
+        listener.queue.put(None)
+        listener.join()
+        for handler in listener.handlers:
+            handler.close()
+
+    @staticmethod
+    def __handlers__(log_name, log_path, log_cmd):
+        """[summary]
+            화면/파일 핸들러를 생성한다. 
+        """
         formatter = Formatter(LOG_FORMATTER)
-        
 
-        # 로그 핸들러 등록
+        # 로그 핸들러 생성
         if log_cmd:
             # 화면 핸들러 생성
-            console_handler = logging.StreamHandler()
+            console_handler = BatchStreamHandler()
             console_handler.setFormatter(formatter)
-
-            # 화면 핸들러 등록
-            Log.__logger__.addHandler(console_handler)
+            return [console_handler]
 
         else:
             # 파일 핸들러 전처리 
@@ -76,11 +232,9 @@ class Log:
             log_path = os.path.join(log_path, log_file_name)
 
             # 파일 핸들러 생성
-            file_handler = handlers.TimedRotatingFileHandler(log_path, when="D", interval=1)
+            file_handler = BatchFileHandler(log_path, when="D", interval=1)
             file_handler.setFormatter(formatter)
-
-            # 파일 핸들러 등록 
-            Log.__logger__.addHandler(file_handler)
+            return [file_handler]
         
     @staticmethod
     def debug(msg="", mod_name="", func_name=""):
@@ -206,20 +360,85 @@ class Log:
 
 ######################################################################
 # 함수 입출력 로그용 데코레이터
+# - config.log_trace, config.metrics 가 모두 False 인 경우 함수를 그대로 반환한다. (호출 비용 없음)
+# - 함수 입출력 로그는 config.log_trace_sample 회 호출당 1회만 기록한다. 
+# - 처리 시간 지표 (config.metrics) 는 전체 호출을 기록한다. 
+# - Generator 함수는 순회가 끝날 때까지 Generator 내부에서 소요된 시간을 기록한다. 
+#   (호출 시점에는 Generator 만 생성되므로 순회하는 쪽의 처리 시간은 제외)
 ######################################################################
 def gateway(f):
+    if not (config.log_trace or config.metrics):
+        return f
+
+    name = "{}.{}".format(f.__module__, f.__qualname__)
+    sample = max(int(config.log_trace_sample), 1)
+    counter = itertools.count()
+
+    def is_trace():
+        # 함수 입출력 로그 기록 여부를 확인한다. 
+        # - debug 로그가 비활성화된 경우 제외
+        # - 샘플링 대상이 아닌 경우 제외
+        return config.log_trace and Log.__logger__ is not None and Log.__logger__.isEnabledFor(logging.DEBUG) and not next(counter) % sample
+
+    if inspect.isgeneratorfunction(f):
+        @functools.wraps(f)
+        def wrap_generator(*args, **kwargs):
+            trace = is_trace()
+
+            # 기록 대상이 아닌 경우 Generator 를 그대로 순회한다. 
+            if not (trace or config.metrics):
+                return (yield from f(*args, **kwargs))
+
+            # 순회 시작
+            if trace:
+                Log.debug("start", mod_name=f.__module__, func_name=f.__name__)
+            elasped_time = 0
+
+            # 순회 
+            # - 다음 항목을 생성하는 동안의 시간만 누적한다. 
+            generator = f(*args, **kwargs)
+            try:
+                while True:
+                    start_time = time.perf_counter_ns()
+                    try:
+                        item = next(generator)
+                    except StopIteration as e:
+                        return e.value
+                    finally:
+                        elasped_time += time.perf_counter_ns() - start_time
+                    yield item
+
+            finally:
+                # 순회 종료 (중단된 경우 포함)
+                generator.close()
+                if config.metrics:
+                    metrics.observe(name, elasped_time)
+                if trace:
+                    Log.debug("end (Elasped Time: {}s)".format(elasped_time / 1000000000), mod_name=f.__module__, func_name=f.__name__)
+        return wrap_generator
+
+    @functools.wraps(f)
     def wrap(*args, **kwargs):
+        trace = is_trace()
+
+        # 기록 대상이 아닌 경우 함수를 그대로 호출한다. 
+        if not (trace or config.metrics):
+            return f(*args, **kwargs)
+
         # 함수 시작
-        Log.debug("start", mod_name=f.__module__, func_name=f.__name__)
-        start_time = datetime.now()
+        if trace:
+            Log.debug("start", mod_name=f.__module__, func_name=f.__name__)
+        start_time = time.perf_counter_ns()
 
         # 함수 처리 
-        ret = f(*args, **kwargs)
-
-        # 함수 종료
-        end_time = datetime.now()
-        elasped_time = (end_time - start_time).total_seconds()
-        Log.debug("end (Elasped Time: {}s)".format(elasped_time), mod_name=f.__module__, func_name=f.__name__)
-        
-        return ret
+        try:
+            return f(*args, **kwargs)
+
+        finally:
+            # 함수 종료
+            elasped_time = time.perf_counter_ns() - start_time
+            if config.metrics:
+                metrics.observe(name, elasped_time)
+            if trace:
+                Log.debug("end (Elasped Time: {}s)".format(elasped_time / 1000000000), mod_name=f.__module__, func_name=f.__name__)
     return wrap
\ No newline at end of file
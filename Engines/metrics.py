@@ -0,0 +1,301 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+#
+# 용도 : 성능 지표 모듈
+# 설명 : gateway 데코레이터가 측정한 함수별 호출 수/처리 시간을 집계하는 모듈
+#
+#   * 함수별 처리 시간은 로그 스케일 히스토그램으로 저장한다. (버킷 간 약 9% 오차)
+#   * 프로세스별로 <temp_path>\\<metrics>\\<pid>.json 에 기록 (dump()) 한 후
+#     jobs.start() 에서 병합해 config.metrics_path 에 JSON 또는 Prometheus 텍스트로 저장한다. (report())
+#
+#   ※ gateway (Engines.log) 에서 사용하므로 Engines.log 를 참조하지 않는다.
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입
+#
+
+__version__ = "0.0.1"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리
+import json
+import math
+import os
+import threading
+import time
+
+# 서드파티 라이브러리
+
+# 고유 라이브러리
+import config
+
+
+#########################################################################################################
+# 전역 변수
+# - SUB_BUCKETS 는 2배 구간당 버킷 수
+# - QUANTILES 는 출력할 백분위수
+#########################################################################################################
+SUB_BUCKETS = 8
+QUANTILES = [("p50", 0.5), ("p95", 0.95), ("p99", 0.99)]
+
+__registry__ = {}
+__registry_pid__ = None
+__registry_lock__ = threading.Lock()
+
+
+#########################################################################################################
+# 처리 시간 히스토그램 (나노초 단위)
+#########################################################################################################
+class Histogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.buckets = {}       # {버킷 번호 : 호출 수}
+
+    @staticmethod
+    def __bucket__(value):
+        if value <= 1:
+            return 0
+        return int(math.log2(value) * SUB_BUCKETS)
+
+    @staticmethod
+    def __upper__(bucket):
+        return 2 ** ((bucket + 1) / SUB_BUCKETS)
+
+    def observe(self, value):
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self.count += 1
+        self.total += value
+        bucket = self.__bucket__(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other):
+        if not other.count:
+            return
+
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def quantile(self, q):
+        """[summary]
+            백분위수를 반환한다. (해당 버킷의 상한값, 최대값을 넘지 않음)
+
+        Arguments:
+            q {float} -- [description] 백분위 (0.0 ~ 1.0)
+
+        Returns:
+            {float} -- [description] 처리 시간 (나노초)
+        """
+        if not self.count:
+            return 0
+
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.__upper__(bucket), self.max)
+        return self.max
+
+    def get(self):
+        return {
+            "count"     :   self.count,
+            "total"     :   self.total,
+            "min"       :   self.min,
+            "max"       :   self.max,
+            "buckets"   :   {str(bucket) : count for bucket, count in self.buckets.items()}
+        }
+
+    @staticmethod
+    def load(dict_data):
+        histogram = Histogram()
+        histogram.count = dict_data.get("count", 0)
+        histogram.total = dict_data.get("total", 0)
+        histogram.min = dict_data.get("min", 0)
+        histogram.max = dict_data.get("max", 0)
+        histogram.buckets = {int(bucket) : count for bucket, count in dict_data.get("buckets", {}).items()}
+        return histogram
+
+    def summary(self):
+        """[summary]
+            요약 정보를 반환한다. (second 단위)
+        """
+        result = {
+            "count"     :   self.count,
+            "total"     :   self.total / 1e9,
+            "mean"      :   self.total / self.count / 1e9 if self.count else 0.0,
+            "min"       :   self.min / 1e9,
+            "max"       :   self.max / 1e9
+        }
+        for name, q in QUANTILES:
+            result[name] = self.quantile(q) / 1e9
+        return result
+
+
+#########################################################################################################
+# 프로세스 단위 지표
+#########################################################################################################
+def _get_registry():
+    """[summary]
+        현재 프로세스의 지표 목록을 반환한다.
+
+        fork 로 상속된 지표는 부모 프로세스에서 기록되므로 프로세스별로 새로 생성한다.
+    """
+    global __registry__, __registry_pid__
+    if __registry_pid__ != os.getpid():
+        __registry__ = {}
+        __registry_pid__ = os.getpid()
+    return __registry__
+
+def observe(name, elapsed):
+    """[summary]
+        함수 처리 시간을 기록한다.
+
+    Arguments:
+        name {str} -- [description] <모듈명>.<함수명>
+        elapsed {int} -- [description] 처리 시간 (나노초)
+    """
+    with __registry_lock__:
+        registry = _get_registry()
+        histogram = registry.get(name)
+        if histogram is None:
+            histogram = Histogram()
+            registry[name] = histogram
+        histogram.observe(elapsed)
+
+def _dump_dir():
+    return os.path.join(config.temp_path, config.metrics_folder)
+
+def dump():
+    """[summary]
+        현재 프로세스의 지표를 <temp_path>\\<metrics>\\<pid>.json 에 기록한다.
+
+        같은 프로세스에서 다시 호출되면 덮어쓴다.
+    """
+    if not config.metrics:
+        return
+
+    with __registry_lock__:
+        data = {name : histogram.get() for name, histogram in _get_registry().items()}
+
+    if not data:
+        return
+
+    dumpDir = _dump_dir()
+    os.makedirs(dumpDir, exist_ok=True)
+
+    dumpFile = os.path.join(dumpDir, "{}.json".format(os.getpid()))
+    with open(dumpFile + ".tmp", "w") as f:
+        json.dump(data, f)
+    os.replace(dumpFile + ".tmp", dumpFile)
+
+def reset():
+    """[summary]
+        이전 실행에서 남은 프로세스별 지표 기록과 현재 프로세스의 지표를 삭제한다.
+    """
+    with __registry_lock__:
+        _get_registry().clear()
+
+    dumpDir = _dump_dir()
+    if os.path.isdir(dumpDir):
+        for entry in os.scandir(dumpDir):
+            if entry.name.endswith(".json"):
+                os.remove(entry.path)
+
+def collect():
+    """[summary]
+        프로세스별 지표 기록을 병합한다. (현재 프로세스 포함)
+
+    Returns:
+        {dict} -- [description] {<모듈명>.<함수명> : Histogram}
+    """
+    dump()
+
+    result = {}
+    dumpDir = _dump_dir()
+    if not os.path.isdir(dumpDir):
+        return result
+
+    for entry in os.scandir(dumpDir):
+        if not entry.name.endswith(".json"):
+            continue
+
+        with open(entry.path, "r") as f:
+            data = json.load(f)
+
+        for name, dict_data in data.items():
+            result.setdefault(name, Histogram()).merge(Histogram.load(dict_data))
+
+    return result
+
+def to_json(histograms):
+    """[summary]
+        함수별 요약 정보를 JSON 으로 변환한다. (전체 처리 시간 순)
+    """
+    names = sorted(histograms, key=lambda name: histograms[name].total, reverse=True)
+    return json.dumps({name : histograms[name].summary() for name in names}, indent=4)
+
+def to_prometheus(histograms):
+    """[summary]
+        함수별 요약 정보를 Prometheus 텍스트 형식 (summary) 으로 변환한다.
+    """
+    metric = "kei_function_duration_seconds"
+    lines = [
+        "# HELP {} Function latency measured by gateway.".format(metric),
+        "# TYPE {} summary".format(metric)
+    ]
+    for name in sorted(histograms):
+        summary = histograms[name].summary()
+        label = name.replace("\\", "\\\\").replace("\"", "\\\"")
+        for key, q in QUANTILES:
+            lines.append("{}{{function=\"{}\",quantile=\"{}\"}} {:.9f}".format(metric, label, q, summary[key]))
+        lines.append("{}_sum{{function=\"{}\"}} {:.9f}".format(metric, label, summary["total"]))
+        lines.append("{}_count{{function=\"{}\"}} {}".format(metric, label, summary["count"]))
+
+    return "\n".join(lines) + "\n"
+
+def report(metrics_path=None, metrics_format=None):
+    """[summary]
+        프로세스별 지표 기록을 병합해 저장한다.
+
+        * 저장 위치 : <metrics_path>\\<시간>.json 또는 <시간>.prom
+
+    Keyword Arguments:
+        metrics_path {str} -- [description] 저장 폴더 (default: {config.metrics_path})
+        metrics_format {str} -- [description] "json" 또는 "prometheus" (default: {config.metrics_format})
+
+    Returns:
+        {str} -- [description] 저장된 파일 경로, 지표가 없는 경우 ""
+    """
+    if not config.metrics:
+        return ""
+
+    metrics_path = metrics_path or config.metrics_path
+    metrics_format = metrics_format or config.metrics_format
+
+    histograms = collect()
+    if not histograms:
+        return ""
+
+    if metrics_format == "prometheus":
+        data, ext = to_prometheus(histograms), "prom"
+    else:
+        data, ext = to_json(histograms), "json"
+
+    os.makedirs(metrics_path, exist_ok=True)
+    reportFile = os.path.join(metrics_path, "{}.{}".format(time.strftime("%Y%m%dT%H%M%S"), ext))
+    with open(reportFile, "w") as f:
+        f.write(data)
+
+    return reportFile
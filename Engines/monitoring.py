@@ -7,14 +7,22 @@
 #
 # 개발 Log
 # 2018.08.14    버전 0.0.5      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.6      [수정] __waiting__() : 원본 파일 복사 대신 캐시된 데이터 저장
+# 2026.10.18    버전 0.0.7      [추가] 상태 저널 모드 (파일 복사/이동 없이 상태 변경 이력 기록), get_queue_status()
+# 2026.10.18    버전 0.0.8      [수정] _journal_fd() : 임베딩 파일 병렬 Dispatch 를 위해 저널 파일 생성 동기화
+# 2026.10.18    버전 0.0.9      [추가] reset_journal() : 실행 시작시 이전 실행의 저널 삭제
+# 2026.10.18    버전 0.0.10     [수정] 저널 폴더 : config.dir_q_journal, 분석 상태 목록 (QUEUE_STATES)
 #
 
-__version__ = "0.0.5"
+__version__ = "0.0.10"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
+import json
 import os
 import sys
+import threading
+import time
 
 # 서드파티 라이브러리 
 
@@ -30,17 +38,156 @@ class QueueMonitorError(Exception):
     def __init__(self, msg):
         self.msg = msg
 
+
+#########################################################################################################
+# 분석 상태 (config.dir_q_monitor 키)
+# - 저널 모드에서는 상태별 폴더를 생성하지 않는다. (skeleton.Work.__queuing__())
+#########################################################################################################
+QUEUE_STATES = ["waiting", "analyzing", "except", "complete", "error"]
+
+
+#########################################################################################################
+# 상태 저널 (config.queue_monitor_mode = "journal")
+# - 파일을 복사/이동하지 않고 상태 변경 이력만 기록한다. 
+# - 저널 위치 : <temp_path>\\<dir_q_journal>\\<pid>.journal
+#       * 프로세스별로 저널 파일을 분리해 여러 프로세스가 동시에 기록해도 섞이지 않는다. 
+#       * 1줄 1건 (JSON) : {"uid", "state", "time", "path", "name", "parent"}
+#       * 실행 시작시 (jobs.start()) 이전 실행의 저널을 삭제한다. (status 명령은 마지막 실행의 상태만 출력)
+#########################################################################################################
+__journal_fd__ = None
+__journal_pid__ = None
+__journal_lock__ = threading.Lock()
+
+def _journal_dir():
+    return os.path.join(config.temp_path, config.dir_q_journal)
+
+def _journal_fd():
+    """[summary]
+        현재 프로세스의 저널 파일 디스크립터를 반환한다. (추가 모드)
+    """
+    global __journal_fd__, __journal_pid__
+    with __journal_lock__:
+        if __journal_fd__ is None or __journal_pid__ != os.getpid():
+            journalDir = _journal_dir()
+            if not utils.is_exists(journalDir):
+                utils.makedirectory(journalDir)
+
+            journal = os.path.join(journalDir, "{}.journal".format(os.getpid()))
+            __journal_fd__ = os.open(journal, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0))
+            __journal_pid__ = os.getpid()
+
+        return __journal_fd__
+
+def reset_journal():
+    """[summary]
+        이전 실행에서 남은 저널 파일을 삭제한다. 
+
+        현재 프로세스의 저널 파일이 열려 있는 경우 닫고 다음 기록시 새로 생성한다. 
+    """
+    global __journal_fd__, __journal_pid__
+    with __journal_lock__:
+        if __journal_fd__ is not None and __journal_pid__ == os.getpid():
+            os.close(__journal_fd__)
+        __journal_fd__ = None
+        __journal_pid__ = None
+
+        journalDir = _journal_dir()
+        if utils.is_exists(journalDir):
+            for entry in os.scandir(journalDir):
+                if entry.name.endswith(".journal"):
+                    os.remove(entry.path)
+
+def __journal__(scanObject, state, label):
+    """[summary]
+        분석 대상 파일의 상태 변경을 저널에 기록한다. 
+
+    Arguments:
+        scanObject {instance} -- [description] ScanObject 인스턴스
+        state {str} -- [description] 변경할 상태 (QUEUE_STATES)
+        label {str} -- [description] 로그 출력용 상태 변경 정보
+    """
+    try:
+        record = {
+            "uid"       :   scanObject.get_uid(),
+            "state"     :   state,
+            "time"      :   time.time(),
+            "path"      :   scanObject.get_file_name(),
+            "name"      :   scanObject.get_ori_file_name(),
+            "parent"    :   scanObject.get_parentID()
+        }
+        line = json.dumps(record) + "\n"
+        os.write(_journal_fd(), line.encode("utf-8"))
+
+        Log.debug("[{}] {}".format(label, os.path.basename(record["path"])))
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+
+    finally:
+        pass
+
+@gateway
+def get_queue_status(state=""):
+    """[summary]
+        저널을 재생해 분석 대상별 현재 상태를 반환한다. 
+
+    Keyword Arguments:
+        state {str} -- [description] 반환할 상태 (default: {""}, 전체)
+
+    Returns:
+        {dict} -- [description] {uid : 마지막 저널 기록}
+    """
+    try:
+        records = []
+        journalDir = _journal_dir()
+        if utils.is_exists(journalDir):
+            for fileName in os.listdir(journalDir):
+                if not fileName.endswith(".journal"):
+                    continue
+
+                with open(os.path.join(journalDir, fileName), "rb") as fp:
+                    for line in fp:
+                        try:
+                            records.append(json.loads(line.decode("utf-8")))
+                        except ValueError:
+                            # 기록 중인 마지막 줄은 제외한다. 
+                            continue
+
+        status = {}
+        for record in sorted(records, key=lambda record: record.get("time", 0)):
+            status[record["uid"]] = record
+
+        if state:
+            status = {uid : record for uid, record in status.items() if record["state"] == state}
+
+        return status
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return {}
+
+    finally:
+        pass
+
 @gateway
 def __waiting__(scanObject):
     """[summary]
         분석 대상 파일의 상태를 변경한다. 
         
         * 변경 시점 : dispatch.Dispatch() 내 _get_metadata() 완료 시점
-        * 변경 위치 : 원본 파일 경로 -> <temp_path>\\<waiting>\\<uid>\\<fileName>
+        * 변경 위치 : 원본 파일 경로 -> <temp_path>\\<waiting>\\<uid>\\<fileName> (folder 모드)
         
     Arguments:
         scanObject {instance} -- [description] ScanObject 인스턴스 
     """
+    if config.queue_monitor_mode == "journal":
+        __journal__(scanObject, "waiting", "ORI -> WAIT")
+        return
+
     try:
         # 분석 대상 파일의 현재 경로를 가져온다. 
         # src : 원본 파일 경로
@@ -64,7 +211,8 @@ def __waiting__(scanObject):
         dst = dst.replace("\\", "\\\\")
 
         # 파일을 복사한다. 
-        if not utils.copyfile(src, dst):
+        # 메모리 매핑된 데이터를 저장해 이후 해시 계산, Yara 검사와 같은 데이터를 사용한다. 
+        if not utils.writefile(dst, scanObject.get_file_view()):
             raise QueueMonitorError("Failed change status to wait. ({})".format(scanObject.get_uid()))
 
         Log.debug("[ORI -> WAIT] {}".format(os.path.basename(src)))
@@ -98,6 +246,10 @@ def __analyzing__(scanObject):
     KeyArgument:
         fileName {str} -- [description] 분석 대상 파일 (optional), 주로 분석 엔진에서 선분석시 요청됨.
     """
+    if config.queue_monitor_mode == "journal":
+        __journal__(scanObject, "analyzing", "WAIT -> ANLZ")
+        return
+
     try:
         # 분석 대상 파일의 현재 경로를 가져온다. 
         ori_fileName = scanObject.get_file_name()
@@ -144,6 +296,10 @@ def __except__(scanObject):
     Arguments:
         scanObject {instance} -- [description] ScanObject 인스턴스 
     """
+    if config.queue_monitor_mode == "journal":
+        __journal__(scanObject, "except", "ANLZ -> EXPT")
+        return
+
     try:
         # 분석 대상 파일의 현재 경로를 가져온다. 
         ori_fileName = scanObject.get_file_name()
@@ -190,6 +346,10 @@ def __error__(scanObject):
     Arguments:
         scanObject {instance} -- [description] ScanObject 인스턴스 
     """
+    if config.queue_monitor_mode == "journal":
+        __journal__(scanObject, "error", "ANLZ -> ERR")
+        return
+
     try:
         # 분석 대상 파일의 현재 경로를 가져온다. 
         ori_fileName = scanObject.get_file_name()
@@ -236,6 +396,10 @@ def __complete__(scanObject):
     Arguments:
         scanObject {instance} -- [description] ScanObject 인스턴스 
     """
+    if config.queue_monitor_mode == "journal":
+        __journal__(scanObject, "complete", "ANLZ -> CMPT")
+        return
+
     try:
         # 분석 대상 파일의 현재 경로를 가져온다. 
         ori_fileName = scanObject.get_file_name()
@@ -7,8 +7,9 @@
 #
 # 개발 Log
 # 2018.09.12    버전 0.0.1      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.2      [개발] iter_file_list_download() : 내려받은 파일을 순서대로 반환 (Generator)
 #
-__version__ = "0.0.1"
+__version__ = "0.0.2"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -72,7 +73,16 @@ def get_file_download(file_hash):
         pass
 
 @gateway
-def get_file_list_download(json_list):
+def iter_file_list_download(json_list):
+    """[summary]
+        malwares.com 에서 파일을 내려받고 완료된 파일 경로를 순서대로 반환한다. (Generator)
+
+    Arguments:
+        json_list {list} -- [description] get_tag_search() 결과
+
+    Returns:
+        {generator} -- [description] 내려받은 파일 경로
+    """
     try:
         Log.info("try Download from malwares.com : {}".format(len(json_list)))
 
@@ -80,7 +90,6 @@ def get_file_list_download(json_list):
         if not utils.makedirectory(mws_path):
             raise MWSError("Failed MakeDirectory() for malwares.com")
         
-        complete_list = []
         # failed_list = []
         for i, dict_data in enumerate(json_list):
             file_hash = dict_data["sha256"]
@@ -92,22 +101,26 @@ def get_file_list_download(json_list):
 
             fullName = os.path.join(mws_path, file_hash)
             if utils.unzip(mws_path, zip_content):
-                complete_list.append(fullName)
                 Log.debug("MWS Download Successed : [{}/{}] {}".format(i+1, len(json_list), file_hash))
+                yield fullName
             else:
                 Log.error("Failed to write or decompress(unzip). ({})".format(file_hash))
-            
-        return complete_list
 
     except MWSError as e:
         Log.error(e.msg)
-        return []
+
+    except GeneratorExit:
+        # 반환 중 소비가 중단된 경우 
+        raise
 
     except:
         _, msg, obj = sys.exc_info()
         msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
         Log.error(msg)
-        return []
 
     finally:
-        pass
\ No newline at end of file
+        pass
+
+@gateway
+def get_file_list_download(json_list):
+    return list(iter_file_list_download(json_list))
@@ -10,8 +10,11 @@
 # 2018.08.16    버전 0.0.2      [수정] 리팩토링
 # 2018.08.16    버전 0.0.3      [추가] Stream 디렉토리 정보 
 # 2018.08.21    버전 0.0.4      [추가] Child or Embedded 처리 방식 변경 (Pre-Processing -> Dispatch)
+# 2026.10.18    버전 0.0.5      [수정] Stream 저장 위치 : <temp_path>\\<embedding> -> Job 단위 작업 폴더
+# 2026.10.18    버전 0.0.6      [수정] 메모리 데이터 임베딩 파일 지원 (ScanObject.open_file())
+# 2026.10.18    버전 0.0.7      [수정] OLE 파일 1회 열기 (kernel.OleSession 공유)
 
-__version__ = "0.0.4"
+__version__ = "0.0.7"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -42,7 +45,7 @@ class KeiEngine(skeleton.EngineProcess):
         skeleton.EngineProcess.__init__(self, __version__, __author__, self.__module__)
 
     @gateway
-    def get_directories_info(self, scanObject):
+    def get_directories_info(self, scanObject, session):
         """[summary]
             분석 대상 파일에서 Directory 정보를 추출해 Struct 에 저장한다. 
 
@@ -50,6 +53,7 @@ class KeiEngine(skeleton.EngineProcess):
 
         Arguments:
             scanObject {instance} -- [description] ScanObject 인스턴스
+            session {instance} -- [description] kernel.OleSession 인스턴스
 
         Returns:
             {bool} -- [description] 정상 처리 여부 
@@ -59,7 +63,7 @@ class KeiEngine(skeleton.EngineProcess):
             fileName = scanObject.get_file_name()
 
             # Directory 목록을 가져온다. 
-            directories = kernel.get_directories(fileName)
+            directories = session.get_directories()
             for directory in directories:
                 # 개별 Directory 정보를 추출한다. 
                 instance = oledirectory.OleDirectoryObject(directory)
@@ -96,9 +100,9 @@ class KeiEngine(skeleton.EngineProcess):
             pass
 
     @gateway
-    def get_streams(self, scanObject):
+    def get_streams(self, scanResult, scanObject, session):
         """[summary]
-            분석 대상 파일에서 Stream을 추출하고 이를 <temp_path>\\<"Embedded"> 에 저장한다. 
+            분석 대상 파일에서 Stream을 추출하고 이를 Job 단위 작업 폴더 (scanResult.get_work_path()) 에 저장한다. 
 
             * 반환 결과
                 [
@@ -110,17 +114,16 @@ class KeiEngine(skeleton.EngineProcess):
                 ]
 
         Arguments:
+            scanResult {instance} -- [description] ScanResult 인스턴스
             scanObject {instance} -- [description] ScanObject 인스턴스
+            session {instance} -- [description] kernel.OleSession 인스턴스
 
         Returns:
             {list} -- [description] 추출된 Stream 목록
         """
         try:
-            # 분석 대상 파일명을 가져온다. 
-            fileName = scanObject.get_file_name()
-
             # 분석 대상 파일에서 Stream을 추출한다. 
-            return kernel.extract(fileName)
+            return session.extract(scanResult.get_work_path())
 
         except:
             _, msg, obj = sys.exc_info()
@@ -132,7 +135,7 @@ class KeiEngine(skeleton.EngineProcess):
             pass
 
     @gateway
-    def __parse_root__(self, scanObject):
+    def __parse_root__(self, scanResult, scanObject, session):
         """[summary]
             ScanObject 대상(Root 파일)을 분석한다. 
 
@@ -149,17 +152,19 @@ class KeiEngine(skeleton.EngineProcess):
                 }
 
         Arguments:
+            scanResult {instance} -- [description] ScanResult 인스턴스
             scanObject {instance} -- [description] ScanObject 인스턴스
+            session {instance} -- [description] kernel.OleSession 인스턴스
         """
         error = False
         err_msg = ""
         try:
             # 분석 대상의 Directory 정보를 저장한다. 
-            if not self.get_directories_info(scanObject):
+            if not self.get_directories_info(scanObject, session):
                 raise KeiEngineError("Failed get directory info.")
 
             # 구조를 분석해 Stream을 파일로 저장한다. 
-            streams = self.get_streams(scanObject)
+            streams = self.get_streams(scanResult, scanObject, session)
 
             # 생성한 Stream을 Children에 업데이트 한다. 
             for i, stream in enumerate(streams):
@@ -171,7 +176,8 @@ class KeiEngine(skeleton.EngineProcess):
                 scanObject.updateChildren(
                     stream.get("fileName", ""),
                     stream.get("internal_path", []),
-                    priority
+                    priority,
+                    stream.get("data")
                 )
 
         except KeiEngineError as e:
@@ -305,13 +311,14 @@ class KeiEngine(skeleton.EngineProcess):
         error = False
         err_msg = ""
         try:
-            fileName = scanObject.get_file_name()
-            
             # OLE 파일여부를 판단한다. 
-            if kernel.is_ole(fileName):
+            # 파일을 열지 않고 시작 데이터 (Signature) 만 확인한다. 
+            if kernel.is_ole_header(scanObject.read_file_data(0, 8)):
                 # OLE 파일인 경우
                 # Root OLE 파일이거나 추출된 OLE 파일로 판단
-                self.__parse_root__(scanObject)
+                # OLE 파일은 1회만 열어 Directory 조회, Stream 추출에 공유하고 분석 후 닫는다. 
+                with kernel.OleSession(scanObject.get_file_name(), scanObject.open_file()) as session:
+                    self.__parse_root__(scanResult, scanObject, session)
             else:
                 # OLE 파일이 아닌 경우 
                 # OLE 파일에서 추출한 Embedded 파일로 판단
@@ -0,0 +1,279 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+# 
+# 용도 : 분석 엔진 Pool 모듈
+# 설명 : 분석 엔진(ole, elf, ...)별 상주 프로세스를 생성하고 재사용하는 모듈
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입 (EngineProcess 작업 단위 생성 -> 상주 프로세스 재사용)
+# 2026.10.18    버전 0.0.2      [수정] 작업/결과 전달 : Queue + Manager Queue -> Pipe
+# 2026.10.18    버전 0.0.3      [수정] EngineWorker : 로그 큐 전달
+# 2026.10.18    버전 0.0.4      [수정] EnginePool : 병렬 Dispatch 스레드 간 프로세스 목록 동기화, dispatch_threads 만큼 빈 자리 확보
+# 2026.10.18    버전 0.0.5      [수정] EnginePool : 대기 큐 FIFO -> LIFO (최근 사용한 프로세스 우선, 빈 자리는 동시 요청시에만 생성)
+#
+
+__version__ = "0.0.5"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리 
+import multiprocessing
+import queue
+import sys
+import threading
+
+# 서드파티 라이브러리 
+
+# 고유 라이브러리 
+from Engines import Log, gateway
+from Engines import skeleton
+
+import config
+
+
+class EnginePoolError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+
+#########################################################################################################
+# 분석 엔진 프로세스
+# - 분석 엔진 클래스 (skeleton.EngineProcess 상속) 를 1회 로드한 후 작업을 반복 처리한다.
+# - 프로세스가 비정상 종료된 경우 해당 작업만 실패 처리되고 프로세스는 재생성된다.
+#########################################################################################################
+class EngineWorker:
+    def __init__(self, clsName, max_tasks=config.engine_max_tasks):
+        self.tasks = 0
+        self.max_tasks = max_tasks
+        self.failed = False
+
+        # 작업 전달과 결과 반환에 사용할 Pipe 를 생성한다. 
+        # (별도 Manager 프로세스를 거치지 않음)
+        self.conn, child_conn = multiprocessing.Pipe()
+
+        engine = clsName()
+        self.process = multiprocessing.Process(target=engine.__run__,
+                                               name=engine.__engine__,
+                                               args=(child_conn, self.max_tasks, Log.get_queue()))
+        self.process.daemon = True
+        self.process.start()
+
+        # 프로세스가 종료되면 EOF 를 받을 수 있도록 자식 측 Pipe 를 닫는다. 
+        child_conn.close()
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def is_retired(self):
+        """[summary]
+            최대 작업 수를 처리해 프로세스가 종료되었는지 확인한다.
+        """
+        return self.max_tasks and self.tasks >= self.max_tasks
+
+    def is_reusable(self):
+        """[summary]
+            다음 작업에 재사용할 수 있는지 확인한다. (실행 중, 통신 오류 없음, 최대 작업 수 미만)
+        """
+        return not self.failed and not self.is_retired() and self.is_alive()
+
+    def run(self, scanResult, scanObject):
+        """[summary]
+            작업을 전달하고 분석 결과를 기다린다.
+
+        Arguments:
+            scanResult {instance} -- [description] ScanResult 인스턴스
+            scanObject {instance} -- [description] ScanObject 인스턴스
+
+        Returns:
+            {bytes} -- [description] 직렬화된 분석 결과
+        """
+        try:
+            self.conn.send((scanResult, scanObject))
+            while not self.conn.poll(config.engine_wait):
+                # 분석 중 프로세스가 종료된 경우
+                if not self.is_alive():
+                    raise EOFError
+
+            result = self.conn.recv_bytes()
+            self.tasks += 1
+            return result
+
+        except (EOFError, OSError):
+            self.failed = True
+            self.process.join(config.engine_wait)
+            raise EnginePoolError("engine process is terminated. (exitcode: {})".format(self.process.exitcode))
+
+    def close(self):
+        """[summary]
+            프로세스를 종료한다.
+        """
+        try:
+            if self.is_alive():
+                try:
+                    self.conn.send(None)
+                except (EOFError, OSError):
+                    # 종료 중인 프로세스인 경우 
+                    pass
+                self.process.join(config.engine_wait)
+
+            if self.is_alive():
+                self.process.terminate()
+
+            self.process.join()
+            self.conn.close()
+
+        except:
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+
+        finally:
+            pass
+
+
+#########################################################################################################
+# 분석 엔진 Pool
+# - 분석 엔진 클래스 단위로 config.engine_pool_size 개의 EngineWorker 를 유지한다.
+# - 대기 큐에는 재사용 가능한 EngineWorker 또는 빈 자리 (None, 다음 작업시 생성) 만 반환한다.
+# - 병렬 Dispatch (config.dispatch_threads) 스레드가 대기하지 않도록 스레드 수만큼 자리를 만든다.
+#   (engine_pool_size 를 초과하는 자리는 처음 사용할 때 생성)
+# - 대기 큐는 LIFO 로 최근 반환된 EngineWorker 를 먼저 사용한다. 
+#   (순차 요청은 같은 프로세스를 재사용하고 빈 자리는 동시 요청이 있을 때만 프로세스로 생성)
+# - 프로세스 목록 (workers) 은 병렬 Dispatch 스레드가 함께 변경하므로 lock 으로 순차 접근한다.
+#########################################################################################################
+class EnginePool:
+    def __init__(self, clsName, pool_size=config.engine_pool_size, max_tasks=config.engine_max_tasks):
+        self.clsName = clsName
+        self.max_tasks = max_tasks
+        self.workers = []
+        self.lock = threading.Lock()
+        self.idle = queue.LifoQueue()
+
+        # 빈 자리를 먼저 넣어 생성된 EngineWorker 가 먼저 사용되도록 한다. 
+        pool_size = max(pool_size, 1)
+        for i in range(pool_size, max(config.dispatch_threads, pool_size)):
+            self.idle.put(None)
+
+        for i in range(pool_size):
+            self.idle.put(self.__spawn__())
+
+    def __spawn__(self):
+        worker = EngineWorker(self.clsName, self.max_tasks)
+        with self.lock:
+            self.workers.append(worker)
+        return worker
+
+    def __retire__(self, worker):
+        worker.close()
+        with self.lock:
+            if worker in self.workers:
+                self.workers.remove(worker)
+
+    def __release__(self, worker):
+        """[summary]
+            작업을 마친 EngineWorker 를 대기 큐에 반환한다.
+
+            * 재사용할 수 없는 경우 (비정상 종료, 최대 작업 수 처리) 종료한 후 새로 생성해 반환한다.
+            * 종료/생성에 실패한 경우 빈 자리 (None) 를 반환한다. (대기 큐 크기 유지)
+
+        Arguments:
+            worker {instance} -- [description] EngineWorker 인스턴스, 빈 자리인 경우 None
+        """
+        if worker is not None and worker.is_reusable():
+            self.idle.put(worker)
+            return
+
+        try:
+            if worker is not None:
+                self.__retire__(worker)
+            worker = self.__spawn__()
+
+        except:
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+            worker = None
+
+        finally:
+            self.idle.put(worker)
+
+    @gateway
+    def run(self, scanResult, scanObject):
+        """[summary]
+            대기 중인 EngineWorker 에서 분석하고 분석 결과를 반환한다.
+
+        Arguments:
+            scanResult {instance} -- [description] ScanResult 인스턴스
+            scanObject {instance} -- [description] ScanObject 인스턴스
+
+        Returns:
+            {instance} -- [description] 분석 결과 (skeleton.decode_result())
+        """
+        worker = self.idle.get()
+        try:
+            # 이전 재생성에 실패한 빈 자리인 경우 생성한다.
+            if worker is None:
+                worker = self.__spawn__()
+
+            result = worker.run(scanResult, scanObject)
+            return skeleton.decode_result(result)
+
+        finally:
+            # 비정상 종료되었거나 최대 작업 수를 처리한 프로세스는 재생성한다.
+            self.__release__(worker)
+
+    def close(self):
+        """[summary]
+            전체 EngineWorker 를 종료한다.
+        """
+        with self.lock:
+            workers = self.workers
+            self.workers = []
+
+        for worker in workers:
+            worker.close()
+
+
+#########################################################################################################
+# 프로세스 단위 EnginePool 목록
+# - 키 : <모듈명>.<클래스명>
+#########################################################################################################
+__pools__ = {}
+__pools_lock__ = threading.Lock()
+
+@gateway
+def get_pool(clsName):
+    """[summary]
+        분석 엔진 클래스의 EnginePool 을 반환한다. 없는 경우 생성한다.
+
+    Arguments:
+        clsName {class} -- [description] 분석 엔진 클래스 (skeleton.EngineProcess 상속)
+
+    Returns:
+        {instance} -- [description] EnginePool 인스턴스
+    """
+    key = "{}.{}".format(clsName.__module__, clsName.__name__)
+    with __pools_lock__:
+        engine_pool = __pools__.get(key)
+        if engine_pool is None:
+            engine_pool = EnginePool(clsName)
+            __pools__[key] = engine_pool
+
+        return engine_pool
+
+@gateway
+def close_all():
+    """[summary]
+        생성된 전체 EnginePool 을 종료한다.
+    """
+    with __pools_lock__:
+        for key, engine_pool in __pools__.items():
+            try:
+                engine_pool.close()
+
+            except:
+                _, msg, obj = sys.exc_info()
+                msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+                Log.error(msg)
+
+        __pools__.clear()
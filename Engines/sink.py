@@ -0,0 +1,373 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+#
+# 용도 : 분석 결과 출력 모듈
+# 설명 : 분석이 완료된 Job 의 분석 결과 (ScanResult) 를 NDJSON 파일로 저장하는 모듈
+#
+#   * Consumer 프로세스는 Job 단위로 직렬화한 분석 결과를 결과 큐에 전달만 한다. (파일 I/O 대기 없음)
+#   * 결과 저장 프로세스 (ResultWriter) 가 결과 큐에서 가져와 일정 개수/시간 단위로 묶어 기록한다.
+#   * 저장 위치 : <result_sink_path>\\<시간>_<seq>.ndjson (result_sink_gzip 인 경우 .ndjson.gz)
+#       - 파일 크기 (압축 전) 가 result_sink_rotate_size 이상이면 다음 파일에 기록한다.
+#   * 1줄 1건 (JSON)
+#       - {"type" : "object", "rootUID", "object" : ScanObject.to_dict()}   : 분석 대상 파일 (Root, 임베딩 파일)
+#       - {"type" : "root", "rootUID", "job", "startTime", "endTime", "result", "files" : [요약 정보]}  : Job 완료
+#   * 점진 출력 (result_sink_incremental) 인 경우 임베딩 파일은 Recursive 처리 완료시 먼저 출력된다. (write_object())
+#       - 같은 Job 의 레코드가 연속되지 않을 수 있으므로 rootUID 로 구분한다. 
+#   * result_store 인 경우 기록한 레코드를 분석 결과 저장소 (SQLite) 에도 저장한다. (Engines.store)
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입
+# 2026.10.18    버전 0.0.2      [추가] 임베딩 파일 분석 결과 점진 출력 (write_object()), Job 완료 레코드 내 요약 정보
+# 2026.10.18    버전 0.0.3      [추가] 결과 저장 프로세스 : 분석 결과 저장소 (store.ResultStore) 저장
+# 2026.10.18    버전 0.0.4      [수정] _default() : Mapping (pyelftools Container 등) 은 get() 대신 dict 로 변환
+#
+
+__version__ = "0.0.4"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리
+import base64
+import gzip
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Mapping
+from queue import Empty
+
+# 서드파티 라이브러리
+
+# 고유 라이브러리
+from Engines import Log, gateway
+from Engines import store
+
+import config
+
+
+class ResultSinkError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+
+#########################################################################################################
+# 결과 큐
+# - jobs.start() (sink.start()) 에서 생성되며 Consumer 프로세스로 전달된다. (sink.init())
+#########################################################################################################
+__queue__ = None
+__writer__ = None
+
+
+#########################################################################################################
+# JSON 변환
+#########################################################################################################
+def _default(value):
+    """[summary]
+        json.dumps() 로 변환할 수 없는 값을 변환한다.
+
+        * bytes : Base64
+        * datetime : ISO 8601
+        * Mapping (pyelftools Container 등) : dict
+        * get() / to_dict() 가 있는 인스턴스 : 반환값
+        * 함수/메소드 : 이름
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode("ascii")
+
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+
+    if isinstance(value, Mapping):
+        return dict(value)
+
+    if hasattr(value, "get"):
+        return value.get()
+
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+
+    if callable(value):
+        return getattr(value, "__qualname__", str(value))
+
+    return str(value)
+
+def to_json(record):
+    return json.dumps(record, default=_default, ensure_ascii=False)
+
+def object_record(rootUID, scanObject):
+    """[summary]
+        분석 대상 파일의 출력 레코드를 생성한다.
+
+    Arguments:
+        rootUID {str} -- [description] Root 파일의 uniqID
+        scanObject {instance} -- [description] ScanObject 인스턴스
+
+    Returns:
+        {str} -- [description] JSON 1줄
+    """
+    dict_data = scanObject.to_dict()
+
+    # 임베딩 파일의 메모리 데이터는 저장하지 않는다.
+    for child in dict_data.get("children", {}).values():
+        child.pop("child_data", None)
+
+    return to_json({"type" : "object", "rootUID" : rootUID, "object" : dict_data})
+
+def root_record(scanResult, job):
+    """[summary]
+        Job 완료 레코드를 생성한다.
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        job {str} -- [description] 분석 대상 파일명
+
+    Returns:
+        {str} -- [description] JSON 1줄
+    """
+    return to_json({
+        "type"      :   "root",
+        "rootUID"   :   scanResult.get_rootUID(),
+        "job"       :   job,
+        "startTime" :   scanResult.startTime,
+        "endTime"   :   scanResult.endTime,
+        "result"    :   scanResult.result,
+        "files"     :   scanResult.get_summary()
+    })
+
+
+#########################################################################################################
+# 결과 파일
+# - 압축 전 기록 크기가 rotate_size 이상이면 다음 파일을 생성한다.
+#########################################################################################################
+class RotatingWriter:
+    def __init__(self, result_path, rotate_size=config.result_sink_rotate_size, compress=config.result_sink_gzip):
+        self.result_path = result_path
+        self.rotate_size = rotate_size
+        self.compress = compress
+        self.prefix = time.strftime("%Y%m%dT%H%M%S")
+        self.seq = 0
+        self.fp = None
+        self.size = 0
+
+        if not os.path.exists(result_path):
+            os.makedirs(result_path)
+
+    def __open__(self):
+        self.seq += 1
+        ext = "ndjson.gz" if self.compress else "ndjson"
+        fileName = os.path.join(self.result_path, "{}_{:04d}.{}".format(self.prefix, self.seq, ext))
+        if self.compress:
+            self.fp = gzip.open(fileName, "at", encoding="utf-8")
+        else:
+            self.fp = open(fileName, "a", encoding="utf-8")
+        self.size = 0
+
+    def write(self, lines):
+        """[summary]
+            JSON 목록을 기록한다. (1회 write)
+
+        Arguments:
+            lines {list} -- [description] 줄바꿈 문자가 포함된 JSON 목록
+        """
+        if self.fp is None or (self.rotate_size and self.size >= self.rotate_size):
+            self.close()
+            self.__open__()
+
+        data = "".join(lines)
+        self.fp.write(data)
+        self.fp.flush()
+        self.size += len(data)
+
+    def close(self):
+        if self.fp:
+            self.fp.close()
+            self.fp = None
+
+
+#########################################################################################################
+# 결과 저장 프로세스
+# - 결과 큐에서 가져온 결과를 result_sink_batch_size 개 또는 result_sink_flush_interval 초 단위로 기록한다.
+# - 종료 요청 (None) 을 받으면 남은 결과를 기록하고 종료한다.
+# - 분석 결과 저장소 저장에 실패해도 파일 기록은 계속한다.
+#########################################################################################################
+def _writer_main(queue, result_path, log_queue):
+    Log.init(log_name="sink",
+             log_level=config.log_level,
+             log_path=config.log_path,
+             log_cmd=config.log_cmd,
+             log_queue=log_queue)
+
+    writer = RotatingWriter(result_path)
+    result_store = store.open_store() if config.result_store else None
+    batch = []
+    last_flush = time.time()
+    try:
+        while True:
+            stop = False
+            try:
+                item = queue.get(timeout=config.result_sink_flush_interval)
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            except Empty:
+                pass
+
+            if batch and (stop or len(batch) >= config.result_sink_batch_size or time.time() - last_flush >= config.result_sink_flush_interval):
+                writer.write(batch)
+                if result_store:
+                    _store_batch(result_store, batch)
+                batch = []
+                last_flush = time.time()
+
+            if stop:
+                break
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+
+    finally:
+        writer.close()
+        if result_store:
+            result_store.close()
+
+def _store_batch(result_store, batch):
+    try:
+        result_store.insert_lines(batch)
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+
+    finally:
+        pass
+
+@gateway
+def start(result_path=None):
+    """[summary]
+        결과 큐와 결과 저장 프로세스를 생성한다. (jobs.start())
+
+        Consumer 생성 전에 호출해야 결과 큐가 Consumer 프로세스로 전달된다.
+
+    Keyword Arguments:
+        result_path {str} -- [description] 결과 저장 폴더 (default: {config.result_sink_path})
+    """
+    global __queue__, __writer__
+    if not config.result_sink or __writer__ is not None:
+        return
+
+    __queue__ = multiprocessing.Queue()
+    # 종료 요청 없이 메인 프로세스가 종료되는 경우에도 대기하지 않도록 daemon 으로 생성한다. 
+    __writer__ = multiprocessing.Process(target=_writer_main,
+                                         name="ResultWriter",
+                                         args=(__queue__, result_path or config.result_sink_path, Log.get_queue()),
+                                         daemon=True)
+    __writer__.start()
+
+@gateway
+def stop():
+    """[summary]
+        결과 저장 프로세스에 종료 요청 (None) 을 전달하고 남은 결과가 기록될 때까지 기다린다.
+
+        Consumer 프로세스가 모두 종료된 후 호출한다.
+        config.result_sink_stop_timeout 내에 종료되지 않으면 강제 종료한다.
+    """
+    global __queue__, __writer__
+    if __writer__ is None:
+        return
+
+    try:
+        __queue__.put(None)
+        __writer__.join(config.result_sink_stop_timeout or None)
+        if __writer__.is_alive():
+            Log.error("result writer is not stopped. terminate. (timeout: {})".format(config.result_sink_stop_timeout))
+            __writer__.terminate()
+            __writer__.join()
+
+    finally:
+        __writer__ = None
+        __queue__ = None
+
+def get_queue():
+    """[summary]
+        Consumer 프로세스에 전달할 결과 큐를 반환한다. (없는 경우 None)
+    """
+    return __queue__
+
+def init(queue):
+    """[summary]
+        Consumer 프로세스에서 전달받은 결과 큐를 설정한다.
+    """
+    global __queue__
+    __queue__ = queue
+
+def is_incremental():
+    """[summary]
+        임베딩 파일 분석 결과를 점진 출력하는지 여부를 반환한다.
+    """
+    return bool(config.result_sink_incremental) and __queue__ is not None
+
+@gateway
+def write_object(rootUID, scanObject):
+    """[summary]
+        분석 대상 파일 1건의 분석 결과를 결과 큐에 전달한다. (점진 출력)
+
+    Arguments:
+        rootUID {str} -- [description] Root 파일의 uniqID
+        scanObject {instance} -- [description] ScanObject 인스턴스
+
+    Returns:
+        {bool} -- [description] 전달 여부
+    """
+    if __queue__ is None:
+        return False
+
+    try:
+        __queue__.put(object_record(rootUID, scanObject) + "\n")
+        return True
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return False
+
+    finally:
+        pass
+
+@gateway
+def write(scanResult, job):
+    """[summary]
+        Job 의 분석 결과를 결과 큐에 전달한다.
+
+        분석 대상 파일별 레코드 (점진 출력되지 않은 파일) 와 Job 완료 레코드를 한번에 전달한다.
+
+    Arguments:
+        scanResult {instance} -- [description] ScanResult 인스턴스
+        job {str} -- [description] 분석 대상 파일명
+
+    Returns:
+        {bool} -- [description] 전달 여부
+    """
+    if __queue__ is None:
+        return False
+
+    try:
+        rootUID = scanResult.get_rootUID()
+        lines = [object_record(rootUID, fileObject) for fileObject in scanResult.get_files().values() if hasattr(fileObject, "to_dict")]
+        lines.append(root_record(scanResult, job))
+        __queue__.put("\n".join(lines) + "\n")
+        return True
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return False
+
+    finally:
+        pass
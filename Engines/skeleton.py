@@ -10,13 +10,33 @@
 # 2018.08.07    버전 0.0.6      [개발] 멀티프로세스용 Work 클래스 추가 
 # 2018.08.13    버전 0.0.7      [수정] 동작 큐잉을 위해 ScanObject 의 uniqID 생성 로직을 이동함.(dispatch._get_metadata())
 # 2018.08.21    버전 0.0.8      [개발] FormatObject 구현 
-
-__version__ = "0.0.8"
+# 2026.10.18    버전 0.0.9      [수정] FileObject 파일 데이터 캐시 (SHA256 계산, Yara 검사, 큐 모니터링 공유)
+# 2026.10.18    버전 0.0.10     [수정] EngineProcess : 작업 단위 프로세스 -> 상주 프로세스 (pool.EnginePool) 루프
+# 2026.10.18    버전 0.0.11     [수정] EngineProcess : 결과 전달 Manager Queue -> Pipe
+# 2026.10.18    버전 0.0.12     [수정] FileObject : 단일 Pass 스트리밍 해시 (SHA256, MD5, SHA1, ssdeep, TLSH)
+# 2026.10.18    버전 0.0.13     [수정] FileObject : 메모리 매핑 기반 지연 읽기 (get_file_view(), read_file_data())
+# 2026.10.18    버전 0.0.14     [수정] decode_result() : 분석 결과를 ScanObject 인스턴스로 복원 (ScanResult 저장, 결과 캐시)
+# 2026.10.18    버전 0.0.15     [수정] Work : 종료 Flag 대신 종료 요청 (None) 전달
+# 2026.10.18    버전 0.0.16     [수정] Work : 임시 폴더 전체 정리 -> Job 단위 작업 폴더 생성/정리 (ScanResult.work_path)
+# 2026.10.18    버전 0.0.17     [추가] FileObject : 메모리 데이터 기반 생성 (임베딩 파일), open_file()
+# 2026.10.18    버전 0.0.18     [추가] ScanResult : 임베딩 파일 병렬 Dispatch 용 fork(), merge()
+# 2026.10.18    버전 0.0.19     [추가] ScanObject : 임베딩 파일 우선순위 인덱스 (iter_children_by_priority())
+# 2026.10.18    버전 0.0.20     [추가] EngineProcess : 종료시 처리 시간 지표 기록
+# 2026.10.18    버전 0.0.21     [수정] Work, EngineProcess : 로그 큐 전달 (Log.get_queue())
+# 2026.10.18    버전 0.0.22     [수정] encode_result(), decode_result() : JSON + zlib -> 바이너리 직렬화 (codec), ScanObject 인스턴스 복원
+# 2026.10.18    버전 0.0.23     [추가] ScanResult : 출력이 완료된 분석 결과를 요약 정보 (SummaryObject) 로 교체 (release())
+# 2026.10.18    버전 0.0.24     [추가] FormatObject : struct 를 제외한 포멧 정보 상속 (inherit())
+# 2026.10.18    버전 0.0.25     [수정] Work : 저널 모드에서 상태별 큐잉용 폴더 생성 생략
+# 2026.10.18    버전 0.0.26     [수정] EngineProcess : 분석 결과 직렬화 실패시 (전체 예외) 구조 정보를 제외하고 반환
+
+__version__ = "0.0.26"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
-import hashlib
+import base64
+import io
 import logging
+import mmap
 import multiprocessing
 import os
 import sys
@@ -27,6 +47,8 @@ import uuid
 
 # 고유 라이브러리 
 from Engines import Log
+from Engines import codec
+from Engines import metrics
 from Engines import monitoring
 from Engines import utils
 
@@ -52,18 +74,22 @@ class Work:
                        queue_wait=config.queue_wait, 
                        queue_size=config.queue_size):
         
-        if self.__queuing__():
-            self.proc_num = proc_num
-            self.queue_wait = queue_wait
-            self.stop_flag = multiprocessing.Value("i", 0, lock=False)
-            self.tasks_queue = multiprocessing.Queue(queue_size)
-            self.process = []
-            for i in range(self.proc_num):
-                p = multiprocessing.Process(target=self.__run__,                                        # 프로세스 함수 
-                                            name="Work{}".format(i),                                    # 프로세스 이름 
-                                            args=(self.tasks_queue, self.stop_flag, self.queue_wait))   # 프로세스 Parameter
-                p.start()
-                self.process.append(p)            
+        # 큐잉용 폴더가 없으면 Job 을 전달할 수 없으므로 생성하지 않는다. 
+        if not self.__queuing__():
+            raise WorkError("Failed Create Work. (queuing)")
+
+        self.proc_num = proc_num
+        self.queue_wait = queue_wait
+        self.log_queue = Log.get_queue()                                                            # 하위 프로세스 로그 전달
+        self.stop_flag = multiprocessing.Value("i", 0, lock=False)
+        self.tasks_queue = multiprocessing.Queue(queue_size)
+        self.process = []
+        for i in range(self.proc_num):
+            p = multiprocessing.Process(target=self.__run__,                                        # 프로세스 함수 
+                                        name="Work{}".format(i),                                    # 프로세스 이름 
+                                        args=(self.tasks_queue, self.stop_flag, self.queue_wait))   # 프로세스 Parameter
+            p.start()
+            self.process.append(p)            
 
     def __del__(self):
         self.stop_all_worker()
@@ -87,10 +113,33 @@ class Work:
         self.tasks_queue.put(args)
 
     def stop_all_worker(self):
+        """[summary]
+            프로세스별로 종료 요청 (None) 을 전달하고 종료될 때까지 기다린다. 
+
+            종료 요청은 앞서 전달된 작업을 모두 처리한 후에 전달된다. (FIFO)
+        """
+        # 생성 중 실패한 경우 (프로세스 없음)
+        if not hasattr(self, "stop_flag") or not hasattr(self, "tasks_queue"):
+            return
+
+        if self.stop_flag.value:
+            # 이미 종료된 경우 
+            return
+
+        for p in self.process:
+            self.tasks_queue.put(None)
+
         self.stop_flag.value = 1
         for p in self.process:
             p.join()
 
+        # 전체 Job 이 완료된 후 큐 모니터용 폴더를 정리한다. 
+        if config.clear_q_monitor:
+            for name, dirPath in config.dir_q_monitor.items():
+                dirName = os.path.join(config.temp_path, dirPath)
+                if utils.is_exists(dirName):
+                    utils.deletedirectory(dirName)
+
     def __queuing__(self):
         """[summary]
             큐잉용 모니터링시 사용할 폴더를 생성한다. 
@@ -101,6 +150,10 @@ class Work:
         try:
             if config.queue_monitor:
                 for name, dirPath in config.dir_q_monitor.items():
+                    # 저널 모드는 상태별 폴더를 사용하지 않는다. (임베딩 폴더만 생성)
+                    if config.queue_monitor_mode == "journal" and name in monitoring.QUEUE_STATES:
+                        continue
+
                     dirName = os.path.join(config.temp_path, dirPath)
                     if not utils.makedirectory(dirName):
                         raise WorkError("Failed Create {} for Monitoring.".format(name))
@@ -120,26 +173,35 @@ class Work:
         finally:
             pass
 
-    def __clear__(self):
+    def __make_work_path__(self):
         """[summary]
-            임시 폴더를 정리한다. 
+            Job 단위 작업 폴더를 생성한다. 
 
-            * clear_temp : 임시 폴더 정리 여부
-            * clear_q_monitor : 임시 폴더 내 분석 모니터링용 폴더 정리 여부 
+            * 생성 위치 : <temp_path>\\<work_folder>\\<pid>_<uuid>
+            * 임베딩 파일 등 Job 처리 중 생성되는 파일을 저장하며 Job 완료 후 삭제된다. (__clear__())
+
+        Returns:
+            {str} -- [description] 작업 폴더 경로
         """
-        try:
-            if config.clear_temp:
-                fileList = utils.get_dir_list(config.temp_path)
-                
-                for fileName in fileList:
-                    if not config.clear_q_monitor:
-                        if os.path.basename(fileName) in config.dir_q_monitor.keys():
-                            continue
+        work_path = os.path.join(config.temp_path, config.work_folder, "{}_{}".format(os.getpid(), uuid.uuid4().hex))
+        os.makedirs(work_path)
+        return work_path
+
+    def __clear__(self, scanResult=None):
+        """[summary]
+            Job 단위 작업 폴더를 정리한다. 
 
-                    if utils.is_file(fileName):
-                        utils.deletefile(fileName)
-                    else:
-                        utils.deletedirectory(fileName)
+            다른 프로세스가 처리 중인 Job 의 파일을 삭제하지 않도록 해당 Job 의 작업 폴더만 삭제한다. 
+
+            * clear_temp : 작업 폴더 정리 여부
+
+        Keyword Arguments:
+            scanResult {instance} -- [description] 처리가 완료된 Job 의 ScanResult 인스턴스 (default: {None})
+        """
+        try:
+            if config.clear_temp and scanResult and scanResult.work_path:
+                if utils.is_exists(scanResult.work_path):
+                    utils.deletedirectory(scanResult.work_path)
 
         except:
             _, msg, obj = sys.exc_info()
@@ -156,7 +218,7 @@ class Work:
         Arguments:
             tasks_queue {instnace} -- [description] 작업 큐
             stop_flag {instance} -- [description] 프로세스 종료여부 Flag
-            queue_wait {int} -- [description] 다음 Queue 확인까지 대기 시간
+            queue_wait {int} -- [description] 작업 대기 시간, 대기 중 종료 여부 Flag 를 확인하는 주기
         """
         try:
             # 전처리 
@@ -164,7 +226,12 @@ class Work:
             Log.init(log_name="work",
                      log_level=config.log_level, 
                      log_path=config.log_path, 
-                     log_cmd=config.log_cmd)
+                     log_cmd=config.log_cmd,
+                     log_queue=self.log_queue)
+
+            # 컴파일된 Yara 룰 번들을 로드한다. 
+            if config.yara_bundle:
+                utils.yara_load_bundle()
             
             # 처리 
             self.run(tasks_queue, stop_flag, queue_wait)
@@ -328,12 +395,6 @@ class EngineProcess:
         self.__engine__ = moduleName
         self.__moduleName__ = self.__class__.__name__   
 
-        self.task_queue = multiprocessing.JoinableQueue()
-        manager = multiprocessing.Manager()
-        self.result_queue = manager.Queue()
-
-        self.__process__ = multiprocessing.Process(target=self.__run__, args=(self.task_queue, self.result_queue,))
-
     def get_engine_info(self):
         """[summary]
             엔진 정보를 반환한다. 
@@ -358,37 +419,73 @@ class EngineProcess:
         finally:
             pass
 
-    def start(self):
-        self.__process__.start()
-
-    def close(self):
-        self.__process__.terminate()
-
-    def join(self):
-        self.__process__.join()
-
-    def put_task(self, task):
-        self.task_queue.put(task)
+    def __run__(self, conn, max_tasks=0, log_queue=None):
+        """[summary]
+            분석 엔진 프로세스 (pool.EngineWorker) 의 메인 루프
+            
+            종료 요청 (None) 을 받거나 max_tasks 만큼 처리할 때까지 작업을 반복 처리한다. 
 
-    def get_result(self):
-        serialized_data = utils.decompress(self.result_queue.get())
-        # return serialized_data
-        return type("ScanObject", (object,), serialized_data)
+        Arguments:
+            conn {instance} -- [description] Dispatch 와 연결된 Pipe, 작업 (scanResult, scanObject) 수신 / 결과 송신
 
-    def __run__(self, task_queue, result_queue):
-        error = False
-        err_msg = ""
+        Keyword Arguments:
+            max_tasks {int} -- [description] 프로세스가 처리할 최대 작업 수 (default: {0}, 무제한)
+            log_queue {instance} -- [description] 로그 큐 (Log.get_queue()) (default: {None})
+        """
         try:
             # Log 초기화 
             Log.init(log_name=self.__engine__.split(".")[1],
                      log_level=config.log_level, 
                      log_path=config.log_path, 
-                     log_cmd=config.log_cmd)
+                     log_cmd=config.log_cmd,
+                     log_queue=log_queue)
+
+            tasks = 0
+            while True:
+                # Job을 가져온다. 
+                task = conn.recv()
+                if task is None:
+                    # 종료 요청인 경우 
+                    break
+
+                # 분석 결과를 반환한다. 
+                # 직렬화된 결과(bytes)는 추가 pickle 없이 전달한다. 
+                conn.send_bytes(self.__analyze__(*task))
+
+                # 최대 작업 수를 처리하면 종료한다. (pool 에서 재생성됨)
+                tasks += 1
+                if max_tasks and tasks >= max_tasks:
+                    break
+
+        except EOFError:
+            # Dispatch 측 Pipe 가 닫힌 경우 
+            pass
 
-            # 전처리 
-            # Job을 가져온다. 
-            scanResult, scanObject = task_queue.get()
-            
+        except:
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+
+        finally:
+            conn.close()
+
+            # 처리 시간 지표를 기록한다. (jobs.start() 에서 병합)
+            metrics.dump()
+
+    def __analyze__(self, scanResult, scanObject):
+        """[summary]
+            작업 1건을 분석하고 직렬화된 분석 결과를 반환한다. 
+
+        Arguments:
+            scanResult {instance} -- [description] ScanResult 인스턴스
+            scanObject {instance} -- [description] ScanObject 인스턴스
+
+        Returns:
+            {bytes} -- [description] 직렬화된 분석 결과 (encode_result())
+        """
+        error = False
+        err_msg = ""
+        try:
             # 호출 모듈명을 저장한다. 
             scanObject.updateScanModule(self.__engine__)
 
@@ -413,10 +510,20 @@ class EngineProcess:
             # 분석 결과를 저장한다.             
             scanObject.updateResult(error, err_msg)
 
-            # 분석 결과를 반환한다. 
-            dict_data = scanObject.to_dict()
-            serialized_data = utils.convert_dict2serialize(dict_data)
-            result_queue.put(utils.compress(serialized_data))
+        # 분석 결과를 반환한다. 
+        try:
+            return encode_result(scanObject)
+
+        except:
+            # 직렬화할 수 없는 구조 정보가 있는 경우 
+            # 구조 정보를 제외하고 에러 상태로 반환한다. (분석 엔진 프로세스가 종료되지 않도록 전체 예외 처리)
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+            if scanObject.fformat:
+                scanObject.fformat.struct = {}
+            scanObject.updateResult(True, msg)
+            return encode_result(scanObject)
 
     def run(self, scanResult, scanObject):
         """[summary]
@@ -427,21 +534,81 @@ class EngineProcess:
         """
         pass
 
+def encode_result(scanObject, compress=None):
+    """[summary]
+        분석 엔진 프로세스에서 Dispatch 로 전달할 분석 결과를 직렬화한다. (codec.encode())
+
+    Arguments:
+        scanObject {instance} -- [description] ScanObject 인스턴스
+
+    Keyword Arguments:
+        compress {bool} -- [description] zlib 압축 여부, None 인 경우 config.result_compress_size 기준 (default: {None})
+
+    Returns:
+        {bytes} -- [description] 직렬화된 분석 결과
+    """
+    return codec.encode(scanObject, compress)
+
+def decode_result(data):
+    """[summary]
+        encode_result() 로 직렬화된 분석 결과를 복원한다. (codec.decode())
+
+    Arguments:
+        data {bytes} -- [description] 직렬화된 분석 결과
+
+    Returns:
+        {instance} -- [description] 분석 결과 (ScanObject 인스턴스)
+    """
+    return codec.decode(data)
+
+
+def get_child_data(child):
+    """[summary]
+        임베딩 파일 정보 (ScanObject.children) 의 메모리 데이터를 반환한다. 
+
+    Arguments:
+        child {dict} -- [description] 임베딩 파일 정보
+
+    Returns:
+        {bytes} -- [description] 메모리 데이터, 파일로 저장된 경우 None
+    """
+    data = child.get("child_data")
+    if isinstance(data, str):
+        # to_dict() 에서 Base64 로 변환된 경우 
+        return base64.b64decode(data)
+    return data
+
 
 #########################################################################################################
 # 파일/분석/결과 정보 클래스 
 #########################################################################################################
 class FileObject(object):
-    def __init__(self, fileName):
+    def __init__(self, fileName, data=None):
         # TODO : 인코딩
         # - 샘플 : 120604 전북도당 통합진보당 규약(6월 2주차).hwp_
         # - 에러 : Could not open file 
         self.__ori_name__ = utils.convert_ToUTF8(fileName)
         self.__name__ = self.__ori_name__
+        self.__data__ = data                                    # 메모리 데이터 (임베딩 파일), 있는 경우 파일을 읽지 않음, 결과에서 제외됨
+        self.__fp__ = None                                      # 파일 핸들, 프로세스간 전달/결과에서 제외됨
+        self.__view__ = None                                    # 읽기 전용 메모리 매핑, 프로세스간 전달/결과에서 제외됨
         self.__size__ = self.__get_size__()
-        self.__sha256__ = self.__get_sha256__()
+        self.__digests__ = {}                                   # 해시 목록, {알고리즘 : 해시}, 최초 요청시 계산됨
+        self.__sha256__ = ""
+
+    def __getstate__(self):
+        # 분석 엔진 프로세스로 전달할 때 파일 핸들과 메모리 매핑은 제외한다. 
+        state = dict(self.__dict__)
+        state["__fp__"] = None
+        state["__view__"] = None
+        return state
+
+    def __del__(self):
+        self.release_file_data()
 
     def __get_size__(self):
+        if self.__data__ is not None:
+            return len(self.__data__)
         return os.path.getsize(self.__name__)
 
     def __binary__(self):
@@ -459,12 +626,38 @@ class FileObject(object):
         finally:
             pass
 
-    def __get_sha256__(self):
-        sha256 = hashlib.sha256()
-        sha256.update(self.__binary__())
-        return sha256.hexdigest().upper()
+    def __get_digests__(self):
+        """[summary]
+            파일을 config.hash_chunk_size 단위로 1회 읽으면서 config.hash_algorithms 의 해시를 함께 계산한다. 
+
+            * SHA256 은 항상 계산한다. 
+            * 메모리 매핑된 데이터를 나눠서 읽으므로 파일 크기와 무관하게 사용 메모리가 제한된다. 
+
+        Returns:
+            {dict} -- [description] 해시 목록, {알고리즘 : 해시 (대문자)}
+        """
+        hashers = {"sha256" : utils.HashObject("sha256")}
+        for algorithm in config.hash_algorithms:
+            if algorithm in hashers:
+                continue
+
+            try:
+                hashers[algorithm] = utils.HashObject(algorithm)
+            except (utils.HashError, ValueError) as e:
+                # 지원하지 않거나 모듈이 설치되지 않은 알고리즘은 제외한다. 
+                Log.error(getattr(e, "msg", str(e)))
+
+        view = self.get_file_view()
+        for offset in range(0, len(view), config.hash_chunk_size):
+            chunk = view[offset:offset + config.hash_chunk_size]
+            for hasher in hashers.values():
+                hasher.update(chunk)
+
+        return {algorithm : hasher.hexdigest() for algorithm, hasher in hashers.items()}
 
     def update_file_name(self, new_fileName):
+        # 경로가 변경되면 이전 경로의 메모리 매핑을 해제한다. 
+        self.release_file_data()
         self.__name__ = utils.convert_ToUTF8(new_fileName)
 
     def get_ori_file_name(self):
@@ -476,11 +669,132 @@ class FileObject(object):
     def get_file_size(self):
         return self.__size__
 
+    def is_in_memory(self):
+        """[summary]
+            메모리 데이터로 생성된 파일인지 확인한다. (디스크에 저장되지 않은 임베딩 파일)
+        """
+        return self.__data__ is not None
+
+    def open_file(self):
+        """[summary]
+            파일 객체를 반환한다. 사용 후 close() 해야 한다. 
+
+            메모리 데이터로 생성된 경우 io.BytesIO 를 반환한다. 
+
+        Returns:
+            {instance} -- [description] 읽기 모드 파일 객체
+        """
+        if self.__data__ is not None:
+            return io.BytesIO(self.__data__)
+        return open(self.__name__, "rb")
+
+    def get_file_view(self):
+        """[summary]
+            파일의 읽기 전용 메모리 매핑을 반환한다. 
+
+            최초 요청시 매핑하며 이후 요청은 같은 매핑을 반환한다. (복사 없음)
+            슬라이스 (view[offset:offset + size]) 로 읽은 범위만 메모리에 올라온다. 
+
+        Returns:
+            {instance} -- [description] mmap.mmap 인스턴스, 빈 파일인 경우 b"", 메모리 데이터로 생성된 경우 해당 데이터
+        """
+        if self.__data__ is not None:
+            return self.__data__
+
+        if self.__view__ is None:
+            try:
+                fp = open(self.__name__, "rb")
+                try:
+                    self.__view__ = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                    self.__fp__ = fp
+                except ValueError:
+                    # 빈 파일은 매핑할 수 없다. 
+                    fp.close()
+                    self.__view__ = b""
+
+            except:
+                _, msg, obj = sys.exc_info()
+                msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+                raise SystemError(msg)
+
+            finally:
+                pass
+
+        return self.__view__
+
+    def read_file_data(self, offset=0, size=-1):
+        """[summary]
+            파일의 일부 데이터를 반환한다. 
+
+        Keyword Arguments:
+            offset {int} -- [description] 시작 위치 (default: {0})
+            size {int} -- [description] 크기 (default: {-1}, 파일 끝까지)
+
+        Returns:
+            {bytes} -- [description] 파일 데이터
+        """
+        view = self.get_file_view()
+        if size < 0:
+            return view[offset:]
+        return view[offset:offset + size]
+
     def get_file_data(self):
-        return self.__binary__()
+        """[summary]
+            파일 전체 데이터를 반환한다. 
+
+            일부만 필요한 경우 read_file_data() 또는 get_file_view() 를 사용한다. 
+
+        Returns:
+            {bytes} -- [description] 파일 데이터
+        """
+        return self.read_file_data()
+
+    def release_file_data(self):
+        """[summary]
+            메모리 매핑과 파일 핸들을 해제한다. 
+        """
+        view = getattr(self, "__view__", None)
+        if view is not None and not isinstance(view, bytes):
+            view.close()
+        self.__view__ = None
+
+        fp = getattr(self, "__fp__", None)
+        if fp is not None:
+            fp.close()
+        self.__fp__ = None
+
+    def get_file_digest(self, algorithm):
+        """[summary]
+            파일 해시를 반환한다. 
+
+        Arguments:
+            algorithm {str} -- [description] 해시 알고리즘 (config.hash_algorithms)
+
+        Returns:
+            {str} -- [description] 파일 해시, 계산되지 않은 알고리즘인 경우 ""
+        """
+        return self.get_file_digests().get(algorithm, "")
+
+    def get_file_digests(self):
+        """[summary]
+            파일 해시 목록을 반환한다. 최초 요청시 계산한다. 
+
+        Returns:
+            {dict} -- [description] 해시 목록, {알고리즘 : 해시}
+        """
+        if not self.__digests__:
+            self.__digests__ = self.__get_digests__()
+            self.__sha256__ = self.__digests__.get("sha256", "")
+        return self.__digests__
+
+    def get_file_md5(self):
+        return self.get_file_digest("md5")
+
+    def get_file_sha1(self):
+        return self.get_file_digest("sha1")
 
     def get_file_sha256(self):
-        return self.__sha256__
+        return self.get_file_digest("sha256")
 
 class ResultObject(object):
     def __init__(self):
@@ -544,6 +858,21 @@ class FormatObject:
         else:
             raise AttributeError("{} is not exists in FormatObject.".format(key))
 
+    def inherit(self):
+        """[summary]
+            struct 를 제외한 포멧 정보를 상속받은 FormatObject 를 생성한다. (Root 파일 포멧 상속)
+
+            * 포멧 정보 (Yara 룰 meta) 는 변경되지 않으므로 복사하지 않고 공유한다. 
+            * struct 는 빈 dict 로 새로 생성한다. 
+
+        Returns:
+            {instance} -- [description] FormatObject 인스턴스
+        """
+        formatObject = FormatObject.__new__(FormatObject)
+        formatObject.__dict__.update(self.__dict__)
+        formatObject.struct = {}
+        return formatObject
+
     def updateStruct(self, key, value):
         if isinstance(value, dict):
             tmp_dict = self.struct.get(key, {})
@@ -553,8 +882,8 @@ class FormatObject:
         else:
             self.struct.update({key : value})
 
-    def get(self, dict_data={}):
-        if not dict_data:
+    def get(self, dict_data=None):
+        if dict_data is None:
             dict_data = self.__dict__
         
         result_data = utils.deepcopy(dict_data)
@@ -573,9 +902,9 @@ class FormatObject:
         return result_data
     
 class ScanObject(FileObject):
-    def __init__(self, fileName="", uniqID="", depth=0, parentID="", parentName="", fformat=None, internal_path=""):
+    def __init__(self, fileName="", uniqID="", depth=0, parentID="", parentName="", fformat=None, internal_path="", data=None):
         # 파일 기본 정보를 생성한다. 
-        FileObject.__init__(self, fileName)
+        FileObject.__init__(self, fileName, data)
 
         self.uniqID = uniqID if uniqID else str(uuid.uuid4())   # 식별 고유값
         self.depth = depth                                      # Recursive 확인
@@ -586,6 +915,7 @@ class ScanObject(FileObject):
 
         self.scan_module = []                                   # 처리한 엔진명
         self.children = {}                                      # 임베딩 파일 정보 
+        self.__children_index__ = {}                            # 임베딩 파일 우선순위 인덱스 {priority : [uniqID, ...]}
 
         self.result = ResultObject()                            # 처리 결과, 분석 엔진에서만 접근 (error, err_msg)
 
@@ -666,6 +996,39 @@ class ScanObject(FileObject):
         """
         return self.get_children().get(uniqID, {}).get("internal_path", [])     
 
+    def __get_children_index__(self):
+        """[summary]
+            임베딩 파일 우선순위 인덱스를 반환한다. 
+
+            * updateChildren() 에서 유지되며 직렬화 (to_dict()) 에서는 제외된다. 
+              인덱스가 없거나 임베딩 파일 목록과 다른 경우 1회 순회해 다시 생성한다. 
+
+        Returns:
+            {dict} -- [description] {priority : [uniqID, ...]}
+        """
+        index = getattr(self, "__children_index__", None)
+        if index is None or sum(len(uniqIDs) for uniqIDs in index.values()) != len(self.children):
+            index = {}
+            for uniqID, child in self.children.items():
+                index.setdefault(child.get("priority", 0), []).append(uniqID)
+            self.__children_index__ = index
+
+        return index
+
+    def iter_children_by_priority(self):
+        """[summary]
+            우선순위가 높은 순서대로 임베딩 파일 목록을 반환한다. 
+
+            * 동일 우선순위의 임베딩 파일은 추가된 순서를 유지한다. 
+            * 우선순위는 config.PRIORITY_LEVEL 외 임의의 숫자를 사용할 수 있다. 
+
+        Returns:
+            {generator} -- [description] (우선순위, {uniqID : child})
+        """
+        index = self.__get_children_index__()
+        for priority in sorted(index, reverse=True):
+            yield priority, {uniqID : self.children[uniqID] for uniqID in index[priority]}
+
     def get_children_by_priority(self, children, level):
         """[summary]
             Children 에서 특정 우선 순위를 갖는 Child를 반환한다. 
@@ -673,19 +1036,24 @@ class ScanObject(FileObject):
             children {dict} -- [description] 전체 Children 목록
             level {int} -- [description] 우선순위 레벨
         """
+        # 저장된 임베딩 파일 목록인 경우 우선순위 인덱스를 사용한다. 
+        if children is self.children:
+            return {uniqID : children[uniqID] for uniqID in self.__get_children_index__().get(level, [])}
+
         result = {}
         for uniqID, child in children.items():
             if child.get("priority", 0) == level:
                 result.update({uniqID : child})
         return result
 
-    def updateChildren(self, fileName, internal_path=[], priority=config.default_priority):
+    def updateChildren(self, fileName, internal_path=[], priority=config.default_priority, data=None):
         """[summary]
             임베딩된 데이터가 있을 경우 저장되는 데이터
             - uniqID
             - 추출된 파일의 파일명
             - 내부 구조
             - 분석 우선순위
+            - 메모리 데이터 (파일로 저장하지 않은 경우)
             
             * 저장형식 : dict
 
@@ -694,6 +1062,7 @@ class ScanObject(FileObject):
         
         Keyword Arguments:
             internal_path {list} -- [description] 내부 경로, depth에 따라 split해서 저장됨 (default: {[]})
+            data {bytes} -- [description] 메모리 데이터, 있는 경우 fileName 은 식별용 경로로만 사용됨 (default: {None})
         """
         fileName = utils.convert_ToUTF8(fileName)
         if not isinstance(fileName, str):
@@ -702,16 +1071,27 @@ class ScanObject(FileObject):
         if not isinstance(internal_path, list):
             raise TypeError("child's internal path type must be list. (type: {})".format(str(type(internal_path))))
 
+        if not isinstance(priority, (int, float)):
+            raise TypeError("child's priority type must be number. (type: {})".format(str(type(priority))))
+
         new_internal_path = []
         for _path in internal_path:
             new_path = utils.convert_ToUTF8(_path)
             new_internal_path.append(new_path)
 
-        self.children.update({str(uuid.uuid4()) : {
+        child = {
             "child_name" : fileName,
             "internal_path" : new_internal_path,
             "priority" : priority
-        }})
+        }
+        if data is not None:
+            child["child_data"] = data
+
+        index = self.__get_children_index__()
+
+        uniqID = str(uuid.uuid4())
+        self.children.update({uniqID : child})
+        index.setdefault(priority, []).append(uniqID)
 
     def get_structure(self):
         return self.fformat.struct
@@ -768,17 +1148,53 @@ class ScanObject(FileObject):
         return self.internal_path
 
     def to_dict(self):
-        result = self.__dict__
+        # 해시를 계산하지 않은 경우 계산한다. 
+        self.get_file_digests()
+
+        result = dict(self.__dict__)
+        result.pop("__data__", None)
+        result.pop("__fp__", None)
+        result.pop("__view__", None)
+        result.pop("__children_index__", None)
         for key, value in self.__dict__.items():
             if isinstance(value, (FormatObject, ResultObject)):
                 result[key] = value.get()
+
+        # 메모리 데이터로 전달되는 임베딩 파일은 직렬화할 수 있도록 Base64 로 변환한다. 
+        result["children"] = {}
+        for uniqID, child in self.children.items():
+            child = dict(child)
+            if isinstance(child.get("child_data"), bytes):
+                child["child_data"] = base64.b64encode(child["child_data"]).decode("ascii")
+            result["children"][uniqID] = child
                 
         return result
 
+class SummaryObject:
+    """[summary]
+        결과 저장 프로세스로 출력이 완료된 ScanObject 의 요약 정보 (ScanResult.release())
+    """
+    def __init__(self, scanObject):
+        self.uniqID = scanObject.get_uid()                              # 식별 고유값
+        self.parentID = scanObject.get_parentID()                       # Parent 고유값
+        self.sha256 = scanObject.get_file_sha256()                      # SHA256
+        self.fformat = getattr(scanObject.get_fformat(), "name", "")    # 포멧명
+        self.error = getattr(scanObject.get_result(), "error", False)   # 분석 에러 여부
+
+    def get_uid(self):
+        return self.uniqID
+
+    def get_parentID(self):
+        return self.parentID
+
+    def get(self):
+        return dict(self.__dict__)
+
 class ScanResult:
-    def __init__(self, rootUID=""):
+    def __init__(self, rootUID="", work_path=""):
         self.rootUID = rootUID      # self.files 에 첫번째 저장되는 파일의 uniqID로 설정한다. 
-        self.files = {}             # {uniqID : <scanObject> }
+        self.work_path = work_path  # Job 단위 작업 폴더 (Work.__make_work_path__())
+        self.files = {}             # {uniqID : <scanObject> }, 출력이 완료된 경우 {uniqID : <summaryObject>}
         self.startTime = 0          # ScanResult 초기화 후 설정된다. 
         self.endTime = 0            # 분석 완료 후 설정된다. 
         self.result = {             # 분석 완료에 대한 로그를 저장한다. 
@@ -850,6 +1266,85 @@ class ScanResult:
         """
         return self.rootUID
 
+    def get_work_path(self):
+        """[summary]
+            Job 단위 작업 폴더를 반환한다. 
+
+            작업 폴더가 없는 경우 <temp_path>\\<embedding> 을 반환한다. 
+
+        Returns:
+            {str} -- [description] 작업 폴더 경로
+        """
+        if self.work_path:
+            return self.work_path
+        return os.path.join(config.temp_path, config.dir_q_monitor.get("embedding"))
+
+    def fork(self):
+        """[summary]
+            임베딩 파일 병렬 Dispatch 에 사용할 ScanResult 를 생성한다. 
+
+            * 현재까지의 분석 결과 (Root, 상위 우선순위 임베딩 파일) 는 참조할 수 있도록 복사한다. 
+            * 새로 추가되는 분석 결과는 merge() 로 원본 ScanResult 에 병합한다. 
+
+        Returns:
+            {instance} -- [description] ScanResult 인스턴스
+        """
+        scanResult = ScanResult(self.rootUID, self.work_path)
+        scanResult.files = dict(self.files)
+        scanResult.startTime = self.startTime
+        scanResult.result = dict(self.result)
+        return scanResult
+
+    def merge(self, scanResult):
+        """[summary]
+            fork() 로 생성한 ScanResult 의 분석 결과를 병합한다. 
+
+            * 분석 결과는 fork() 에 추가된 순서대로 병합한다. 
+            * 에러가 발생한 경우 에러로그를 병합한다. (먼저 발생한 에러로그 유지)
+
+        Arguments:
+            scanResult {instance} -- [description] fork() 로 생성한 ScanResult 인스턴스
+        """
+        for uniqID, scanObject in scanResult.files.items():
+            if uniqID not in self.files:
+                self.files[uniqID] = scanObject
+
+        if scanResult.result.get("error") and not self.result.get("error"):
+            self.result = dict(scanResult.result)
+
+    def release(self, uniqID):
+        """[summary]
+            분석 결과를 요약 정보 (SummaryObject) 로 교체한다. (임베딩 파일 분석 결과 점진 출력)
+
+            * 교체된 ScanObject 는 다른 파일의 분석에 참조되지 않아야 한다. 
+
+        Arguments:
+            uniqID {str} -- [description] 파일 고유값
+
+        Returns:
+            {instance} -- [description] 교체된 ScanObject 인스턴스, 없거나 이미 교체된 경우 None
+        """
+        scanObject = self.files.get(uniqID, None)
+        if not isinstance(scanObject, ScanObject):
+            return None
+
+        self.files[uniqID] = SummaryObject(scanObject)
+        return scanObject
+
+    def get_summary(self):
+        """[summary]
+            파일별 요약 정보를 반환한다. (uniqID, parentID, sha256, fformat, error)
+
+        Returns:
+            {list} -- [description] 요약 정보 목록 (분석 순서)
+        """
+        result = []
+        for fileObject in self.files.values():
+            if isinstance(fileObject, ScanObject):
+                fileObject = SummaryObject(fileObject)
+            result.append(fileObject.get())
+        return result
+
     def get_root_type(self):
         rootObject = self.files.get(self.rootUID, None)
         if rootObject:
@@ -862,6 +1357,6 @@ class ScanResult:
             파일 목록을 반환한다. 
 
         Returns:
-            {list} -- [description] 파일 목록 (임베딩 파일 포함)
+            {list} -- [description] 파일 목록 (임베딩 파일 포함), 출력이 완료된 파일은 SummaryObject
         """
         return self.files
\ No newline at end of file
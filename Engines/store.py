@@ -0,0 +1,403 @@
+# -*- coding:utf-8 -*-
+#
+# 작성자 : 김승언
+#
+# 용도 : 분석 결과 저장소 모듈
+# 설명 : 결과 저장 프로세스 (sink) 가 출력한 분석 결과를 SQLite 에 저장하고 조회하는 모듈
+#
+#   * 테이블
+#       - objects : 분석 대상 파일 (Root, 임베딩 파일) 1건 1행
+#       - edges : 부모 파일 -> 임베딩 파일 (ScanObject.children)
+#       - fields : 구조 정보 (FormatObject.struct) 의 값 1개 1행, 경로는 "/" 로 구분한다.
+#                  (Ex. Engines.CompoundFileBinaryFormat.FileHeader/properties/is_password)
+#       - jobs : Job 완료 정보 (Root 파일)
+#   * 인덱스 : objects (sha256, fformat, parentID, rootUID, stream), edges (childID),
+#              fields (path, value), fields (name, value), fields (uniqID)
+#       - stream, name 은 경로의 마지막 항목으로 경로 끝부분 일치 조회시 사용한다. (LIKE 는 인덱스 조회 후 확인만 함)
+#   * 결과 저장 프로세스에서만 기록한다. (WAL 모드, 배치 단위 bulk insert)
+#
+#   사용법 : python kei.py query [--sha256 <SHA256>] [--format <포멧명>] [--parent <uniqID>]
+#                                [--stream <내부 경로>] [--field <경로>[=|!=<값>]] [--limit 100]
+#
+# 개발 Log
+# 2026.10.18    버전 0.0.1      [개발] 프로토타입
+#
+
+__version__ = "0.0.1"
+__author__ = "amanaksu@gmail.com"
+
+# 내장 라이브러리
+import json
+import os
+import sqlite3
+import sys
+
+# 서드파티 라이브러리
+
+# 고유 라이브러리
+from Engines import Log, gateway
+
+import config
+
+
+#########################################################################################################
+# 전역 변수
+# - STORE_VERSION 은 테이블 구조가 변경되면 증가시킨다. (PRAGMA user_version)
+# - __skip_prefix__ 로 시작하는 구조 정보 키 (엔진 정보, 구조 정의) 는 저장하지 않는다.
+#########################################################################################################
+STORE_VERSION = 1
+
+__skip_prefix__ = "__"
+__columns__ = ["uniqID", "rootUID", "job", "parentID", "fformat", "sha256", "internal_path", "file_name"]
+
+__schema__ = [
+    """CREATE TABLE IF NOT EXISTS objects (
+            uniqID          TEXT PRIMARY KEY,
+            rootUID         TEXT NOT NULL,
+            parentID        TEXT NOT NULL,
+            depth           INTEGER NOT NULL,
+            file_name       TEXT NOT NULL,
+            size            INTEGER NOT NULL,
+            sha256          TEXT NOT NULL,
+            md5             TEXT NOT NULL,
+            fformat         TEXT NOT NULL,
+            file_type       TEXT NOT NULL,
+            scan_module     TEXT NOT NULL,
+            internal_path   TEXT NOT NULL,
+            stream          TEXT NOT NULL,
+            error           INTEGER NOT NULL,
+            err_msg         TEXT NOT NULL
+       )""",
+    """CREATE TABLE IF NOT EXISTS edges (
+            parentID        TEXT NOT NULL,
+            childID         TEXT NOT NULL,
+            internal_path   TEXT NOT NULL,
+            priority        INTEGER NOT NULL,
+            PRIMARY KEY (parentID, childID)
+       )""",
+    """CREATE TABLE IF NOT EXISTS fields (
+            uniqID          TEXT NOT NULL,
+            path            TEXT NOT NULL,
+            name            TEXT NOT NULL,
+            value           TEXT
+       )""",
+    """CREATE TABLE IF NOT EXISTS jobs (
+            rootUID         TEXT PRIMARY KEY,
+            job             TEXT NOT NULL,
+            startTime       TEXT NOT NULL,
+            endTime         TEXT NOT NULL,
+            error           INTEGER NOT NULL,
+            files           INTEGER NOT NULL
+       )""",
+    "CREATE INDEX IF NOT EXISTS idx_objects_sha256 ON objects (sha256)",
+    "CREATE INDEX IF NOT EXISTS idx_objects_fformat ON objects (fformat)",
+    "CREATE INDEX IF NOT EXISTS idx_objects_parentID ON objects (parentID)",
+    "CREATE INDEX IF NOT EXISTS idx_objects_rootUID ON objects (rootUID)",
+    "CREATE INDEX IF NOT EXISTS idx_objects_stream ON objects (stream)",
+    "CREATE INDEX IF NOT EXISTS idx_edges_childID ON edges (childID)",
+    "CREATE INDEX IF NOT EXISTS idx_fields_path_value ON fields (path, value)",
+    "CREATE INDEX IF NOT EXISTS idx_fields_name_value ON fields (name, value)",
+    "CREATE INDEX IF NOT EXISTS idx_fields_uniqID ON fields (uniqID)"
+]
+
+
+class ResultStoreError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+
+#########################################################################################################
+# 레코드 변환
+# - sink.object_record() / sink.root_record() 로 출력된 JSON 을 테이블 행으로 변환한다.
+#########################################################################################################
+def _path(internal_path):
+    if isinstance(internal_path, (list, tuple)):
+        return "/".join(str(name) for name in internal_path)
+    return str(internal_path or "")
+
+def _leaf(path):
+    return path.rsplit("/", 1)[-1]
+
+def _like(value):
+    """[summary]
+        LIKE 특수문자 (%, _) 를 escape 한다. (ESCAPE '\\')
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _value(value):
+    """[summary]
+        구조 정보 값을 TEXT 로 변환한다. (config.result_store_field_size 까지 저장)
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, bool):
+        value = int(value)
+
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False)
+    else:
+        value = str(value)
+
+    if config.result_store_field_size and len(value) > config.result_store_field_size:
+        value = value[:config.result_store_field_size]
+    return value
+
+def _flatten(uniqID, struct, prefix="", rows=None):
+    """[summary]
+        구조 정보를 (uniqID, 경로, 항목명, 값) 목록으로 변환한다.
+
+        * dict 는 하위 키로 펼치고 list 는 JSON 으로 저장한다.
+    """
+    if rows is None:
+        rows = []
+
+    for key, value in struct.items():
+        key = str(key)
+        if key.startswith(__skip_prefix__):
+            continue
+
+        path = "{}/{}".format(prefix, key) if prefix else key
+        if isinstance(value, dict):
+            _flatten(uniqID, value, path, rows)
+        else:
+            rows.append((uniqID, path, key, _value(value)))
+
+    return rows
+
+def _object_rows(rootUID, dict_data):
+    """[summary]
+        분석 대상 파일 레코드를 objects, edges, fields 행으로 변환한다.
+
+    Returns:
+        {tuple} -- [description] (objects 행, edges 행 목록, fields 행 목록)
+    """
+    internal_path = _path(dict_data.get("internal_path", []))
+    uniqID = dict_data.get("uniqID", "")
+    fformat = dict_data.get("fformat") or {}
+    result = dict_data.get("result") or {}
+    digests = dict_data.get("__digests__") or {}
+
+    row = (uniqID,
+           rootUID,
+           dict_data.get("parentID", ""),
+           dict_data.get("depth", 0),
+           os.path.basename(dict_data.get("__ori_name__", "") or ""),
+           dict_data.get("__size__", 0) or 0,
+           dict_data.get("__sha256__", "") or digests.get("sha256", ""),
+           digests.get("md5", ""),
+           fformat.get("name", ""),
+           fformat.get("file_type", ""),
+           ",".join(dict_data.get("scan_module", [])),
+           internal_path,
+           _leaf(internal_path),
+           int(bool(result.get("error", False))),
+           result.get("err_msg", "") or "")
+
+    edges = [(uniqID, childID, _path(child.get("internal_path", [])), child.get("priority", 0))
+             for childID, child in (dict_data.get("children") or {}).items()]
+
+    fields = _flatten(uniqID, fformat.get("struct") or {})
+    return row, edges, fields
+
+def _job_row(record):
+    result = record.get("result") or {}
+    return (record.get("rootUID", ""),
+            record.get("job", ""),
+            str(record.get("startTime", "")),
+            str(record.get("endTime", "")),
+            int(bool(result.get("error", False))),
+            len(record.get("files", [])))
+
+
+#########################################################################################################
+# 분석 결과 저장소
+#########################################################################################################
+class ResultStore:
+    def __init__(self, store_path=config.result_store_path):
+        self.store_path = store_path
+
+        # 저장소 폴더가 없는 경우 생성한다.
+        store_dir = os.path.dirname(store_path)
+        if store_dir and not os.path.exists(store_dir):
+            os.makedirs(store_dir)
+
+        self.conn = sqlite3.connect(store_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version and version != STORE_VERSION:
+            raise ResultStoreError("unsupported store version. (store: {}, current: {})".format(version, STORE_VERSION))
+
+        for sql in __schema__:
+            self.conn.execute(sql)
+        self.conn.execute("PRAGMA user_version = {}".format(STORE_VERSION))
+        self.conn.commit()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def insert(self, records):
+        """[summary]
+            출력 레코드 목록을 하나의 트랜잭션으로 저장한다.
+
+        Arguments:
+            records {list} -- [description] sink 출력 레코드 (dict) 목록
+
+        Returns:
+            {int} -- [description] 저장된 분석 대상 파일 수
+        """
+        objects, edges, fields, jobs = [], [], [], []
+        for record in records:
+            if record.get("type") == "object":
+                row, edge_rows, field_rows = _object_rows(record.get("rootUID", ""), record.get("object") or {})
+                objects.append(row)
+                edges.extend(edge_rows)
+                fields.extend(field_rows)
+            elif record.get("type") == "root":
+                jobs.append(_job_row(record))
+
+        with self.conn:
+            # 같은 uniqID 가 다시 저장되는 경우 이전 구조 정보를 삭제한다.
+            self.conn.executemany("DELETE FROM fields WHERE uniqID = ?", [(row[0],) for row in objects])
+            self.conn.executemany("INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", objects)
+            self.conn.executemany("INSERT OR REPLACE INTO edges VALUES (?, ?, ?, ?)", edges)
+            self.conn.executemany("INSERT INTO fields VALUES (?, ?, ?, ?)", fields)
+            self.conn.executemany("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)", jobs)
+
+        return len(objects)
+
+    def insert_lines(self, items):
+        """[summary]
+            결과 큐 항목 (JSON 줄 묶음) 을 저장한다. (sink._writer_main())
+
+        Arguments:
+            items {list} -- [description] 줄바꿈 문자로 구분된 JSON 목록
+        """
+        records = []
+        for item in items:
+            # JSON 내 줄바꿈 문자는 escape 되므로 "\n" 으로만 구분한다.
+            for line in item.split("\n"):
+                if line:
+                    records.append(json.loads(line))
+        return self.insert(records)
+
+    def query(self, sha256="", fformat="", parentID="", stream="", field="", limit=100):
+        """[summary]
+            조건에 맞는 분석 대상 파일 목록을 반환한다. (조건은 AND)
+
+        Keyword Arguments:
+            sha256 {str} -- [description] 파일 SHA256 (default: {""})
+            fformat {str} -- [description] 포멧명 (FormatObject.name) (default: {""})
+            parentID {str} -- [description] 부모 파일 uniqID (default: {""})
+            stream {str} -- [description] 내부 경로 (Ex. BodyText/Section0), 경로 끝부분 일치 (default: {""})
+            field {str} -- [description] 구조 정보 경로 [=|!= 값], 경로 끝부분 일치 (default: {""})
+            limit {int} -- [description] 최대 결과 수 (default: {100})
+
+        Returns:
+            {list} -- [description] {uniqID, rootUID, job, parentID, fformat, sha256, internal_path, file_name} 목록
+        """
+        where, params = [], []
+        if sha256:
+            where.append("o.sha256 = ?")
+            params.append(sha256.upper())
+
+        if fformat:
+            where.append("o.fformat = ?")
+            params.append(fformat)
+
+        if parentID:
+            where.append("o.parentID = ?")
+            params.append(parentID)
+
+        # 경로 끝부분 일치는 마지막 항목 (인덱스) 으로 찾은 후 전체 경로를 확인한다. 
+        if stream:
+            stream = stream.strip("/")
+            where.append("o.stream = ? AND (o.internal_path = ? OR o.internal_path LIKE ? ESCAPE '\\')")
+            params.extend([_leaf(stream), stream, "%/" + _like(stream)])
+
+        if field:
+            path, op, value = parse_field(field)
+            path = path.strip("/")
+            sql = "SELECT f.uniqID FROM fields f WHERE f.name = ? AND (f.path = ? OR f.path LIKE ? ESCAPE '\\')"
+            params.extend([_leaf(path), path, "%/" + _like(path)])
+            if op:
+                sql += " AND f.value {} ?".format(op)
+                params.append(value)
+            where.append("o.uniqID IN ({})".format(sql))
+
+        sql = """SELECT o.uniqID, o.rootUID, IFNULL(j.job, ''), o.parentID, o.fformat, o.sha256, o.internal_path, o.file_name
+                 FROM objects o LEFT JOIN jobs j ON j.rootUID = o.rootUID"""
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if limit:
+            sql += " LIMIT {}".format(int(limit))
+
+        return [dict(zip(__columns__, row)) for row in self.conn.execute(sql, params)]
+
+
+def parse_field(field):
+    """[summary]
+        구조 정보 조건을 (경로, 연산자, 값) 으로 분리한다.
+
+        * <경로> : 값과 무관하게 경로가 있는 경우
+        * <경로>=<값>, <경로>!=<값> : 값 비교 (TEXT)
+    """
+    for op in ["!=", "="]:
+        if op in field:
+            path, value = field.split(op, 1)
+            return path.strip(), op, value.strip()
+    return field.strip(), "", ""
+
+def open_store(store_path=None):
+    """[summary]
+        분석 결과 저장소를 연다. (결과 저장 프로세스, kei.py query)
+
+    Keyword Arguments:
+        store_path {str} -- [description] SQLite 파일 경로 (default: {config.result_store_path})
+
+    Returns:
+        {instance} -- [description] ResultStore 인스턴스, 실패한 경우 None
+    """
+    try:
+        return ResultStore(store_path or config.result_store_path)
+
+    except ResultStoreError as e:
+        Log.error(e.msg)
+        return None
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return None
+
+    finally:
+        pass
+
+@gateway
+def query(store_path=None, **kwargs):
+    """[summary]
+        분석 결과 저장소를 조회한다. (ResultStore.query())
+
+    Returns:
+        {list} -- [description] 조회 결과, 실패한 경우 빈 목록
+    """
+    result_store = open_store(store_path)
+    if result_store is None:
+        return []
+
+    try:
+        return result_store.query(**kwargs)
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return []
+
+    finally:
+        result_store.close()
@@ -10,27 +10,48 @@
 # 2018.08.07    버전 0.0.6      [개발] Encode/Decode 함수 추가 
 # 2018.08.08    버전 0.0.7      [수정] yara_on_demand() : Yara 폴더 -> Yara 폴더 및 파일
 # 2018.08.20    버전 0.0.8      [개발] deepcopy()
-
-__version__ = "0.0.8"
+# 2026.10.18    버전 0.0.9      [개발] Yara 룰 컴파일 캐시 (yara_compile())
+# 2026.10.18    버전 0.0.10     [개발] 컴파일된 Yara 룰 번들 생성/로드 (yara_build_bundle(), yara_load_bundle())
+# 2026.10.18    버전 0.0.11     [수정] yara_on_demand() : 메모리 데이터 검사 지원
+# 2026.10.18    버전 0.0.12     [개발] HashObject : 스트리밍 해시 (hashlib, ssdeep, TLSH)
+# 2026.10.18    버전 0.0.13     [개발] yara_rules_digest() : 분석 결과 캐시 키용 룰셋 해시
+# 2026.10.18    버전 0.0.14     [개발] iter_file_list(), iter_file_path_in_folder() : os.scandir() 기반 파일 목록 Generator
+# 2026.10.18    버전 0.0.15     [개발] FolderCrawler : 멀티 스레드 폴더 탐색
+
+__version__ = "0.0.15"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
 import codecs
 import copy
+import hashlib
 import importlib
+import io
 import json
 import multiprocessing
 import os
+import queue
 import shutil
 import struct
 import sys
 import tempfile
+import threading
 import uuid
 import yara
 import zipfile
 import zlib
 
 # 서드파티 라이브러리 
+# - ssdeep, tlsh 는 config.hash_algorithms 에 설정된 경우에만 필요하다. 
+try:
+    import ssdeep
+except ImportError:
+    ssdeep = None
+
+try:
+    import tlsh
+except ImportError:
+    tlsh = None
 
 # 고유 라이브러리 
 from Engines import Log, gateway
@@ -301,6 +322,63 @@ def readNumber(endian, data, data_type, offset, size):
 
 
 
+#########################################################################################################
+# 해시 함수
+#########################################################################################################
+class HashError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+class HashObject:
+    """[summary]
+        데이터를 나눠서 입력받아 해시를 계산한다. 
+
+        * 지원 알고리즘 : hashlib 알고리즘 (md5, sha1, sha256, ...), ssdeep, tlsh
+    """
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.error = False
+
+        if algorithm == "ssdeep":
+            if not ssdeep:
+                raise HashError("ssdeep module is not installed.")
+            self.hasher = ssdeep.Hash()
+
+        elif algorithm == "tlsh":
+            if not tlsh:
+                raise HashError("tlsh module is not installed.")
+            self.hasher = tlsh.Tlsh()
+
+        else:
+            self.hasher = hashlib.new(algorithm)
+
+    def update(self, data):
+        self.hasher.update(data)
+
+    def hexdigest(self):
+        """[summary]
+            계산된 해시를 반환한다. 
+
+        Returns:
+            {str} -- [description] 해시 (hashlib 알고리즘은 대문자), 계산할 수 없는 경우 ""
+        """
+        try:
+            if self.algorithm == "ssdeep":
+                return self.hasher.digest()
+
+            elif self.algorithm == "tlsh":
+                # TLSH 는 최소 데이터 크기(50 Byte) 미만이거나 데이터가 단순한 경우 계산되지 않는다. 
+                self.hasher.final()
+                digest = self.hasher.hexdigest()
+                return "" if digest == "TNULL" else digest
+
+            else:
+                return self.hasher.hexdigest().upper()
+
+        except ValueError:
+            return ""
+
+
 #########################################################################################################
 # Yara 룰 함수
 #########################################################################################################
@@ -354,14 +432,280 @@ def _yara_group(yaraList):
     finally:
         pass
 
+#########################################################################################################
+# Yara 룰 컴파일 캐시
+# - 프로세스 단위로 컴파일된 룰을 보관한다. 
+# - 키 : Yara 룰 경로 (폴더, 파일)
+# - 값 : (룰 파일 서명, 컴파일된 룰)
+#   * 룰 파일 서명은 룰 파일별 (경로, 수정시간, SHA256) 목록으로 룰 파일이 변경되면 다시 컴파일한다. 
+#########################################################################################################
+__yara_cache__ = {}
+__yara_file_hash__ = {}             # {경로 : (수정시간, 크기, SHA256)}, 수정되지 않은 룰 파일의 재해시 방지
+__yara_cache_stats__ = {
+    "hit"       :   0,
+    "miss"      :   0
+}
+__yara_cache_lock__ = threading.Lock()
+
 @gateway
-def yara_on_demand(yara_rule_path, fileName):
+def _yara_file_list(yara_rule_path):
+    """[summary]
+        Yara 룰 경로(폴더, 파일)에서 룰 파일 목록을 가져온다. 
+
+    Arguments:
+        yara_rule_path {str} -- [description] Yara 파일 경로 (폴더, 파일)
+
+    Returns:
+        {list} -- [description] Yara 룰 파일 목록 (정렬됨)
+    """
+    if is_file(yara_rule_path):
+        return [yara_rule_path]
+    else:
+        return sorted(get_file_path_in_folder(yara_rule_path))
+
+@gateway
+def _yara_signature(yaraList):
+    """[summary]
+        Yara 룰 파일 목록의 서명을 생성한다. 
+
+        * 서명 형식 : ((경로, 수정시간, SHA256), ...)
+        * 수정시간과 크기가 같은 파일은 이전에 계산한 SHA256 을 재사용한다. 
+
+    Arguments:
+        yaraList {list} -- [description] Yara 룰 파일 목록
+
+    Returns:
+        {tuple} -- [description] 룰 파일 서명
+    """
+    signature = []
+    for yara_file in yaraList:
+        stat = os.stat(yara_file)
+        cached = __yara_file_hash__.get(yara_file)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            sha256 = cached[2]
+        else:
+            with open(yara_file, "rb") as fp:
+                sha256 = hashlib.sha256(fp.read()).hexdigest().upper()
+            __yara_file_hash__[yara_file] = (stat.st_mtime, stat.st_size, sha256)
+
+        signature.append((yara_file, stat.st_mtime, sha256))
+
+    return tuple(signature)
+
+@gateway
+def yara_compile(yara_rule_path):
+    """[summary]
+        Yara 룰을 컴파일한다. 
+        
+        컴파일된 룰은 프로세스 단위로 캐시하며 룰 파일이 변경된 경우에만 다시 컴파일한다. 
+
+    Arguments:
+        yara_rule_path {str} -- [description] Yara 파일 경로 (폴더, 파일)
+
+    Returns:
+        {instance} -- [description] yara.Rules 인스턴스
+    """
+    with __yara_cache_lock__:
+        # 컴파일을 위한 형식(dict)으로 변환한다. 
+        yaraList = _yara_file_list(yara_rule_path)
+        signature = _yara_signature(yaraList)
+
+        # 캐시된 룰을 확인한다. 
+        cached = __yara_cache__.get(yara_rule_path)
+        if cached and cached[0] == signature:
+            __yara_cache_stats__["hit"] += 1
+            return cached[1]
+
+        # 캐시된 룰이 없거나 룰 파일이 변경된 경우 
+        # 컴파일한다. 
+        __yara_cache_stats__["miss"] += 1
+        rules = yara.compile(filepaths=_yara_group(yaraList))
+        __yara_cache__[yara_rule_path] = (signature, rules)
+
+        Log.debug("compiled yara rules. ({})".format(yara_rule_path))
+        return rules
+
+def get_yara_cache_stats():
+    """[summary]
+        Yara 룰 컴파일 캐시의 Hit/Miss 횟수를 반환한다. 
+
+    Returns:
+        {dict} -- [description] {"hit" : int, "miss" : int}
+    """
+    return dict(__yara_cache_stats__)
+
+def clear_yara_cache():
+    """[summary]
+        Yara 룰 컴파일 캐시를 초기화한다. 
+    """
+    with __yara_cache_lock__:
+        __yara_cache__.clear()
+        __yara_file_hash__.clear()
+
+@gateway
+def yara_rules_digest(yara_rule_path):
+    """[summary]
+        Yara 룰셋의 내용 기반 해시를 반환한다. 
+
+        * 룰 파일 경로와 수정시간은 제외하고 룰 파일별 SHA256 만 사용한다. 
+
+    Arguments:
+        yara_rule_path {str} -- [description] Yara 파일 경로 (폴더, 파일)
+
+    Returns:
+        {str} -- [description] 룰셋 해시 (SHA256), 룰셋이 없는 경우 ""
+    """
+    if not yara_rule_path:
+        return ""
+
+    with __yara_cache_lock__:
+        signature = _yara_signature(_yara_file_list(yara_rule_path))
+
+    return hashlib.sha256("".join([sha256 for _, _, sha256 in signature]).encode("utf-8")).hexdigest().upper()
+
+#########################################################################################################
+# 컴파일된 Yara 룰 번들
+# - 번들 폴더 : config.yara_bundle_path
+#       * <이름>.yarc : rules.save() 로 저장한 컴파일된 룰
+#       * <이름>.json : 번들 정보 (번들 버전, Yara 버전, 룰 경로, 룰 파일별 SHA256)
+# - 번들 버전 또는 Yara 버전이 다르거나 룰 파일이 변경된 경우 번들을 사용하지 않는다. 
+#########################################################################################################
+YARA_BUNDLE_VERSION = 1
+
+def _yara_bundle_sets():
+    """[summary]
+        번들로 생성할 Yara 룰셋 목록을 반환한다. 
+
+    Returns:
+        {list} -- [description] [(번들 이름, Yara 룰 경로), ...]
+    """
+    rule_sets = [("format", config.format_rules), ("exploit", config.exploit_rules)]
+    return [(name, rule_path) for name, rule_path in rule_sets if rule_path]
+
+@gateway
+def yara_build_bundle(bundle_path=config.yara_bundle_path):
+    """[summary]
+        config.format_rules, config.exploit_rules 를 컴파일해 번들 폴더에 저장한다. 
+
+    Keyword Arguments:
+        bundle_path {str} -- [description] 번들 폴더 (default: {config.yara_bundle_path})
+
+    Returns:
+        {list} -- [description] 생성된 번들 파일 목록
+    """
+    try:
+        if not makedirectory(bundle_path):
+            raise YaraError("Failed MakeDirectory ({})".format(bundle_path))
+
+        bundles = []
+        for name, rule_path in _yara_bundle_sets():
+            yaraList = _yara_file_list(yara_rule_path=rule_path)
+            signature = _yara_signature(yaraList)
+
+            # 컴파일한 후 저장한다. 
+            # 임시 파일에 저장한 후 교체해 로드 중인 다른 프로세스가 불완전한 파일을 읽지 않도록 한다. 
+            rules = yara.compile(filepaths=_yara_group(yaraList))
+            rules_name = os.path.join(bundle_path, "{}.yarc".format(name))
+            rules.save(rules_name + ".tmp")
+            os.replace(rules_name + ".tmp", rules_name)
+
+            # 번들 정보를 저장한다. 
+            manifest = {
+                "version"       :   YARA_BUNDLE_VERSION,
+                "yara_version"  :   getattr(yara, "YARA_VERSION", ""),
+                "rule_path"     :   rule_path,
+                "files"         :   [[yara_file, sha256] for yara_file, _, sha256 in signature]
+            }
+            manifest_name = os.path.join(bundle_path, "{}.json".format(name))
+            if not writefile(manifest_name, json.dumps(manifest, indent=4).encode("utf-8")):
+                raise YaraError("Failed write bundle manifest. ({})".format(manifest_name))
+
+            Log.info("built yara bundle. ({} -> {})".format(rule_path, rules_name))
+            bundles.append(rules_name)
+
+        return bundles
+
+    except YaraError as e:
+        Log.error(e.msg)
+        return []
+
+    except:
+        _, msg, obj = sys.exc_info()
+        msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+        Log.error(msg)
+        return []
+
+    finally:
+        pass
+
+@gateway
+def yara_load_bundle(bundle_path=config.yara_bundle_path):
+    """[summary]
+        번들 폴더의 컴파일된 룰을 로드해 Yara 룰 컴파일 캐시에 저장한다. 
+        
+        워커 프로세스 시작시 호출하며 유효하지 않은 번들은 건너뛴다. (yara_compile() 에서 컴파일됨)
+
+    Keyword Arguments:
+        bundle_path {str} -- [description] 번들 폴더 (default: {config.yara_bundle_path})
+
+    Returns:
+        {int} -- [description] 로드된 번들 개수
+    """
+    loaded = 0
+    for name, rule_path in _yara_bundle_sets():
+        try:
+            rules_name = os.path.join(bundle_path, "{}.yarc".format(name))
+            manifest_name = os.path.join(bundle_path, "{}.json".format(name))
+            if not (is_file(rules_name) and is_file(manifest_name)):
+                raise YaraError("yara bundle is not exists. ({})".format(rules_name))
+
+            with open(manifest_name, "rb") as fp:
+                manifest = json.loads(fp.read().decode("utf-8"))
+
+            # 번들 버전을 확인한다. 
+            if manifest.get("version") != YARA_BUNDLE_VERSION or \
+               manifest.get("yara_version") != getattr(yara, "YARA_VERSION", ""):
+                raise YaraError("yara bundle version is mismatched. ({})".format(rules_name))
+
+            # 룰 파일 변경 여부를 확인한다. 
+            with __yara_cache_lock__:
+                signature = _yara_signature(_yara_file_list(rule_path))
+                if manifest.get("rule_path") != rule_path or \
+                   manifest.get("files") != [[yara_file, sha256] for yara_file, _, sha256 in signature]:
+                    raise YaraError("yara bundle is outdated. ({})".format(rules_name))
+
+                # 번들을 메모리로 읽어 로드한다. 
+                with open(rules_name, "rb") as fp:
+                    rules = yara.load(file=io.BytesIO(fp.read()))
+
+                __yara_cache__[rule_path] = (signature, rules)
+
+            loaded += 1
+
+        except YaraError as e:
+            Log.warn(e.msg)
+
+        except:
+            _, msg, obj = sys.exc_info()
+            msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+            Log.error(msg)
+
+        finally:
+            pass
+
+    return loaded
+
+@gateway
+def yara_on_demand(yara_rule_path, fileName="", data=None):
     """[summary]
         Yara 룰을 통해 파일을 식별한다. 
 
+        data 가 있는 경우 파일을 다시 읽지 않고 메모리의 데이터를 검사한다. 
+
     Arguments:
         yara_rule_path {str} -- [description] Yara 파일 경로 (폴더, 파일)
         fileName {str} -- [description] Yara 룰 검사 대상 
+        data {bytes} -- [description] Yara 룰 검사 대상 데이터 (default: {None})
     """
     try:
         # Yara-Python 이 가능한 버전인지 확인한다. 
@@ -370,18 +714,14 @@ def yara_on_demand(yara_rule_path, fileName):
             raise YaraError("Python {}.{} is not support.".format(PY_MAJOR_VER, PY_MINOR_VER))
 
         # Yara-Python을 지원하는 경우 
-        # 컴파일을 위한 형식(dict)으로 변환한다. 
-        if is_file(yara_rule_path):
-            yaraList = [yara_rule_path]
-        else:
-            yaraList = get_file_path_in_folder(yara_rule_path)
-        groups = _yara_group(yaraList)
-
-        # 컴파일한다. 
-        rules = yara.compile(filepaths=groups)
+        # 컴파일된 룰을 가져온다. (캐시)
+        rules = yara_compile(yara_rule_path)
 
         # 검사한다. 
-        return rules.match(filepath=fileName)
+        if data is not None:
+            return rules.match(data=data)
+        else:
+            return rules.match(filepath=fileName)
 
     except YaraError as e:
         Log.error(e.msg)
@@ -742,42 +1082,173 @@ def get_file_path(rootPath="", fileName=""):
     finally:
         pass
 
-@gateway
-def get_file_path_in_folder(dirName):
+def _scan_folder(dirName):
     """[summary]
-        폴더 내 파일목록을 가져온다. 
+        폴더 1개의 하위 폴더/파일 목록을 가져온다. 
+
+        * os.scandir() 의 DirEntry 정보로 파일/폴더를 구분한다. (파일별 추가 stat 없음)
+        * "." 으로 시작하는 파일/폴더는 제외한다. 
 
     Arguments:
-        dirName {[type]} -- [description] 폴더 경로 
+        dirName {str} -- [description] 폴더 경로
 
     Returns:
-        {list} -- [description] 폴더내 파일 목록 
+        {list} -- [description] 하위 폴더 목록
+        {list} -- [description] 파일 목록
     """
+    dirs = []
+    files = []
     try:
-        fileList = []
+        with os.scandir(dirName) as entries:
+            for entry in entries:
+                if entry.name[0] == ".":
+                    continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+
+    except OSError as e:
+        # 접근할 수 없는 하위 폴더는 제외한다. 
+        Log.error("Failed scandir(): {} ({})".format(dirName, e))
+
+    return dirs, files
+
+class FolderCrawler:
+    """[summary]
+        여러 스레드로 폴더를 탐색하고 찾은 파일 경로를 Queue 로 전달한다. 
+
+        * 탐색할 폴더 Queue 를 스레드가 나눠서 처리한다. (NAS 등 scandir() 지연이 큰 경우)
+        * 탐색 결과 Queue 는 크기가 제한되어 있어 소비 속도보다 앞서 탐색하지 않는다. 
+    """
+    def __init__(self, dirName, threads=config.crawler_threads, queue_size=config.crawler_queue_size):
+        self.dirs = queue.Queue()
+        self.files = queue.Queue(queue_size)
+        self.pending = 1                            # 탐색 중이거나 탐색 대기 중인 폴더 수
+        self.lock = threading.Lock()
+        self.stop = threading.Event()
+
+        self.dirs.put(dirName)
+        self.threads = []
+        for i in range(threads):
+            thread = threading.Thread(target=self.__crawl__, name="crawler{}".format(i))
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def __put__(self, item):
+        # 소비가 중단된 경우 대기하지 않는다. 
+        while not self.stop.is_set():
+            try:
+                self.files.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __crawl__(self):
+        while not self.stop.is_set():
+            dirName = self.dirs.get()
+            if dirName is None:
+                break
+
+            try:
+                dirs, files = _scan_folder(dirName)
+                with self.lock:
+                    self.pending += len(dirs)
+                for subDir in dirs:
+                    self.dirs.put(subDir)
+
+                for fileName in files:
+                    self.__put__(fileName)
+
+            except:
+                _, msg, obj = sys.exc_info()
+                msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
+                Log.error(msg)
+
+            finally:
+                # 예외가 발생해도 탐색 완료 처리한다. (iter_file_path_in_folder() 대기 방지)
+                with self.lock:
+                    self.pending -= 1
+                    done = self.pending == 0
+
+                # 마지막 폴더인 경우 스레드 종료 요청과 탐색 완료 (None) 를 전달한다. 
+                if done:
+                    for thread in self.threads:
+                        self.dirs.put(None)
+                    self.__put__(None)
+
+    def close(self):
+        self.stop.set()
+        for thread in self.threads:
+            self.dirs.put(None)
+
+    def __iter__(self):
+        try:
+            while True:
+                fileName = self.files.get()
+                if fileName is None:
+                    break
+                yield fileName
+
+        finally:
+            self.close()
+
+@gateway
+def iter_file_path_in_folder(dirName, threads=config.crawler_threads):
+    """[summary]
+        폴더 내 파일 경로를 찾는 대로 반환한다. (Generator)
 
-        # 폴더내 전체 목록을 가져온다. 
-        for root, dirs, files in os.walk(dirName):
-            # 파일 목록 중 ".", ".." 를 제외한다. 
-            files = [f for f in files if not f[0] == "."]
+        * threads 가 2 이상인 경우 FolderCrawler 로 병렬 탐색한다. (반환 순서는 일정하지 않음)
 
-            # 파일 목록을 생성한다. 
+    Arguments:
+        dirName {str} -- [description] 폴더 경로 
+
+    Keyword Arguments:
+        threads {int} -- [description] 탐색 스레드 수 (default: {config.crawler_threads})
+
+    Returns:
+        {generator} -- [description] 폴더 내 파일 경로
+    """
+    try:
+        if threads > 1:
+            for fileName in FolderCrawler(dirName, threads=threads):
+                yield fileName
+            return
+
+        dirs = [dirName]
+        while dirs:
+            subDirs, files = _scan_folder(dirs.pop())
+            dirs.extend(subDirs)
             for fileName in files:
-                abs_file_path = get_file_path(rootPath=root, fileName=fileName)
-                if abs_file_path:
-                    fileList.append(abs_file_path)
-            
-        return fileList
+                yield fileName
+
+    except GeneratorExit:
+        # 반환 중 소비가 중단된 경우 
+        raise
 
     except:
         _, msg, obj = sys.exc_info()
         msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
         Log.error(msg)
-        return []
 
     finally:
         pass
 
+@gateway
+def get_file_path_in_folder(dirName):
+    """[summary]
+        폴더 내 파일목록을 가져온다. 
+
+    Arguments:
+        dirName {[type]} -- [description] 폴더 경로 
+
+    Returns:
+        {list} -- [description] 폴더내 파일 목록 
+    """
+    return list(iter_file_path_in_folder(dirName, threads=1))
+
 @gateway
 def get_dir_list(dirName):
     try:
@@ -797,47 +1268,59 @@ def get_dir_list(dirName):
         pass
 
 @gateway
-def  get_file_list(fileName="", dirName=""):
+def iter_file_list(fileName="", dirName=""):
     """[summary]
-        절대 경로를 갖는 목록을 생성한다. 
+        절대 경로를 갖는 파일 목록을 찾는 대로 반환한다. (Generator)
 
     Arguments:
         fileName {[str]} -- [description] (optional) 파일명
         dirName {[str]} -- [description] (optional) 폴더명
 
     Returns:
-        {list} -- [description] 파일목록
+        {generator} -- [description] 파일 경로
     """
     try:
-        fileList = []
-
-        # args.file 파일 목록을 추가한다. 
+        # args.file 파일을 반환한다. 
         if fileName:
             abs_file_path = get_file_path(fileName=fileName)
             if abs_file_path:
-                fileList.append(abs_file_path)
+                yield abs_file_path
             else:
                 raise UtilityError("Not Collect File: {}".format(fileName))
 
-        # args.folder 파일 목록을 추가한다. 
+        # args.folder 파일 목록을 반환한다. 
         if dirName:
-            abs_file_list = get_file_path_in_folder(dirName)
-            if abs_file_list:
-                fileList.extend(abs_file_list)
-            else:
+            if not is_dir(dirName):
                 raise UtilityError("Not Collect Directory: {}".format(dirName))
-            
-        return fileList
+
+            for abs_file_path in iter_file_path_in_folder(os.path.abspath(dirName)):
+                yield abs_file_path
 
     except UtilityError as e:
         Log.error(e.msg)
-        return []
+
+    except GeneratorExit:
+        # 반환 중 소비가 중단된 경우 
+        raise
 
     except:
         _, msg, obj = sys.exc_info()
         msg = "{} ({}::{})".format(msg, obj.tb_lineno, obj.tb_frame.f_globals.get("__file__"))
         Log.error(msg)
-        return []
 
     finally:
-        pass
\ No newline at end of file
+        pass
+
+@gateway
+def  get_file_list(fileName="", dirName=""):
+    """[summary]
+        절대 경로를 갖는 목록을 생성한다. 
+
+    Arguments:
+        fileName {[str]} -- [description] (optional) 파일명
+        dirName {[str]} -- [description] (optional) 폴더명
+
+    Returns:
+        {list} -- [description] 파일목록
+    """
+    return list(iter_file_list(fileName, dirName))
\ No newline at end of file
@@ -10,18 +10,45 @@
 # 2018.08.07    버전 0.0.6      [개발] 설정 정보 추가 및 변경 
 # 2018.09.12    버전 0.0.7      [개발] malwares.com 설정 항목
 # 2018.09.12    버전 0.0.8      [추가] ELF 포멧 설정 정보
+# 2026.10.18    버전 0.0.9      [추가] Yara 룰 번들 설정 정보
+# 2026.10.18    버전 0.0.10     [추가] 분석 엔진 상주 프로세스 설정 정보
+# 2026.10.18    버전 0.0.11     [추가] 해시 설정 정보
+# 2026.10.18    버전 0.0.12     [추가] 분석 결과 캐시 설정 정보
+# 2026.10.18    버전 0.0.13     [추가] 분석 큐 모니터링 상태 저널 모드
+# 2026.10.18    버전 0.0.14     [추가] 폴더 탐색 설정 정보
+# 2026.10.18    버전 0.0.15     [추가] Job 단위 작업 폴더 설정 정보
+# 2026.10.18    버전 0.0.16     [추가] 임베딩 파일 메모리 전달 설정 정보
+# 2026.10.18    버전 0.0.17     [추가] 임베딩 파일 병렬 Dispatch 설정 정보
+# 2026.10.18    버전 0.0.18     [추가] 함수 입출력 로그 (gateway) 설정 정보
+# 2026.10.18    버전 0.0.19     [추가] 함수별 처리 시간 지표 설정 정보
+# 2026.10.18    버전 0.0.20     [추가] 로그 큐 설정 정보
+# 2026.10.18    버전 0.0.21     [추가] 분석 결과 직렬화 설정 정보
+# 2026.10.18    버전 0.0.22     [추가] 분석 결과 출력 (NDJSON) 설정 정보
+# 2026.10.18    버전 0.0.23     [추가] 임베딩 파일 분석 결과 점진 출력 설정 정보
+# 2026.10.18    버전 0.0.24     [추가] 분석 결과 저장소 (SQLite) 설정 정보
+# 2026.10.18    버전 0.0.25     [수정] 상태 저널 폴더 : dir_q_monitor -> dir_q_journal
 
-__version__ = "0.0.8"
+__version__ = "0.0.25"
 __author__ = "amanaksu@gmail.com"
 
 
 #########################################################################################################
 # 로그 설정정보
 # - log_cmd 는 로그 정보 화면 출력여부를 결정하는 Bool형 Flag (True : 화면 출력, False : 파일 출력)
+# - log_trace 는 함수 입출력 로그 (gateway 데코레이터) 기록 여부를 결정하는 Bool형 Flag
+#       * 모듈 로드 (데코레이터 적용) 시점에 결정된다. False 인 경우 함수를 그대로 호출한다. (추가 비용 없음)
+#       * log_level 이 debug 인 경우에만 기록된다. 
+# - log_trace_sample 은 함수 입출력 로그 샘플링 주기 (N : 함수별 N회 호출당 1회 기록, 1 : 전체 기록)
+# - log_queue 는 전체 프로세스의 로그를 로그 큐로 모아 단일 스레드 (kei.py 프로세스) 에서 기록할지 여부
+# - log_batch_size 는 로그 기록 스레드가 한번에 기록하는 최대 로그 수
 #########################################################################################################
 log_level       = "debug"
 log_path        = r"C:\Users\amanaksu\Desktop\Kei\Log"
 log_cmd         = True
+log_trace       = False
+log_trace_sample = 1
+log_queue       = True
+log_batch_size  = 256
 
 
 #########################################################################################################
@@ -29,10 +56,29 @@ log_cmd         = True
 # - proc_num 는 멀티프로세스 생성 개수
 # - queue_size 는 proc_num 의 2배로 설정
 # - queue_wait 는 queue가 Empty 상태일 때 다시 queue 상태를 확인할 때까지의 대기 시간 (second 단위)
+# - engine_pool_size 는 프로세스별 분석 엔진(ole, elf, ...) 상주 프로세스 개수
+# - engine_max_tasks 는 분석 엔진 상주 프로세스가 재생성되기 전까지 처리할 최대 작업 수 (0 : 무제한)
+# - engine_wait 는 분석 결과 대기 중 분석 엔진 프로세스의 종료 여부를 확인하는 주기 (second 단위)
+# - result_compress_size 는 분석 엔진 프로세스 -> Dispatch 전달시 분석 결과를 압축할 최소 크기 (Byte 단위, 0 : 압축 안함)
+# - dispatch_threads 는 프로세스별 동일 우선순위 임베딩 파일 병렬 Dispatch 스레드 개수 (1 : 순차 처리)
+#       * 분석 엔진 상주 프로세스는 engine_pool_size 개를 먼저 생성하고 dispatch_threads 개까지 필요할 때 추가 생성한다. 
 #########################################################################################################
 proc_num        = 5
 queue_size      = proc_num * 2
 queue_wait      = 1
+engine_pool_size = 1
+engine_max_tasks = 1000
+engine_wait     = 1
+result_compress_size = 1024 * 1024
+dispatch_threads = 4
+
+#########################################################################################################
+# 폴더 탐색 설정정보 (--folder)
+# - crawler_threads 는 폴더 탐색 스레드 수 (1 : 단일 스레드 순차 탐색)
+# - crawler_queue_size 는 탐색 후 분석 Queue 로 전달되기 전까지 보관하는 최대 파일 경로 수
+#########################################################################################################
+crawler_threads = 8
+crawler_queue_size = 10000
 
 #########################################################################################################
 # 분석 우선순위 레벨 정의 
@@ -66,6 +112,72 @@ filter_size_min = 0
 filter_size_max = 0
 filter_format   = []
  
+#########################################################################################################
+# 해시 설정 정보
+# - hash_algorithms 는 파일별로 계산할 해시 목록 (md5, sha1, sha256, ssdeep, tlsh), sha256 은 항상 계산됨
+#   * ssdeep, tlsh 는 각각 ssdeep, py-tlsh 모듈이 설치되어 있어야 함
+# - hash_chunk_size 는 해시 계산시 한번에 읽는 크기 (Byte 단위)
+#########################################################################################################
+hash_algorithms = ["sha256"]
+hash_chunk_size = 1024 * 1024
+
+#########################################################################################################
+# 분석 결과 캐시 설정 정보
+# - result_cache 는 파일 SHA256 기반 분석 결과 캐시 사용 여부 (임베딩 파일이 없는 분석 결과만 저장됨)
+# - result_cache_path 는 캐시 파일 (SQLite) 경로, temp_path 정리 대상에서 제외되도록 별도 폴더에 둔다.
+# - result_cache_ttl 은 저장 후 캐시 유효 시간 (second 단위, 0 : 무제한)
+# - result_cache_max_entries 는 최대 저장 항목 수, 초과시 오래 사용되지 않은 항목부터 삭제 (0 : 무제한)
+# - result_cache_evict_interval 은 만료/초과 항목 정리 주기 (저장 횟수 단위)
+#########################################################################################################
+result_cache    = True
+result_cache_path = r"C:\Users\amanaksu\Desktop\Kei\Cache\results.db"
+result_cache_ttl = 7 * 24 * 60 * 60
+result_cache_max_entries = 100000
+result_cache_evict_interval = 100
+
+#########################################################################################################
+# 분석 결과 출력 설정 정보
+# - result_sink 는 Job 단위 분석 결과 (ScanResult) 를 NDJSON 파일로 저장할지 여부
+# - result_sink_path 는 분석 결과 파일 (<시간>_<seq>.ndjson) 저장 폴더
+# - result_sink_rotate_size 는 다음 파일로 넘어갈 파일 크기 (압축 전, Byte 단위, 0 : 무제한)
+# - result_sink_gzip 은 분석 결과 파일 gzip 압축 여부 (.ndjson.gz)
+# - result_sink_batch_size 는 결과 저장 프로세스가 한번에 기록하는 최대 Job 수
+# - result_sink_flush_interval 은 결과 저장 프로세스의 최대 기록 대기 시간 (second 단위)
+# - result_sink_stop_timeout 은 결과 저장 프로세스 종료 대기 시간, 초과시 강제 종료 (second 단위, 0 : 무제한)
+# - result_sink_incremental 은 임베딩 파일 분석 결과를 Recursive 처리 완료시 먼저 출력하고 요약 정보만 유지할지 여부
+#########################################################################################################
+result_sink     = True
+result_sink_path = r"C:\Users\amanaksu\Desktop\Kei\Result"
+result_sink_rotate_size = 100 * 1024 * 1024
+result_sink_gzip = False
+result_sink_batch_size = 100
+result_sink_flush_interval = 1
+result_sink_stop_timeout = 60
+result_sink_incremental = True
+
+#########################################################################################################
+# 분석 결과 저장소 설정 정보
+# - result_store 는 결과 저장 프로세스가 기록한 분석 결과를 SQLite 에도 저장할지 여부 (result_sink 사용시)
+# - result_store_path 는 저장소 파일 (SQLite) 경로, kei.py query 로 조회한다.
+# - result_store_field_size 는 구조 정보 값의 최대 저장 길이 (문자 단위, 0 : 무제한)
+#########################################################################################################
+result_store    = True
+result_store_path = r"C:\Users\amanaksu\Desktop\Kei\Result\results.db"
+result_store_field_size = 256
+
+#########################################################################################################
+# 처리 시간 지표 설정 정보
+# - metrics 는 gateway 데코레이터 적용 함수별 호출 수/처리 시간 (평균, p50, p95, p99) 집계 여부
+#       * log_trace 와 같이 모듈 로드 시점에 결정된다. 
+# - metrics_folder 는 프로세스별 지표를 기록할 임시 폴더 내 폴더명 (<temp_path>\\<metrics_folder>\\<pid>.json)
+# - metrics_path 는 전체 Job 완료 후 병합된 지표를 저장할 폴더
+# - metrics_format 은 저장 형식 ("json", "prometheus")
+#########################################################################################################
+metrics         = False
+metrics_folder  = "metrics"
+metrics_path    = r"C:\Users\amanaksu\Desktop\Kei\Metrics"
+metrics_format  = "json"
+
 #########################################################################################################
 # Yara 설정 정보
 # - support_min_ver 는 Yara 모듈이 지원하는 최소 버전
@@ -92,8 +204,14 @@ engine_class    ="KeiEngine"
 #       * <임시폴더>\\error     : 에러     --> dispatch() 내 get_result() 확인 시점.
 #       * <임시폴더>\\embedding : 임베딩   --> 
 # - queue_monitor 는 큐잉용 폴더를 사용할지 여부를 결정한다. 
+# - queue_monitor_mode 는 상태 변경 방식
+#       * "journal" : 파일을 복사/이동하지 않고 <임시폴더>\\<dir_q_journal> 에 상태 변경 이력만 기록 ("kei.py status" 로 확인)
+#                     상태별 폴더 (waiting, analyzing, except, complete, error) 는 생성하지 않는다.
+#       * "folder"  : 상태별 폴더로 파일을 복사/이동
+# - dir_q_journal 은 상태 저널을 저장할 폴더명, 큐 모니터용 폴더 정리 (clear_q_monitor) 대상이 아니다.
 #########################################################################################################
 queue_monitor   = True
+queue_monitor_mode = "journal"
 dir_q_monitor   = {
 #   내부에서 사용하는 키     파일을 저장할 폴더명    
     "waiting"           :   "waiting",
@@ -103,21 +221,29 @@ dir_q_monitor   = {
     "error"             :   "error",
     "embedding"         :   "embedding"
 }
+dir_q_journal   = "journal"
 
 #########################################################################################################
 # 임베딩 파일 설정 정보
+# - embedded_in_memory 는 추출한 임베딩 파일을 파일로 저장하지 않고 메모리 데이터로 전달할지 여부
+# - embedded_spill_size 는 메모리 데이터로 전달할 최대 크기, 초과하는 경우 Job 단위 작업 폴더에 저장 (Byte 단위)
 #########################################################################################################
 extend_seperate = "_"
 extend          = "dmp"
+embedded_in_memory = True
+embedded_spill_size = 4 * 1024 * 1024
 
 #########################################################################################################
 # 저장 설정 정보
 # - temp_path 는 임시 파일, 임베딩 파일 등을 생성/저장하는 폴더 
-# - clear_temp 는 임시 폴더 내 dir_q_monitor 폴더를 제외한 파일 삭제 여부. 
-# - clear_q_monitor 는 임시 폴더 내 큐 모니터용 폴더 삭제 여부 
+# - clear_temp 는 Job 완료 후 Job 단위 작업 폴더 삭제 여부. 
+# - clear_q_monitor 는 전체 Job 완료 후 임시 폴더 내 큐 모니터용 폴더 삭제 여부 
+# - work_folder 는 임시 폴더 내 Job 단위 작업 폴더 (<temp_path>\\<work_folder>\\<pid>_<uuid>) 를 생성할 폴더
+#   * 임베딩 파일 등 Job 처리 중 생성되는 파일을 저장하며 clear_temp 인 경우 Job 완료 후 해당 Job 의 작업 폴더만 삭제한다. 
 #########################################################################################################
 temp_path       = r"C:\Users\amanaksu\Desktop\Kei\Temp"
 clear_temp      = True
+work_folder     = "work"
 clear_q_monitor = False
 
 #########################################################################################################
@@ -136,6 +262,14 @@ mws_save_folder = "malwares"
 format_rules    = r"C:\Users\amanaksu\Desktop\Kei\Yara\files.yara"
 exploit_rules   = r""
 
+#########################################################################################################
+# Yara 룰 번들 설정 정보
+# - yara_bundle 는 워커 프로세스 시작시 컴파일된 룰 번들 로드 여부
+# - yara_bundle_path 는 컴파일된 룰 번들 폴더 ("kei.py build_rules" 로 생성)
+#########################################################################################################
+yara_bundle     = True
+yara_bundle_path = r"C:\Users\amanaksu\Desktop\Kei\Yara\bundle"
+
 #########################################################################################################
 # OLE 계열 파일 설정 정보
 # - ole_reference 는 하위 Stream 분석 과정에서 참조하는 Stream을 선정의
@@ -7,8 +7,13 @@
 #
 # 개발 Log
 # 2018.08.06    버전 0.0.5      [개발] 프로토타입 변경
+# 2026.10.18    버전 0.0.6      [추가] build_rules 명령 (컴파일된 Yara 룰 번들 생성)
+# 2026.10.18    버전 0.0.7      [추가] status 명령 (분석 큐 상태 저널 출력)
+# 2026.10.18    버전 0.0.8      [추가] 종료시 로그 기록 스레드 종료 (Log.close())
+# 2026.10.18    버전 0.0.9      [추가] query 명령 (분석 결과 저장소 조회)
+# 2026.10.18    버전 0.0.10     [수정] status 명령 : 상태 선택 항목을 분석 상태 (monitoring.QUEUE_STATES) 로 제한
 #
-__version__ = "0.0.5"
+__version__ = "0.0.10"
 __author__ = "amanaksu@gmail.com"
 
 # 내장 라이브러리 
@@ -21,6 +26,9 @@ import sys
 # 고유 라이브러리 
 from Engines import Log
 from Engines import jobs
+from Engines import monitoring
+from Engines import store
+from Engines import utils
 
 import config
 
@@ -54,6 +62,24 @@ def parse_argument():
         mws.add_argument("--mws_end_time", dest="mws_end_time", required=False, type=str, help="Ex) 2018-04-01 23:59:59")
         mws.add_argument("--mws_limit", dest="mws_limit", required=False, type=int, default=2000)
 
+        # 명령 Parameter
+        # - build_rules : config.format_rules, config.exploit_rules 를 컴파일해 번들로 저장한다. 
+        # - status : 분석 큐 상태 저널을 재생해 상태별 분석 대상을 출력한다. 
+        # - query : 분석 결과 저장소 (config.result_store_path) 를 조회한다. 
+        commands = parser.add_subparsers(dest="command")
+        build_rules = commands.add_parser("build_rules")
+        build_rules.add_argument("--output", dest="output", required=False, type=str, default=config.yara_bundle_path)
+        status = commands.add_parser("status")
+        status.add_argument("--state", dest="state", required=False, type=str, default="", choices=[""] + monitoring.QUEUE_STATES)
+        query = commands.add_parser("query")
+        query.add_argument("--db", dest="db", required=False, type=str, default=config.result_store_path)
+        query.add_argument("--sha256", dest="sha256", required=False, type=str, default="")
+        query.add_argument("--format", dest="fformat", required=False, type=str, default="", help="Ex) OLE")
+        query.add_argument("--parent", dest="parentID", required=False, type=str, default="")
+        query.add_argument("--stream", dest="stream", required=False, type=str, default="", help="Ex) BodyText/Section0")
+        query.add_argument("--field", dest="field", required=False, type=str, default="", help="Ex) is_password!=0")
+        query.add_argument("--limit", dest="limit", required=False, type=int, default=100)
+
         return parser, parser.parse_args()
 
     except:
@@ -62,6 +88,51 @@ def parse_argument():
     finally:
         pass
 
+def print_queue_status(state=""):
+    """[summary]
+        분석 큐 상태를 출력한다. (config.queue_monitor_mode = "journal")
+
+    Keyword Arguments:
+        state {str} -- [description] 출력할 상태 (default: {""}, 전체)
+    """
+    status = monitoring.get_queue_status(state)
+
+    counts = {}
+    for record in status.values():
+        counts[record["state"]] = counts.get(record["state"], 0) + 1
+
+    for name in monitoring.QUEUE_STATES:
+        if name in counts:
+            print("{:<10} {}".format(name, counts[name]))
+
+    # 처리 중인 분석 대상은 경로를 함께 출력한다. 
+    for uid, record in sorted(status.items(), key=lambda item: item[1]["time"]):
+        if state or record["state"] in ["waiting", "analyzing"]:
+            print("{} {:<10} {}".format(uid, record["state"], record["path"]))
+
+def print_query_result(args):
+    """[summary]
+        분석 결과 저장소 조회 결과를 출력한다. (1행 1건, Tab 구분)
+
+    Arguments:
+        args {instance} -- [description] argparse.NameSpace 클래스 (query 명령)
+    """
+    if not os.path.exists(args.db):
+        Log.error("result store is not exists. ({})".format(args.db))
+        return
+
+    rows = store.query(store_path=args.db,
+                       sha256=args.sha256,
+                       fformat=args.fformat,
+                       parentID=args.parentID,
+                       stream=args.stream,
+                       field=args.field,
+                       limit=args.limit)
+
+    print("\t".join(store.__columns__))
+    for row in rows:
+        print("\t".join(str(row[name]) for name in store.__columns__))
+
 if __name__ == "__main__":
     try:
         # 외부 설정 정보 가져오기
@@ -77,8 +148,19 @@ if __name__ == "__main__":
         # 시작 로그 
         Log.info("[*] start")
 
-        # 메인함수 시작 
-        jobs.start(args)
+        if args.command == "build_rules":
+            # Yara 룰 번들 생성 
+            if not utils.yara_build_bundle(args.output):
+                Log.error("Failed build yara bundle.")
+        elif args.command == "status":
+            # 분석 큐 상태 출력 
+            print_queue_status(args.state)
+        elif args.command == "query":
+            # 분석 결과 저장소 조회 
+            print_query_result(args)
+        else:
+            # 메인함수 시작 
+            jobs.start(args)
 
         # 종료 로그
         Log.info("[*] done")
@@ -93,7 +175,8 @@ if __name__ == "__main__":
         Log.error(msg)
 
     finally:
-        pass
+        # 남은 로그를 기록한다. 
+        Log.close()
 
 
 #########################################################################################################